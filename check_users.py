@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 """Quick script to check what users are in the database."""
 
-from splitfool.db.connection import get_connection
+from splitfool.db.connection import connection_pool
 from splitfool.services.user_service import UserService
 
 # Connect to database
-conn = get_connection("splitfool.db")
+conn = connection_pool.get("splitfool.db")
 service = UserService(conn)
 
 # Get all users
@@ -23,5 +23,3 @@ if users:
         print("-" * 60)
 else:
     print("No users found!")
-
-conn.close()
@@ -4,7 +4,7 @@ from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import DataTable, Header, Footer, Static
 
-from splitfool.db.connection import get_connection
+from splitfool.db.connection import connection_pool
 from splitfool.services.user_service import UserService
 
 
@@ -32,19 +32,19 @@ class DebugApp(App):
         
         # Load users from database
         self.notify("Loading users from database...")
-        conn = get_connection("splitfool.db")
+        conn = connection_pool.get("splitfool.db")
         service = UserService(conn)
         users = service.get_all_users()
         self.notify(f"Found {len(users)} users in database")
         
-        # Add rows
-        for user in users:
-            created_str = user.created_at.strftime("%Y-%m-%d %H:%M")
-            self.notify(f"Adding row: {user.id} | {user.name} | {created_str}")
-            table.add_row(str(user.id), user.name, created_str, key=str(user.id))
+        # Add rows in one batch
+        rows = [
+            (str(u.id), u.name, u.created_at.isoformat(sep=" ", timespec="minutes"))
+            for u in users
+        ]
+        table.add_rows(rows)
         
         self.notify(f"Total rows in table: {table.row_count}")
-        conn.close()
 
 
 if __name__ == "__main__":
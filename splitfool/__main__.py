@@ -6,9 +6,60 @@ import sys
 from pathlib import Path
 
 from splitfool.config import Config
-from splitfool.db.connection import initialize_database
-from splitfool.ui.app import SplitfoolApp
-from splitfool.utils.db_recovery import check_database_integrity, recover_database
+from splitfool.db.connection import connection_pool, get_connection, initialize_database
+
+# The Textual UI and recovery helpers are imported only on the paths that use
+# them, so --check-db / --recover-db don't pay for loading the TUI stack
+
+
+def _open_checked(db_path: str) -> tuple[sqlite3.Connection | None, str | None]:
+    """Open the pooled connection for a database and check its integrity.
+
+    Args:
+        db_path: Path to database file
+
+    Returns:
+        Tuple of (connection, error_message); the connection is None when the
+        database could not be opened or failed the check
+    """
+    from splitfool.utils.db_recovery import check_database_integrity
+
+    try:
+        conn = connection_pool.get(db_path)
+    except sqlite3.DatabaseError as e:
+        # A file that isn't a database fails as soon as PRAGMAs are applied
+        return None, f"Database error: {e}"
+
+    is_valid, error = check_database_integrity(conn)
+    if not is_valid:
+        connection_pool.close(db_path)
+        return None, error
+    return conn, None
+
+
+def _check_read_only(db_path: str) -> str | None:
+    """Check a database's integrity through a private read-only connection.
+
+    Unlike the pooled connection, this applies no journal pragmas and never
+    creates a missing file, so checking leaves the database untouched.
+
+    Args:
+        db_path: Path to database file
+
+    Returns:
+        Error message, or None if the database is valid
+    """
+    from splitfool.utils.db_recovery import check_database_integrity
+
+    try:
+        conn = get_connection(db_path, read_only=True)
+    except sqlite3.DatabaseError as e:
+        return f"Database error: {e}"
+    try:
+        _, error = check_database_integrity(conn)
+    finally:
+        conn.close()
+    return error
 
 
 def main() -> int:
@@ -42,8 +93,8 @@ def main() -> int:
 
     # Handle database check/recovery commands
     if args.check_db:
-        is_valid, error = check_database_integrity(str(db_path))
-        if is_valid:
+        error = _check_read_only(str(db_path))
+        if error is None:
             print(f"✓ Database is valid: {db_path}")
             return 0
         else:
@@ -52,22 +103,26 @@ def main() -> int:
             return 1
 
     if args.recover_db:
+        from splitfool.utils.db_recovery import recover_database
+
         success, message = recover_database(str(db_path))
         print(message)
         return 0 if success else 1
 
-    # Check if database exists and initialize if needed
+    # Open the database once; the same handle is initialized, checked and
+    # handed to the app
     if not Path(db_path).exists():
         try:
-            initialize_database(str(db_path))
+            conn = connection_pool.get(str(db_path))
+            initialize_database(str(db_path), conn=conn)
         except Exception as e:
             print(f"Error: Failed to initialize database: {e}", file=sys.stderr)
             print(f"  Database path: {db_path}", file=sys.stderr)
             return 1
     else:
         # Check database integrity on startup
-        is_valid, error = check_database_integrity(str(db_path))
-        if not is_valid:
+        checked, error = _open_checked(str(db_path))
+        if checked is None:
             print(f"Error: Database appears to be corrupted: {error}", file=sys.stderr)
             print(f"  Database path: {db_path}", file=sys.stderr)
             print("\nTo recover:", file=sys.stderr)
@@ -75,10 +130,13 @@ def main() -> int:
             print("  2. Run recovery: splitfool --recover-db", file=sys.stderr)
             print(f"  3. Or manually delete: rm {db_path}", file=sys.stderr)
             return 1
+        conn = checked
 
     # Run application with error handling
     try:
-        app = SplitfoolApp(config=config)
+        from splitfool.ui.app import SplitfoolApp
+
+        app = SplitfoolApp(config=config, conn=conn)
         app.run()
         return 0
     except sqlite3.DatabaseError as e:
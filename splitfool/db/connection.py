@@ -1,46 +1,354 @@
 """Database connection management."""
 
+import atexit
 import sqlite3
+from collections.abc import Iterator
+from contextlib import suppress
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from splitfool.db.schema import SCHEMA_SQL
+from splitfool.db.schema import MIGRATIONS, SCHEMA_SQL, SCHEMA_VERSION, pragmas, to_epoch
 
 
-def get_connection(db_path: str) -> sqlite3.Connection:
+def _convert_timestamp(value: bytes) -> datetime:
+    """Parse a TIMESTAMP column back into a datetime."""
+    return datetime.fromisoformat(value.decode())
+
+
+# Registered once per process. Datetime parameters bind as the epoch
+# microseconds the timestamp columns hold, so they compare correctly even
+# where a caller skips to_epoch; the converter covers the remaining TIMESTAMP
+# text column (schema_version) on connections opened with PARSE_DECLTYPES
+sqlite3.register_adapter(datetime, to_epoch)
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
+
+
+def get_connection(db_path: str, read_only: bool = False) -> sqlite3.Connection:
     """Get a database connection with proper settings.
 
     Args:
         db_path: Path to SQLite database file
+        read_only: Open the database read-only (it must already exist)
 
     Returns:
         Configured SQLite connection
     """
-    conn = sqlite3.connect(db_path)
+    # Autocommit: transactions are opened only by UnitOfWork's BEGIN
+    # IMMEDIATE, so a stray write can't leave an implicit one holding the
+    # WAL write lock until some later commit. The TUI opens the connection
+    # on the main thread but runs queries on its single database thread,
+    # which serializes all use, so the same-thread check is turned off.
+    if read_only:
+        conn = sqlite3.connect(
+            f"{Path(db_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+    else:
+        conn = sqlite3.connect(
+            db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+            check_same_thread=False,
+        )
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    configure_connection(conn, read_only)
     return conn
 
 
-def initialize_database(db_path: str) -> None:
+def configure_connection(conn: sqlite3.Connection, read_only: bool = False) -> None:
+    """Apply the schema's connection pragmas (WAL, cache, timeouts).
+
+    Pragmas are per connection, so repositories sharing it need no setup.
+
+    Args:
+        conn: Database connection
+        read_only: Whether the connection was opened read-only
+    """
+    for pragma in pragmas(read_only):
+        conn.execute(pragma)
+
+
+def refresh_statistics(conn: sqlite3.Connection) -> None:
+    """Sample the tables into sqlite_stat1 for the query planner.
+
+    Without statistics SQLite guesses join order, and for the balance
+    aggregate it guesses badly (scanning every assignment instead of seeking
+    from bills). The sample per index is capped, so this stays cheap on
+    large databases.
+
+    Args:
+        conn: Writable database connection
+    """
+    conn.execute("PRAGMA analysis_limit = 400")
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
+def change_stamp(conn: sqlite3.Connection) -> tuple[int, int]:
+    """Get a value that changes whenever the database's rows may have changed.
+
+    total_changes counts rows this connection has written (rolled back
+    writes included, which only costs a spurious change), and data_version
+    moves when any other connection commits.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Opaque stamp to compare against one taken earlier
+    """
+    return conn.total_changes, conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+class ConnectionPool:
+    """Process-wide cache holding one long-lived connection per database path.
+
+    Opening SQLite is not free (file open, header parse, PRAGMA setup), so the
+    CLI, the TUI and helper scripts share a single connection for the lifetime
+    of the process instead of reopening it per command.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._connections: dict[str, sqlite3.Connection] = {}
+
+    def get(self, db_path: str) -> sqlite3.Connection:
+        """Get the shared connection for a database, opening it on first use.
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Returns:
+            Configured SQLite connection owned by the pool
+        """
+        conn = self._connections.get(db_path)
+        if conn is None:
+            conn = get_connection(db_path)
+            self._connections[db_path] = conn
+        return conn
+
+    def close(self, db_path: str) -> None:
+        """Close and forget the shared connection for a database, if open.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        conn = self._connections.pop(db_path, None)
+        if conn is not None:
+            try:
+                # Leave fresh statistics for the next process's planner; a
+                # locked, busy or read-only database just goes without
+                with suppress(sqlite3.Error):
+                    refresh_statistics(conn)
+            finally:
+                conn.close()
+
+    def close_all(self) -> None:
+        """Close every pooled connection."""
+        for db_path in list(self._connections):
+            self.close(db_path)
+
+
+# Shared pool, closed once at interpreter exit
+connection_pool = ConnectionPool()
+atexit.register(connection_pool.close_all)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int | None:
+    """Get the schema version recorded in a database.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Highest applied schema version, or None for an uninitialized database
+    """
+    try:
+        row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0]
+
+
+def apply_schema(conn: sqlite3.Connection) -> None:
+    """Create the schema, first upgrading an existing database if needed.
+
+    Args:
+        conn: Database connection
+    """
+    current = get_schema_version(conn)
+    if current == SCHEMA_VERSION:
+        return  # Already up to date; nothing to create or migrate
+    if current is not None:
+        for version in range(current + 1, SCHEMA_VERSION + 1):
+            conn.executescript(MIGRATIONS[version])
+    conn.executescript(SCHEMA_SQL)
+    conn.commit()
+    if current is not None:
+        # Rebuilt tables and indexes have no planner statistics yet
+        refresh_statistics(conn)
+
+
+def initialize_database(db_path: str, conn: sqlite3.Connection | None = None) -> None:
     """Initialize database with schema.
 
     Args:
         db_path: Path to SQLite database file
+        conn: Optional open connection to reuse instead of opening a new one
     """
     # Create parent directory if needed
     db_file = Path(db_path)
     db_file.parent.mkdir(parents=True, exist_ok=True)
 
+    if conn is not None:
+        apply_schema(conn)
+        return
+
     # Create and initialize database
     conn = get_connection(db_path)
     try:
-        conn.executescript(SCHEMA_SQL)
-        conn.commit()
+        apply_schema(conn)
     finally:
         conn.close()
 
 
+def tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Create a cursor that yields plain tuples instead of sqlite3.Row.
+
+    For hot loops that unpack columns positionally, where per-row Row
+    construction and name lookups would dominate.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Cursor with row_factory disabled
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+
+class StatementCache:
+    """Reusable cursors for a connection, one per distinct SQL string.
+
+    sqlite3 keeps prepared statements in a per-connection cache keyed on the
+    SQL text, so binding a repository's constant statements is never
+    re-parsed. Holding one cursor per statement on top of that also skips
+    allocating a cursor on every call. Each statement's results must be
+    fetched before it is executed again.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, tuple_rows: bool = False) -> None:
+        """Initialize an empty cache for a connection.
+
+        Args:
+            connection: SQLite database connection
+            tuple_rows: Give the cursors plain tuple rows (see tuple_cursor)
+                instead of the connection's row factory
+        """
+        self.conn = connection
+        self._tuple_rows = tuple_rows
+        self._cursors: dict[str, sqlite3.Cursor] = {}
+
+    def get(self, sql: str) -> sqlite3.Cursor:
+        """Get the cursor dedicated to a statement, creating it on first use.
+
+        Args:
+            sql: SQL statement text
+
+        Returns:
+            Cursor reserved for this statement
+        """
+        cursor = self._cursors.get(sql)
+        if cursor is None:
+            if self._tuple_rows:
+                cursor = tuple_cursor(self.conn)
+            else:
+                cursor = self.conn.cursor()
+            self._cursors[sql] = cursor
+        return cursor
+
+    def execute(self, sql: str, params: tuple[Any, ...] = ()) -> sqlite3.Cursor:
+        """Execute a statement on its cached cursor.
+
+        Args:
+            sql: SQL statement text
+            params: Statement parameters
+
+        Returns:
+            Cursor with results
+        """
+        return self.get(sql).execute(sql, params)
+
+    def executemany(self, sql: str, params_list: list[tuple[Any, ...]]) -> sqlite3.Cursor:
+        """Execute a statement once per parameter tuple on its cached cursor.
+
+        Args:
+            sql: SQL statement text
+            params_list: List of parameter tuples
+
+        Returns:
+            Cursor used for the batch
+        """
+        return self.get(sql).executemany(sql, params_list)
+
+
+# INSERT ... RETURNING is available from SQLite 3.35
+RETURNING_SUPPORTED = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def returning_id(sql: str) -> str:
+    """Make an INSERT report its new row ID, where SQLite supports it.
+
+    Args:
+        sql: Single-row INSERT statement
+
+    Returns:
+        The statement with RETURNING id appended, or unchanged on older SQLite
+    """
+    return f"{sql} RETURNING id" if RETURNING_SUPPORTED else sql
+
+
+def inserted_id(cursor: sqlite3.Cursor) -> int:
+    """Read the new row ID from an INSERT built with returning_id().
+
+    Args:
+        cursor: Cursor that just executed the INSERT
+
+    Returns:
+        ID of the inserted row
+    """
+    if RETURNING_SUPPORTED:
+        return cursor.fetchone()[0]
+    return cursor.lastrowid  # type: ignore[return-value]
+
+
+# Rows pulled per fetchmany() call by the streaming repository readers
+FETCH_BATCH_SIZE = 256
+
+
+def iter_rows(cursor: sqlite3.Cursor, batch_size: int = FETCH_BATCH_SIZE) -> Iterator[Any]:
+    """Yield a cursor's rows in fixed-size batches instead of one fetchall.
+
+    Peak memory is one batch rather than the whole result set, and callers
+    that stop early never fetch the remaining rows.
+
+    Args:
+        cursor: Cursor with a pending result set
+        batch_size: Rows fetched from the driver at a time
+
+    Yields:
+        Result rows in order
+    """
+    while batch := cursor.fetchmany(batch_size):
+        yield from batch
+
+
 def execute_query(
     conn: sqlite3.Connection,
     query: str,
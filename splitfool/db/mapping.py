@@ -0,0 +1,46 @@
+"""Generated row -> model mappers for the repository read paths."""
+
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# A column is read from the row by name (sqlite3.Row) or position (tuple),
+# optionally through a converter such as from_cents or from_epoch
+Column = tuple[str | int, Callable[[Any], Any] | None]
+
+
+def make_row_mapper(
+    factory: Callable[..., T], columns: Sequence[Column], name: str = "map_row"
+) -> Callable[[Any], T]:
+    """Generate a function that builds one model instance from a result row.
+
+    The function is compiled from source specialized to the given columns,
+    with the factory and converters bound as default arguments, so a call
+    is straight-line lookups of locals and row items with no per-column
+    loop or reflection. Pass it to map() over a cursor for a C-level loop.
+
+    Args:
+        factory: Callable taking the column values positionally, typically a
+            model's _from_db constructor
+        columns: (row key, converter or None) pairs in factory argument
+            order; keys are column names for sqlite3.Row rows or indexes for
+            tuple rows
+        name: Name given to the generated function, for tracebacks
+
+    Returns:
+        Function mapping a row to factory(*converted column values)
+    """
+    namespace: dict[str, Any] = {"_factory": factory}
+    params = ["row", "_factory=_factory"]
+    args = []
+    for position, (key, converter) in enumerate(columns):
+        value = f"row[{key!r}]"
+        if converter is not None:
+            namespace[f"_c{position}"] = converter
+            params.append(f"_c{position}=_c{position}")
+            value = f"_c{position}({value})"
+        args.append(value)
+    source = f"def {name}({', '.join(params)}):\n    return _factory({', '.join(args)})\n"
+    exec(compile(source, f"<row mapper {name}>", "exec"), namespace)
+    return namespace[name]  # type: ignore[no-any-return]
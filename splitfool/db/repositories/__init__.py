@@ -3,6 +3,7 @@
 from splitfool.db.repositories.assignment_repository import AssignmentRepository
 from splitfool.db.repositories.bill_repository import BillRepository
 from splitfool.db.repositories.item_repository import ItemRepository
+from splitfool.db.repositories.registry import Repositories
 from splitfool.db.repositories.settlement_repository import SettlementRepository
 from splitfool.db.repositories.user_repository import UserRepository
 
@@ -10,6 +11,7 @@ __all__ = [
     "AssignmentRepository",
     "BillRepository",
     "ItemRepository",
+    "Repositories",
     "SettlementRepository",
     "UserRepository",
 ]
@@ -1,14 +1,87 @@
 """Assignment repository for database operations."""
 
 import sqlite3
+from datetime import datetime
 from decimal import Decimal
 
+from splitfool.db.connection import StatementCache, inserted_id, returning_id
+from splitfool.db.mapping import make_row_mapper
+from splitfool.db.schema import to_epoch
 from splitfool.models.assignment import Assignment
+from splitfool.utils.currency import (
+    FRACTION_TOLERANCE_PPM,
+    PPM_ONE,
+    from_ppm,
+    to_ppm,
+)
+
+# Assignment queries read plain tuples of (id, item_id, user_id, fraction)
+_assignment_from_tuple = make_row_mapper(
+    Assignment._from_db,
+    [(0, None), (1, None), (2, None), (3, from_ppm)],
+    name="_assignment_from_tuple",
+)
 
 
 class AssignmentRepository:
     """Repository for Assignment entity database operations."""
 
+    # SQL text is fixed per statement so sqlite3's statement cache reuses
+    # the prepared statement across calls
+    _SQL_INSERT = "INSERT INTO assignments (item_id, user_id, fraction) VALUES (?, ?, ?)"
+    _SQL_CREATE = returning_id(_SQL_INSERT)
+    _SQL_GET_BY_ITEM = (
+        "SELECT id, item_id, user_id, fraction FROM assignments WHERE item_id = ? ORDER BY id"
+    )
+    _SQL_GET_BY_USER = (
+        "SELECT id, item_id, user_id, fraction FROM assignments WHERE user_id = ? ORDER BY id"
+    )
+    _SQL_USER_COST_UNITS = (
+        "SELECT a.user_id, SUM(a.fraction * i.cost) "
+        "FROM assignments a JOIN items i ON i.id = a.item_id "
+        "WHERE i.bill_id = ? GROUP BY a.user_id"
+    )
+    _SQL_DEBT_UNITS = (
+        "SELECT b.payer_id, a.user_id, SUM(a.fraction * i.cost), "
+        "(SELECT SUM(cost) FROM items WHERE bill_id = b.id), b.tax "
+        "FROM bills b "
+        "JOIN items i ON i.bill_id = b.id "
+        "JOIN assignments a ON a.item_id = i.id "
+    )
+    # The cutoff is the latest settlement, or the bound floor when there is none
+    _SQL_UNSETTLED_DEBT_UNITS = (
+        _SQL_DEBT_UNITS
+        + "WHERE b.created_at > COALESCE((SELECT MAX(settled_at) FROM settlements), ?) "
+        "GROUP BY b.id, a.user_id"
+    )
+    # Each non-payer participant's share of each bill, rounded half-up to the
+    # cent exactly as share_cents does, summed per (debtor, payer)
+    _SQL_SHARES_FROM = (
+        "WITH shares AS ("
+        "SELECT a.user_id AS debtor_id, b.payer_id AS creditor_id, "
+        "SUM(a.fraction * i.cost) AS units, "
+        "(SELECT SUM(cost) FROM items WHERE bill_id = b.id) AS subtotal, b.tax "
+        "FROM bills b "
+        "JOIN items i ON i.bill_id = b.id "
+        "JOIN assignments a ON a.item_id = i.id "
+        "WHERE b.created_at > COALESCE((SELECT MAX(settled_at) FROM settlements), ?) "
+        "AND a.user_id != b.payer_id "
+    )
+    _SQL_SHARES_SUM = (
+        "GROUP BY b.id, a.user_id) "
+        "SELECT debtor_id, creditor_id, "
+        f"SUM((2 * units * (subtotal + tax) + {PPM_ONE} * subtotal) "
+        f"/ (2 * {PPM_ONE} * subtotal)) AS debt "
+        "FROM shares WHERE subtotal > 0 "
+        "GROUP BY debtor_id, creditor_id HAVING debt > 0"
+    )
+    _SQL_UNSETTLED_DEBTS = _SQL_SHARES_FROM + _SQL_SHARES_SUM
+    _SQL_UNSETTLED_USER_DEBTS = (
+        _SQL_SHARES_FROM + "AND (a.user_id = ? OR b.payer_id = ?) " + _SQL_SHARES_SUM
+    )
+    _SQL_DELETE = "DELETE FROM assignments WHERE id = ?"
+    _SQL_FRACTION_SUM = "SELECT SUM(fraction) FROM assignments WHERE item_id = ?"
+
     def __init__(self, connection: sqlite3.Connection) -> None:
         """Initialize repository with database connection.
 
@@ -16,6 +89,8 @@ class AssignmentRepository:
             connection: SQLite database connection
         """
         self.conn = connection
+        # Every read here unpacks columns positionally, so skip Row objects
+        self._stmts = StatementCache(connection, tuple_rows=True)
 
     def create(self, assignment: Assignment) -> Assignment:
         """Create a new assignment in the database.
@@ -26,12 +101,26 @@ class AssignmentRepository:
         Returns:
             Created assignment with assigned ID
         """
-        cursor = self.conn.execute(
-            "INSERT INTO assignments (item_id, user_id, fraction) VALUES (?, ?, ?)",
-            (assignment.item_id, assignment.user_id, float(assignment.fraction)),
+        cursor = self._stmts.execute(
+            self._SQL_CREATE,
+            (assignment.item_id, assignment.user_id, to_ppm(assignment.fraction)),
         )
-        self.conn.commit()
-        return assignment.replace(id=cursor.lastrowid)
+        return assignment.with_id(inserted_id(cursor))
+
+    def create_rows(self, rows: list[tuple[int, int, Decimal]]) -> None:
+        """Create assignments from plain rows with one batched INSERT.
+
+        For callers that don't need the created models back, so no
+        Assignment is built per row.
+
+        Args:
+            rows: (item_id, user_id, fraction) per assignment
+        """
+        if rows:
+            self._stmts.executemany(
+                self._SQL_INSERT,
+                [(item_id, user_id, to_ppm(fraction)) for item_id, user_id, fraction in rows],
+            )
 
     def get_by_item(self, item_id: int) -> list[Assignment]:
         """Get all assignments for an item.
@@ -42,19 +131,8 @@ class AssignmentRepository:
         Returns:
             List of assignments
         """
-        cursor = self.conn.execute(
-            "SELECT id, item_id, user_id, fraction FROM assignments WHERE item_id = ?",
-            (item_id,),
-        )
-        return [
-            Assignment(
-                id=row["id"],
-                item_id=row["item_id"],
-                user_id=row["user_id"],
-                fraction=Decimal(str(row["fraction"])),
-            )
-            for row in cursor.fetchall()
-        ]
+        cursor = self._stmts.execute(self._SQL_GET_BY_ITEM, (item_id,))
+        return list(map(_assignment_from_tuple, cursor.fetchall()))
 
     def get_by_user(self, user_id: int) -> list[Assignment]:
         """Get all assignments for a user.
@@ -65,19 +143,74 @@ class AssignmentRepository:
         Returns:
             List of assignments
         """
-        cursor = self.conn.execute(
-            "SELECT id, item_id, user_id, fraction FROM assignments WHERE user_id = ?",
-            (user_id,),
+        cursor = self._stmts.execute(self._SQL_GET_BY_USER, (user_id,))
+        return list(map(_assignment_from_tuple, cursor.fetchall()))
+
+    def aggregate_user_cost_units(self, bill_id: int) -> dict[int, int]:
+        """Sum each user's weighted item costs for a bill in a single query.
+
+        Args:
+            bill_id: ID of bill
+
+        Returns:
+            Mapping of user_id -> sum of (item cost cents x fraction ppm)
+        """
+        cursor = self._stmts.execute(self._SQL_USER_COST_UNITS, (bill_id,))
+        return dict(cursor.fetchall())
+
+    def aggregate_unsettled_debt_units(self) -> list[tuple[int, int, int, int, int]]:
+        """Sum weighted item costs per (bill, user) since the last settlement.
+
+        The settlement cutoff is looked up inside the statement instead of
+        by a separate query.
+
+        Returns:
+            List of (payer_id, user_id, units, subtotal_cents, tax_cents) rows
+            for every bill created after the most recent settlement (all
+            bills if there is none), where units is the sum of
+            (item cost cents x fraction ppm)
+        """
+        cursor = self._stmts.execute(
+            self._SQL_UNSETTLED_DEBT_UNITS, (to_epoch(datetime.min),)
         )
-        return [
-            Assignment(
-                id=row["id"],
-                item_id=row["item_id"],
-                user_id=row["user_id"],
-                fraction=Decimal(str(row["fraction"])),
-            )
-            for row in cursor.fetchall()
-        ]
+        return cursor.fetchall()
+
+    def aggregate_unsettled_debts(
+        self, user_id: int | None = None
+    ) -> dict[tuple[int, int], int] | None:
+        """Sum what each participant owes each payer since the last settlement.
+
+        The whole share calculation (proportional tax, rounding to the cent
+        and the per-pair sum) runs inside SQLite, so only one row per
+        (debtor, payer) pair reaches Python.
+
+        Args:
+            user_id: Only sum the pairs this user owes or is owed on
+
+        Returns:
+            Mapping of (debtor_id, creditor_id) -> gross cents owed, or None
+            if an intermediate product overflowed SQLite's 64-bit integers;
+            callers then share out aggregate_unsettled_debt_units rows with
+            Python's exact integers
+        """
+        try:
+            if user_id is None:
+                cursor = self._stmts.execute(
+                    self._SQL_UNSETTLED_DEBTS, (to_epoch(datetime.min),)
+                )
+            else:
+                cursor = self._stmts.execute(
+                    self._SQL_UNSETTLED_USER_DEBTS, (to_epoch(datetime.min), user_id, user_id)
+                )
+            rows = cursor.fetchall()
+        except sqlite3.OperationalError as e:
+            if "integer overflow" in str(e):
+                return None
+            raise
+        # SQLite switches to floating point when a product overflows
+        if any(type(debt) is not int for _, _, debt in rows):
+            return None
+        return {(debtor_id, creditor_id): debt for debtor_id, creditor_id, debt in rows}
 
     def delete(self, assignment_id: int) -> None:
         """Delete assignment by ID.
@@ -85,22 +218,22 @@ class AssignmentRepository:
         Args:
             assignment_id: ID of assignment to delete
         """
-        self.conn.execute("DELETE FROM assignments WHERE id = ?", (assignment_id,))
-        self.conn.commit()
+        self._stmts.execute(self._SQL_DELETE, (assignment_id,))
 
     def validate_fractions_sum(self, item_id: int) -> bool:
         """Validate that fractions for an item sum to 1.0.
 
+        Writes can no longer exceed 1.0 (a schema trigger rejects them), so
+        this is only needed to tell whether an item is fully assigned.
+
         Args:
             item_id: ID of item
 
         Returns:
             True if fractions sum to 1.0 (within tolerance)
         """
-        cursor = self.conn.execute(
-            "SELECT SUM(fraction) as total FROM assignments WHERE item_id = ?",
-            (item_id,),
-        )
-        row = cursor.fetchone()
-        total = Decimal(str(row["total"])) if row["total"] else Decimal("0")
-        return abs(total - Decimal("1.0")) <= Decimal("0.001")
+        cursor = self._stmts.execute(self._SQL_FRACTION_SUM, (item_id,))
+        (total,) = cursor.fetchone()
+        total = total or 0
+        # The tolerance keeps equal thirds (333333 ppm each) valid
+        return abs(total - PPM_ONE) <= FRACTION_TOLERANCE_PPM
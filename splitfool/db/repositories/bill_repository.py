@@ -1,16 +1,100 @@
 """Bill repository for database operations."""
 
+import json
 import sqlite3
+from collections.abc import Iterator
 from datetime import datetime
-from decimal import Decimal
+from itertools import groupby
+from typing import Any
 
+from splitfool.db.connection import StatementCache, inserted_id, iter_rows, returning_id
+from splitfool.db.mapping import make_row_mapper
+from splitfool.db.schema import from_epoch, to_epoch
+from splitfool.models.assignment import Assignment
 from splitfool.models.bill import Bill
+from splitfool.models.item import Item
+from splitfool.utils.currency import from_cents, from_ppm, to_cents
 from splitfool.utils.errors import BillNotFoundError
 
+# Bill, its items with their assignments, and user_id -> name for the payer
+# and every assignee
+BillDetails = tuple[Bill, list[tuple[Item, list[Assignment]]], dict[int, str]]
+
+_bill_from_row = make_row_mapper(
+    Bill._from_db,
+    [
+        ("id", None),
+        ("payer_id", None),
+        ("description", None),
+        ("tax", from_cents),
+        ("created_at", from_epoch),
+    ],
+    name="_bill_from_row",
+)
+# Same bill, read from the aliased columns of the details query
+_bill_from_details_row = make_row_mapper(
+    Bill._from_db,
+    [
+        ("bill_id", None),
+        ("payer_id", None),
+        ("bill_description", None),
+        ("tax", from_cents),
+        ("created_at", from_epoch),
+    ],
+    name="_bill_from_details_row",
+)
+_item_from_details_row = make_row_mapper(
+    Item._from_db,
+    [("item_id", None), ("bill_id", None), ("item_description", None), ("cost", from_cents)],
+    name="_item_from_details_row",
+)
+_assignment_from_details_row = make_row_mapper(
+    Assignment._from_db,
+    [("assignment_id", None), ("item_id", None), ("user_id", None), ("fraction", from_ppm)],
+    name="_assignment_from_details_row",
+)
+
 
 class BillRepository:
     """Repository for Bill entity database operations."""
 
+    _SQL_INSERT = (
+        "INSERT INTO bills (payer_id, description, tax, created_at) VALUES (?, ?, ?, ?)"
+    )
+    _SQL_CREATE = returning_id(_SQL_INSERT)
+    _SQL_SELECT = "SELECT id, payer_id, description, tax, created_at FROM bills "
+    _SQL_GET = _SQL_SELECT + "WHERE id = ?"
+    # Subtotal summed from the covering idx_items_bill_cost, beside the tax
+    _SQL_COST_CENTS = (
+        "SELECT (SELECT COALESCE(SUM(cost), 0) FROM items WHERE bill_id = b.id), b.tax "
+        "FROM bills b WHERE b.id = ?"
+    )
+    _SQL_TOTAL_CENTS_MANY = (
+        "SELECT b.id, b.tax + (SELECT COALESCE(SUM(cost), 0) FROM items WHERE bill_id = b.id) "
+        "FROM bills b WHERE b.id IN (SELECT value FROM json_each(?))"
+    )
+    # The id tie-break keeps pages disjoint when bills share a timestamp; the
+    # index already holds rowids ascending within a timestamp, so it's free
+    _SQL_GET_ALL = _SQL_SELECT + "ORDER BY created_at DESC, id LIMIT ? OFFSET ?"
+    _SQL_GET_BY_USER = _SQL_SELECT + "WHERE payer_id = ? ORDER BY created_at DESC"
+    # Bound as epoch microseconds: an integer range search on idx_bills_created_at,
+    # already in the requested order
+    _SQL_GET_SINCE = _SQL_SELECT + "WHERE created_at > ? ORDER BY created_at DESC"
+    # IDs are bound as one JSON array so the statement text never varies
+    _SQL_DETAILS = (
+        "SELECT b.id AS bill_id, b.payer_id, b.description AS bill_description, "
+        "b.tax, b.created_at, p.name AS payer_name, "
+        "i.id AS item_id, i.description AS item_description, i.cost, "
+        "a.id AS assignment_id, a.user_id, a.fraction, u.name AS user_name "
+        "FROM bills b "
+        "LEFT JOIN users p ON p.id = b.payer_id "
+        "LEFT JOIN items i ON i.bill_id = b.id "
+        "LEFT JOIN assignments a ON a.item_id = i.id "
+        "LEFT JOIN users u ON u.id = a.user_id "
+        "WHERE b.id IN (SELECT value FROM json_each(?)) "
+        "ORDER BY b.created_at DESC, b.id, i.id, a.id"
+    )
+
     def __init__(self, connection: sqlite3.Connection) -> None:
         """Initialize repository with database connection.
 
@@ -18,6 +102,7 @@ class BillRepository:
             connection: SQLite database connection
         """
         self.conn = connection
+        self._stmts = StatementCache(connection)
 
     def create(self, bill: Bill) -> Bill:
         """Create a new bill in the database.
@@ -28,12 +113,11 @@ class BillRepository:
         Returns:
             Created bill with assigned ID
         """
-        cursor = self.conn.execute(
-            "INSERT INTO bills (payer_id, description, tax, created_at) VALUES (?, ?, ?, ?)",
-            (bill.payer_id, bill.description, float(bill.tax), bill.created_at),
+        cursor = self._stmts.execute(
+            self._SQL_CREATE,
+            (bill.payer_id, bill.description, to_cents(bill.tax), to_epoch(bill.created_at)),
         )
-        self.conn.commit()
-        return bill.replace(id=cursor.lastrowid)
+        return bill.with_id(inserted_id(cursor))
 
     def get(self, bill_id: int) -> Bill:
         """Get bill by ID.
@@ -47,23 +131,49 @@ class BillRepository:
         Raises:
             BillNotFoundError: If bill not found
         """
-        cursor = self.conn.execute(
-            "SELECT id, payer_id, description, tax, created_at FROM bills WHERE id = ?",
-            (bill_id,),
-        )
+        cursor = self._stmts.execute(self._SQL_GET, (bill_id,))
         row = cursor.fetchone()
         if not row:
             raise BillNotFoundError(
                 f"Bill with ID {bill_id} not found",
                 code="BILL_001",
             )
-        return Bill(
-            id=row["id"],
-            payer_id=row["payer_id"],
-            description=row["description"],
-            tax=Decimal(str(row["tax"])),
-            created_at=datetime.fromisoformat(row["created_at"]),
-        )
+        return _bill_from_row(row)
+
+    def get_cost_cents(self, bill_id: int) -> tuple[int, int]:
+        """Get a bill's item subtotal and tax with one query, in integer cents.
+
+        Args:
+            bill_id: ID of bill
+
+        Returns:
+            Tuple of (subtotal_cents, tax_cents); the subtotal is 0 for a
+            bill without items
+
+        Raises:
+            BillNotFoundError: If bill not found
+        """
+        row = self._stmts.execute(self._SQL_COST_CENTS, (bill_id,)).fetchone()
+        if not row:
+            raise BillNotFoundError(
+                f"Bill with ID {bill_id} not found",
+                code="BILL_001",
+            )
+        return row[0], row[1]
+
+    def get_total_cents_many(self, bill_ids: list[int]) -> dict[int, int]:
+        """Get several bills' totals (items + tax) with one query, in integer cents.
+
+        Args:
+            bill_ids: IDs of bills
+
+        Returns:
+            Mapping of bill_id -> total cents; unknown IDs are left out
+        """
+        if not bill_ids:
+            return {}
+        cursor = self._stmts.execute(self._SQL_TOTAL_CENTS_MANY, (json.dumps(bill_ids),))
+        return {row[0]: row[1] for row in cursor.fetchall()}
 
     def get_all(self, limit: int = 100, offset: int = 0) -> list[Bill]:
         """Get all bills with pagination.
@@ -75,21 +185,19 @@ class BillRepository:
         Returns:
             List of bills ordered by creation date (newest first)
         """
-        cursor = self.conn.execute(
-            "SELECT id, payer_id, description, tax, created_at FROM bills "
-            "ORDER BY created_at DESC LIMIT ? OFFSET ?",
-            (limit, offset),
-        )
-        return [
-            Bill(
-                id=row["id"],
-                payer_id=row["payer_id"],
-                description=row["description"],
-                tax=Decimal(str(row["tax"])),
-                created_at=datetime.fromisoformat(row["created_at"]),
-            )
-            for row in cursor.fetchall()
-        ]
+        return list(self.iter_all(limit, offset))
+
+    def iter_all(self, limit: int = 100, offset: int = 0) -> Iterator[Bill]:
+        """Stream all bills with pagination.
+
+        Args:
+            limit: Maximum number of bills to return
+            offset: Number of bills to skip
+
+        Returns:
+            Iterator over bills ordered by creation date (newest first)
+        """
+        return self._iter_bills(self._SQL_GET_ALL, (limit, offset))
 
     def get_by_user(self, user_id: int) -> list[Bill]:
         """Get all bills where user is the payer.
@@ -100,21 +208,18 @@ class BillRepository:
         Returns:
             List of bills
         """
-        cursor = self.conn.execute(
-            "SELECT id, payer_id, description, tax, created_at FROM bills "
-            "WHERE payer_id = ? ORDER BY created_at DESC",
-            (user_id,),
-        )
-        return [
-            Bill(
-                id=row["id"],
-                payer_id=row["payer_id"],
-                description=row["description"],
-                tax=Decimal(str(row["tax"])),
-                created_at=datetime.fromisoformat(row["created_at"]),
-            )
-            for row in cursor.fetchall()
-        ]
+        return list(self.iter_by_user(user_id))
+
+    def iter_by_user(self, user_id: int) -> Iterator[Bill]:
+        """Stream all bills where user is the payer.
+
+        Args:
+            user_id: ID of user
+
+        Returns:
+            Iterator over bills ordered by creation date (newest first)
+        """
+        return self._iter_bills(self._SQL_GET_BY_USER, (user_id,))
 
     def get_since_date(self, since: datetime) -> list[Bill]:
         """Get all bills created since a specific date.
@@ -125,18 +230,71 @@ class BillRepository:
         Returns:
             List of bills created after the threshold
         """
-        cursor = self.conn.execute(
-            "SELECT id, payer_id, description, tax, created_at FROM bills "
-            "WHERE created_at > ? ORDER BY created_at DESC",
-            (since,),
-        )
-        return [
-            Bill(
-                id=row["id"],
-                payer_id=row["payer_id"],
-                description=row["description"],
-                tax=Decimal(str(row["tax"])),
-                created_at=datetime.fromisoformat(row["created_at"]),
-            )
-            for row in cursor.fetchall()
-        ]
+        return list(self.iter_since_date(since))
+
+    def iter_since_date(self, since: datetime) -> Iterator[Bill]:
+        """Stream all bills created since a specific date.
+
+        Args:
+            since: DateTime threshold
+
+        Returns:
+            Iterator over bills created after the threshold, newest first
+        """
+        return self._iter_bills(self._SQL_GET_SINCE, (to_epoch(since),))
+
+    def _iter_bills(self, sql: str, params: tuple[Any, ...]) -> Iterator[Bill]:
+        """Stream bills for a SELECT over the bill columns.
+
+        Uses a fresh cursor rather than the statement cache, since a
+        partially consumed stream must not be reset by another call.
+
+        Args:
+            sql: Query selecting id, payer_id, description, tax, created_at
+            params: Query parameters
+
+        Returns:
+            Iterator over bills in query order
+        """
+        return map(_bill_from_row, iter_rows(self.conn.execute(sql, params)))
+
+    def fetch_bills_with_details(self, bill_ids: list[int]) -> list[BillDetails]:
+        """Get bills with their items, assignments and user names in one query.
+
+        Args:
+            bill_ids: IDs of bills to retrieve; unknown IDs are skipped
+
+        Returns:
+            List of (bill, items with assignments, user names) ordered by
+            creation date (newest first)
+        """
+        if not bill_ids:
+            return []
+        rows = self._stmts.execute(self._SQL_DETAILS, (json.dumps(bill_ids),)).fetchall()
+
+        details: list[BillDetails] = []
+        for _, bill_group in groupby(rows, key=lambda row: row["bill_id"]):
+            bill_rows = list(bill_group)
+            first = bill_rows[0]
+            bill = _bill_from_details_row(first)
+            names: dict[int, str] = {}
+            if first["payer_name"] is not None:
+                names[bill.payer_id] = first["payer_name"]
+
+            items: list[tuple[Item, list[Assignment]]] = []
+            for item_id, item_group in groupby(bill_rows, key=lambda row: row["item_id"]):
+                if item_id is None:
+                    continue  # Bill without items
+                item_rows = list(item_group)
+                item = _item_from_details_row(item_rows[0])
+                assignments: list[Assignment] = []
+                for row in item_rows:
+                    if row["assignment_id"] is None:
+                        continue  # Item without assignments
+                    assignments.append(_assignment_from_details_row(row))
+                    if row["user_name"] is not None:
+                        names[row["user_id"]] = row["user_name"]
+                items.append((item, assignments))
+
+            details.append((bill, items, names))
+        return details
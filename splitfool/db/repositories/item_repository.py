@@ -1,14 +1,34 @@
 """Item repository for database operations."""
 
 import sqlite3
+from collections.abc import Iterator
 from decimal import Decimal
 
+from splitfool.db.connection import StatementCache, inserted_id, iter_rows, returning_id
+from splitfool.db.mapping import make_row_mapper
 from splitfool.models.item import Item
+from splitfool.utils.currency import from_cents, to_cents
+
+_item_from_row = make_row_mapper(
+    Item._from_db,
+    [("id", None), ("bill_id", None), ("description", None), ("cost", from_cents)],
+    name="_item_from_row",
+)
 
 
 class ItemRepository:
     """Repository for Item entity database operations."""
 
+    _SQL_INSERT = "INSERT INTO items (bill_id, description, cost) VALUES (?, ?, ?)"
+    _SQL_CREATE = returning_id(_SQL_INSERT)
+    _SQL_LAST_ROWID = "SELECT last_insert_rowid()"
+    _SQL_GET_BY_BILL = (
+        "SELECT id, bill_id, description, cost FROM items WHERE bill_id = ? ORDER BY id"
+    )
+    _SQL_SUBTOTAL = "SELECT COALESCE(SUM(cost), 0) FROM items WHERE bill_id = ?"
+    _SQL_DELETE = "DELETE FROM items WHERE id = ?"
+    _SQL_UPDATE = "UPDATE items SET description = ?, cost = ? WHERE id = ?"
+
     def __init__(self, connection: sqlite3.Connection) -> None:
         """Initialize repository with database connection.
 
@@ -16,6 +36,7 @@ class ItemRepository:
             connection: SQLite database connection
         """
         self.conn = connection
+        self._stmts = StatementCache(connection)
 
     def create(self, item: Item) -> Item:
         """Create a new item in the database.
@@ -26,12 +47,38 @@ class ItemRepository:
         Returns:
             Created item with assigned ID
         """
-        cursor = self.conn.execute(
-            "INSERT INTO items (bill_id, description, cost) VALUES (?, ?, ?)",
-            (item.bill_id, item.description, float(item.cost)),
+        cursor = self._stmts.execute(
+            self._SQL_CREATE,
+            (item.bill_id, item.description, to_cents(item.cost)),
         )
-        self.conn.commit()
-        return item.replace(id=cursor.lastrowid)
+        return item.with_id(inserted_id(cursor))
+
+    def create_rows(self, bill_id: int, rows: list[tuple[str, Decimal]]) -> list[int]:
+        """Create items for one bill from plain rows with one batched INSERT.
+
+        For callers that only need the new IDs, so no Item is built per row.
+        Must run inside a transaction: the IDs are derived from the last
+        rowid, which is only safe while the write lock keeps other
+        connections from inserting between the rows.
+
+        Args:
+            bill_id: ID of bill the items belong to
+            rows: (description, cost) per item
+
+        Returns:
+            IDs of the created items, in row order
+        """
+        if not rows:
+            return []
+        assert self.conn.in_transaction, "create_rows must run inside a transaction"
+        self._stmts.executemany(
+            self._SQL_INSERT,
+            [(bill_id, description, to_cents(cost)) for description, cost in rows],
+        )
+        # Rows inserted by one executemany under one write lock get contiguous rowids
+        last_id: int = self._stmts.execute(self._SQL_LAST_ROWID).fetchone()[0]
+        first_id = last_id - len(rows) + 1
+        return list(range(first_id, first_id + len(rows)))
 
     def get_by_bill(self, bill_id: int) -> list[Item]:
         """Get all items for a bill.
@@ -42,19 +89,33 @@ class ItemRepository:
         Returns:
             List of items
         """
-        cursor = self.conn.execute(
-            "SELECT id, bill_id, description, cost FROM items WHERE bill_id = ?",
-            (bill_id,),
-        )
-        return [
-            Item(
-                id=row["id"],
-                bill_id=row["bill_id"],
-                description=row["description"],
-                cost=Decimal(str(row["cost"])),
-            )
-            for row in cursor.fetchall()
-        ]
+        return list(self.iter_by_bill(bill_id))
+
+    def iter_by_bill(self, bill_id: int) -> Iterator[Item]:
+        """Stream all items for a bill.
+
+        Uses a fresh cursor rather than the statement cache, since a
+        partially consumed stream must not be reset by another call.
+
+        Args:
+            bill_id: ID of bill
+
+        Returns:
+            Iterator over the bill's items
+        """
+        cursor = self.conn.execute(self._SQL_GET_BY_BILL, (bill_id,))
+        return map(_item_from_row, iter_rows(cursor))
+
+    def subtotal_cents(self, bill_id: int) -> int:
+        """Sum a bill's item costs in SQL, in stored integer cents.
+
+        Args:
+            bill_id: ID of bill
+
+        Returns:
+            Total cost of the bill's items in cents (0 if it has none)
+        """
+        return self._stmts.execute(self._SQL_SUBTOTAL, (bill_id,)).fetchone()[0]
 
     def delete(self, item_id: int) -> None:
         """Delete item by ID.
@@ -62,8 +123,7 @@ class ItemRepository:
         Args:
             item_id: ID of item to delete
         """
-        self.conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
-        self.conn.commit()
+        self._stmts.execute(self._SQL_DELETE, (item_id,))
 
     def update(self, item: Item) -> Item:
         """Update existing item.
@@ -77,9 +137,7 @@ class ItemRepository:
         if item.id is None:
             raise ValueError("Cannot update item without ID")
 
-        self.conn.execute(
-            "UPDATE items SET description = ?, cost = ? WHERE id = ?",
-            (item.description, float(item.cost), item.id),
+        self._stmts.execute(
+            self._SQL_UPDATE, (item.description, to_cents(item.cost), item.id)
         )
-        self.conn.commit()
         return item
@@ -0,0 +1,43 @@
+"""One shared instance of each repository per connection."""
+
+import sqlite3
+from dataclasses import dataclass
+
+from splitfool.db.repositories.assignment_repository import AssignmentRepository
+from splitfool.db.repositories.bill_repository import BillRepository
+from splitfool.db.repositories.item_repository import ItemRepository
+from splitfool.db.repositories.settlement_repository import SettlementRepository
+from splitfool.db.repositories.user_repository import UserRepository
+
+
+@dataclass(frozen=True, slots=True)
+class Repositories:
+    """Repositories over one connection, shared by every service built from it.
+
+    Services handed the same instance reuse each repository's statement
+    cache instead of holding duplicate repositories and cursors.
+    """
+
+    users: UserRepository
+    bills: BillRepository
+    items: ItemRepository
+    assignments: AssignmentRepository
+    settlements: SettlementRepository
+
+    @classmethod
+    def for_connection(cls, connection: sqlite3.Connection) -> "Repositories":
+        """Create one of each repository for a connection.
+
+        Args:
+            connection: SQLite database connection
+
+        Returns:
+            Repositories bound to the connection
+        """
+        return cls(
+            users=UserRepository(connection),
+            bills=BillRepository(connection),
+            items=ItemRepository(connection),
+            assignments=AssignmentRepository(connection),
+            settlements=SettlementRepository(connection),
+        )
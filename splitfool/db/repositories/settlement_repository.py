@@ -1,14 +1,36 @@
 """Settlement repository for database operations."""
 
 import sqlite3
-from datetime import datetime
+from collections.abc import Iterator
 
+from splitfool.db.connection import StatementCache, inserted_id, iter_rows, returning_id
+from splitfool.db.mapping import make_row_mapper
+from splitfool.db.schema import from_epoch, to_epoch
 from splitfool.models.settlement import Settlement
 
 
+def _note_or_empty(note: str | None) -> str:
+    """Read a nullable note column as text."""
+    return note or ""
+
+
+_settlement_from_row = make_row_mapper(
+    Settlement,
+    [("id", None), ("settled_at", from_epoch), ("note", _note_or_empty)],
+    name="_settlement_from_row",
+)
+
+
 class SettlementRepository:
     """Repository for Settlement entity database operations."""
 
+    _SQL_INSERT = "INSERT INTO settlements (settled_at, note) VALUES (?, ?)"
+    _SQL_CREATE = returning_id(_SQL_INSERT)
+    _SQL_GET_LATEST = (
+        "SELECT id, settled_at, note FROM settlements ORDER BY settled_at DESC LIMIT 1"
+    )
+    _SQL_GET_ALL = "SELECT id, settled_at, note FROM settlements ORDER BY settled_at DESC"
+
     def __init__(self, connection: sqlite3.Connection) -> None:
         """Initialize repository with database connection.
 
@@ -16,6 +38,7 @@ class SettlementRepository:
             connection: SQLite database connection
         """
         self.conn = connection
+        self._stmts = StatementCache(connection)
 
     def create(self, settlement: Settlement) -> Settlement:
         """Create a new settlement in the database.
@@ -26,12 +49,10 @@ class SettlementRepository:
         Returns:
             Created settlement with assigned ID
         """
-        cursor = self.conn.execute(
-            "INSERT INTO settlements (settled_at, note) VALUES (?, ?)",
-            (settlement.settled_at, settlement.note),
+        cursor = self._stmts.execute(
+            self._SQL_CREATE, (to_epoch(settlement.settled_at), settlement.note)
         )
-        self.conn.commit()
-        return settlement.replace(id=cursor.lastrowid)
+        return settlement.with_id(inserted_id(cursor))
 
     def get_latest(self) -> Settlement | None:
         """Get the most recent settlement.
@@ -39,18 +60,11 @@ class SettlementRepository:
         Returns:
             Most recent settlement or None if no settlements exist
         """
-        cursor = self.conn.execute(
-            "SELECT id, settled_at, note FROM settlements "
-            "ORDER BY settled_at DESC LIMIT 1"
-        )
+        cursor = self._stmts.execute(self._SQL_GET_LATEST)
         row = cursor.fetchone()
         if not row:
             return None
-        return Settlement(
-            id=row["id"],
-            settled_at=datetime.fromisoformat(row["settled_at"]),
-            note=row["note"] or "",
-        )
+        return _settlement_from_row(row)
 
     def get_all(self) -> list[Settlement]:
         """Get all settlements ordered by date (newest first).
@@ -58,14 +72,15 @@ class SettlementRepository:
         Returns:
             List of all settlements
         """
-        cursor = self.conn.execute(
-            "SELECT id, settled_at, note FROM settlements ORDER BY settled_at DESC"
-        )
-        return [
-            Settlement(
-                id=row["id"],
-                settled_at=datetime.fromisoformat(row["settled_at"]),
-                note=row["note"] or "",
-            )
-            for row in cursor.fetchall()
-        ]
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[Settlement]:
+        """Stream all settlements ordered by date (newest first).
+
+        Uses a fresh cursor rather than the statement cache, since a
+        partially consumed stream must not be reset by another call.
+
+        Returns:
+            Iterator over settlements, newest first
+        """
+        return map(_settlement_from_row, iter_rows(self.conn.execute(self._SQL_GET_ALL)))
@@ -1,15 +1,34 @@
 """User repository for database operations."""
 
+import json
 import sqlite3
-from datetime import datetime
+from collections.abc import Iterator
 
+from splitfool.db.connection import StatementCache, inserted_id, iter_rows, returning_id
+from splitfool.db.mapping import make_row_mapper
+from splitfool.db.schema import from_epoch, to_epoch
 from splitfool.models.user import User
 from splitfool.utils.errors import DuplicateUserError, UserNotFoundError
 
+_user_from_row = make_row_mapper(
+    User._from_db,
+    [("id", None), ("name", None), ("created_at", from_epoch)],
+    name="_user_from_row",
+)
+
 
 class UserRepository:
     """Repository for User entity database operations."""
 
+    _SQL_INSERT = "INSERT INTO users (name, created_at) VALUES (?, ?)"
+    _SQL_CREATE = returning_id(_SQL_INSERT)
+    _SQL_GET = "SELECT id, name, created_at FROM users WHERE id = ?"
+    _SQL_GET_ALL = "SELECT id, name, created_at FROM users ORDER BY name"
+    _SQL_GET_NAMES = "SELECT id, name FROM users WHERE id IN (SELECT value FROM json_each(?))"
+    _SQL_UPDATE = "UPDATE users SET name = ? WHERE id = ?"
+    _SQL_DELETE = "DELETE FROM users WHERE id = ?"
+    _SQL_EXISTS_BY_NAME = "SELECT 1 FROM users WHERE name = ? LIMIT 1"
+
     def __init__(self, connection: sqlite3.Connection) -> None:
         """Initialize repository with database connection.
 
@@ -17,6 +36,7 @@ class UserRepository:
             connection: SQLite database connection
         """
         self.conn = connection
+        self._stmts = StatementCache(connection)
 
     def create(self, user: User) -> User:
         """Create a new user in the database.
@@ -31,12 +51,8 @@ class UserRepository:
             DuplicateUserError: If user with same name already exists
         """
         try:
-            cursor = self.conn.execute(
-                "INSERT INTO users (name, created_at) VALUES (?, ?)",
-                (user.name, user.created_at),
-            )
-            self.conn.commit()
-            return user.replace(id=cursor.lastrowid)
+            cursor = self._stmts.execute(self._SQL_CREATE, (user.name, to_epoch(user.created_at)))
+            return user.with_id(inserted_id(cursor))
         except sqlite3.IntegrityError as e:
             if "UNIQUE constraint failed" in str(e):
                 raise DuplicateUserError(
@@ -57,21 +73,14 @@ class UserRepository:
         Raises:
             UserNotFoundError: If user not found
         """
-        cursor = self.conn.execute(
-            "SELECT id, name, created_at FROM users WHERE id = ?",
-            (user_id,),
-        )
+        cursor = self._stmts.execute(self._SQL_GET, (user_id,))
         row = cursor.fetchone()
         if not row:
             raise UserNotFoundError(
                 f"User with ID {user_id} not found",
                 code="USER_004",
             )
-        return User(
-            id=row["id"],
-            name=row["name"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-        )
+        return _user_from_row(row)
 
     def get_all(self) -> list[User]:
         """Get all users.
@@ -79,17 +88,32 @@ class UserRepository:
         Returns:
             List of all users
         """
-        cursor = self.conn.execute(
-            "SELECT id, name, created_at FROM users ORDER BY name"
-        )
-        return [
-            User(
-                id=row["id"],
-                name=row["name"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-            )
-            for row in cursor.fetchall()
-        ]
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[User]:
+        """Stream all users ordered by name.
+
+        Uses a fresh cursor rather than the statement cache, since a
+        partially consumed stream must not be reset by another call.
+
+        Returns:
+            Iterator over users ordered by name
+        """
+        return map(_user_from_row, iter_rows(self.conn.execute(self._SQL_GET_ALL)))
+
+    def get_names(self, user_ids: list[int]) -> dict[int, str]:
+        """Get names for several users with a single query.
+
+        Args:
+            user_ids: IDs of users; unknown IDs are skipped
+
+        Returns:
+            Mapping of user_id -> name
+        """
+        if not user_ids:
+            return {}
+        cursor = self._stmts.execute(self._SQL_GET_NAMES, (json.dumps(user_ids),))
+        return {row["id"]: row["name"] for row in cursor.fetchall()}
 
     def update(self, user: User) -> User:
         """Update existing user.
@@ -108,16 +132,12 @@ class UserRepository:
             raise ValueError("Cannot update user without ID")
 
         try:
-            cursor = self.conn.execute(
-                "UPDATE users SET name = ? WHERE id = ?",
-                (user.name, user.id),
-            )
+            cursor = self._stmts.execute(self._SQL_UPDATE, (user.name, user.id))
             if cursor.rowcount == 0:
                 raise UserNotFoundError(
                     f"User with ID {user.id} not found",
                     code="USER_004",
                 )
-            self.conn.commit()
             return user
         except sqlite3.IntegrityError as e:
             if "UNIQUE constraint failed" in str(e):
@@ -136,13 +156,12 @@ class UserRepository:
         Raises:
             UserNotFoundError: If user not found
         """
-        cursor = self.conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
+        cursor = self._stmts.execute(self._SQL_DELETE, (user_id,))
         if cursor.rowcount == 0:
             raise UserNotFoundError(
                 f"User with ID {user_id} not found",
                 code="USER_004",
             )
-        self.conn.commit()
 
     def exists_by_name(self, name: str) -> bool:
         """Check if user with given name exists.
@@ -153,9 +172,5 @@ class UserRepository:
         Returns:
             True if user exists, False otherwise
         """
-        cursor = self.conn.execute(
-            "SELECT COUNT(*) as count FROM users WHERE name = ?",
-            (name,),
-        )
-        row = cursor.fetchone()
-        return row["count"] > 0
+        cursor = self._stmts.execute(self._SQL_EXISTS_BY_NAME, (name,))
+        return cursor.fetchone() is not None
@@ -1,13 +1,124 @@
 """Database schema definitions for Splitfool."""
 
-SCHEMA_VERSION = 1
+from datetime import datetime, timedelta
 
-SCHEMA_SQL = """
+from splitfool.utils.currency import FRACTION_TOLERANCE_PPM, PPM_ONE
+
+SCHEMA_VERSION = 6
+
+# Timestamps are stored as INTEGER microseconds since 1970-01-01 on the
+# app's local wall clock. Naive datetimes map onto it with exact integer
+# arithmetic (no time zone lookup), round-trip without loss, and sort in the
+# same order as the ISO text they replace.
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Column default matching to_epoch(datetime.now()), at second precision
+EPOCH_NOW_SQL = "(CAST(strftime('%s', 'now', 'localtime') AS INTEGER) * 1000000)"
+
+
+def to_epoch(value: datetime) -> int:
+    """Convert a datetime to stored epoch microseconds.
+
+    Args:
+        value: Naive local datetime; aware ones are converted to local time
+
+    Returns:
+        Microseconds since 1970-01-01 on the local wall clock
+
+    Examples:
+        >>> to_epoch(datetime(1970, 1, 2, 0, 0, 0, 5))
+        86400000005
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_epoch(value: int) -> datetime:
+    """Convert stored epoch microseconds back to a naive local datetime.
+
+    Args:
+        value: Microseconds since 1970-01-01 on the local wall clock
+
+    Returns:
+        Naive datetime
+
+    Examples:
+        >>> from_epoch(86400000005)
+        datetime.datetime(1970, 1, 2, 0, 0, 0, 5)
+    """
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _text_to_epoch_sql(column: str) -> str:
+    """SQL expression converting an ISO timestamp text column to epoch us."""
+    return (
+        f"CAST(strftime('%s', {column}) AS INTEGER) * 1000000 + "
+        f"CASE WHEN instr({column}, '.') > 0 THEN CAST(substr("
+        f"substr({column}, instr({column}, '.') + 1) || '000000', 1, 6) AS INTEGER) "
+        f"ELSE 0 END"
+    )
+
+
+# Upper bound enforced on an item's summed assignment fractions, in ppm: 1.0
+# plus the fraction tolerance. The lower bound is checked by the service
+# before writing, since rows are inserted one at a time.
+FRACTION_SUM_MAX_PPM = PPM_ONE + FRACTION_TOLERANCE_PPM
+
+# Reject writes that would push an item's fractions past the bound
+FRACTION_TRIGGERS_SQL = f"""
+CREATE TRIGGER IF NOT EXISTS assignments_fraction_sum_insert
+AFTER INSERT ON assignments
+WHEN (SELECT SUM(fraction) FROM assignments WHERE item_id = NEW.item_id)
+    > {FRACTION_SUM_MAX_PPM}
+BEGIN
+    SELECT RAISE(ABORT, 'assignment fractions for item exceed 1.0');
+END;
+CREATE TRIGGER IF NOT EXISTS assignments_fraction_sum_update
+AFTER UPDATE OF item_id, fraction ON assignments
+WHEN (SELECT SUM(fraction) FROM assignments WHERE item_id = NEW.item_id)
+    > {FRACTION_SUM_MAX_PPM}
+BEGIN
+    SELECT RAISE(ABORT, 'assignment fractions for item exceed 1.0');
+END;
+"""
+
+def pragmas(read_only: bool = False) -> list[str]:
+    """Per-connection tuning applied before any statement runs.
+
+    WAL lets readers (balance calculation) proceed alongside a writer (bill
+    creation) and, with synchronous=NORMAL, commits skip the full fsync while
+    staying crash-safe. The journal settings need write access, so read-only
+    connections get only the cache and safety pragmas.
+
+    Args:
+        read_only: Whether the connection was opened read-only
+
+    Returns:
+        PRAGMA statements to execute, in order
+    """
+    journal = [] if read_only else [
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+    ]
+    return journal + [
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -64000",
+        "PRAGMA mmap_size = 268435456",
+        "PRAGMA busy_timeout = 5000",
+        "PRAGMA foreign_keys = ON",
+    ]
+
+
+# Money columns hold integer cents; assignments.fraction holds parts-per-million;
+# created_at and settled_at hold epoch microseconds (see to_epoch)
+SCHEMA_SQL = f"""
 -- Users table
 CREATE TABLE IF NOT EXISTS users (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL UNIQUE,
-    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    created_at INTEGER NOT NULL DEFAULT {EPOCH_NOW_SQL}
 );
 CREATE INDEX IF NOT EXISTS idx_users_name ON users(name);
 
@@ -16,11 +127,13 @@ CREATE TABLE IF NOT EXISTS bills (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     payer_id INTEGER NOT NULL,
     description TEXT NOT NULL,
-    tax REAL NOT NULL CHECK(tax >= 0),
-    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    tax INTEGER NOT NULL CHECK(tax >= 0),
+    created_at INTEGER NOT NULL DEFAULT {EPOCH_NOW_SQL},
     FOREIGN KEY (payer_id) REFERENCES users(id)
 );
-CREATE INDEX IF NOT EXISTS idx_bills_payer_id ON bills(payer_id);
+-- Serves get_by_user's WHERE payer_id = ? ORDER BY created_at DESC without a
+-- sort step, and payer foreign key checks via its leading column
+CREATE INDEX IF NOT EXISTS idx_bills_payer_created ON bills(payer_id, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_bills_created_at ON bills(created_at DESC);
 
 -- Items table
@@ -28,28 +141,31 @@ CREATE TABLE IF NOT EXISTS items (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     bill_id INTEGER NOT NULL,
     description TEXT NOT NULL,
-    cost REAL NOT NULL CHECK(cost > 0),
+    cost INTEGER NOT NULL CHECK(cost > 0),
     FOREIGN KEY (bill_id) REFERENCES bills(id) ON DELETE CASCADE
 );
-CREATE INDEX IF NOT EXISTS idx_items_bill_id ON items(bill_id);
+-- Covers the balance aggregate's join and per-bill subtotal without reading rows
+CREATE INDEX IF NOT EXISTS idx_items_bill_cost ON items(bill_id, cost);
 
 -- Assignments table
 CREATE TABLE IF NOT EXISTS assignments (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     item_id INTEGER NOT NULL,
     user_id INTEGER NOT NULL,
-    fraction REAL NOT NULL CHECK(fraction > 0 AND fraction <= 1),
+    fraction INTEGER NOT NULL CHECK(fraction > 0 AND fraction <= 1000000),
     FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
     FOREIGN KEY (user_id) REFERENCES users(id),
     UNIQUE(item_id, user_id)
 );
-CREATE INDEX IF NOT EXISTS idx_assignments_item_id ON assignments(item_id);
+-- Covers the balance aggregate's item -> (user, fraction) lookups
+CREATE INDEX IF NOT EXISTS idx_assignments_item_share
+    ON assignments(item_id, user_id, fraction);
 CREATE INDEX IF NOT EXISTS idx_assignments_user_id ON assignments(user_id);
-
+{FRACTION_TRIGGERS_SQL}
 -- Settlements table
 CREATE TABLE IF NOT EXISTS settlements (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    settled_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    settled_at INTEGER NOT NULL DEFAULT {EPOCH_NOW_SQL},
     note TEXT
 );
 CREATE INDEX IF NOT EXISTS idx_settlements_settled_at ON settlements(settled_at DESC);
@@ -59,5 +175,123 @@ CREATE TABLE IF NOT EXISTS schema_version (
     version INTEGER PRIMARY KEY,
     applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
-INSERT OR IGNORE INTO schema_version (version) VALUES (1);
+INSERT OR IGNORE INTO schema_version (version) VALUES ({SCHEMA_VERSION});
 """
+
+# Upgrade scripts keyed by the version they migrate *to*. Each runs against a
+# database at the previous version; SCHEMA_SQL is applied afterwards to
+# (re)create indexes. Column type changes use SQLite's documented
+# create-copy-drop-rename procedure with foreign keys disabled.
+MIGRATIONS: dict[int, str] = {
+    2: """
+PRAGMA foreign_keys = OFF;
+BEGIN;
+
+CREATE TABLE bills_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payer_id INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    tax INTEGER NOT NULL CHECK(tax >= 0),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (payer_id) REFERENCES users(id)
+);
+INSERT INTO bills_new (id, payer_id, description, tax, created_at)
+    SELECT id, payer_id, description, CAST(ROUND(tax * 100) AS INTEGER), created_at
+    FROM bills;
+DROP TABLE bills;
+ALTER TABLE bills_new RENAME TO bills;
+
+CREATE TABLE items_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    bill_id INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    cost INTEGER NOT NULL CHECK(cost > 0),
+    FOREIGN KEY (bill_id) REFERENCES bills(id) ON DELETE CASCADE
+);
+INSERT INTO items_new (id, bill_id, description, cost)
+    SELECT id, bill_id, description, CAST(ROUND(cost * 100) AS INTEGER) FROM items;
+DROP TABLE items;
+ALTER TABLE items_new RENAME TO items;
+
+CREATE TABLE assignments_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    fraction INTEGER NOT NULL CHECK(fraction > 0 AND fraction <= 1000000),
+    FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(id),
+    UNIQUE(item_id, user_id)
+);
+INSERT INTO assignments_new (id, item_id, user_id, fraction)
+    SELECT id, item_id, user_id, CAST(ROUND(fraction * 1000000) AS INTEGER)
+    FROM assignments;
+DROP TABLE assignments;
+ALTER TABLE assignments_new RENAME TO assignments;
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (2);
+COMMIT;
+PRAGMA foreign_keys = ON;
+""",
+    3: f"""
+BEGIN;
+{FRACTION_TRIGGERS_SQL}
+INSERT OR IGNORE INTO schema_version (version) VALUES (3);
+COMMIT;
+""",
+    4: """
+BEGIN;
+DROP INDEX IF EXISTS idx_bills_payer_id;
+CREATE INDEX IF NOT EXISTS idx_bills_payer_created ON bills(payer_id, created_at DESC);
+INSERT OR IGNORE INTO schema_version (version) VALUES (4);
+COMMIT;
+""",
+    5: f"""
+PRAGMA foreign_keys = OFF;
+BEGIN;
+
+CREATE TABLE users_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    created_at INTEGER NOT NULL DEFAULT {EPOCH_NOW_SQL}
+);
+INSERT INTO users_new (id, name, created_at)
+    SELECT id, name, {_text_to_epoch_sql("created_at")} FROM users;
+DROP TABLE users;
+ALTER TABLE users_new RENAME TO users;
+
+CREATE TABLE bills_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payer_id INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    tax INTEGER NOT NULL CHECK(tax >= 0),
+    created_at INTEGER NOT NULL DEFAULT {EPOCH_NOW_SQL},
+    FOREIGN KEY (payer_id) REFERENCES users(id)
+);
+INSERT INTO bills_new (id, payer_id, description, tax, created_at)
+    SELECT id, payer_id, description, tax, {_text_to_epoch_sql("created_at")}
+    FROM bills;
+DROP TABLE bills;
+ALTER TABLE bills_new RENAME TO bills;
+
+CREATE TABLE settlements_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    settled_at INTEGER NOT NULL DEFAULT {EPOCH_NOW_SQL},
+    note TEXT
+);
+INSERT INTO settlements_new (id, settled_at, note)
+    SELECT id, {_text_to_epoch_sql("settled_at")}, note FROM settlements;
+DROP TABLE settlements;
+ALTER TABLE settlements_new RENAME TO settlements;
+
+INSERT OR IGNORE INTO schema_version (version) VALUES (5);
+COMMIT;
+PRAGMA foreign_keys = ON;
+""",
+    6: """
+BEGIN;
+DROP INDEX IF EXISTS idx_items_bill_id;
+DROP INDEX IF EXISTS idx_assignments_item_id;
+INSERT OR IGNORE INTO schema_version (version) VALUES (6);
+COMMIT;
+""",
+}
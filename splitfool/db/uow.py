@@ -0,0 +1,87 @@
+"""Unit of work spanning several repository calls."""
+
+import functools
+import sqlite3
+from collections.abc import Callable
+from types import TracebackType
+from typing import Concatenate, ParamSpec, Protocol, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class UnitOfWork:
+    """Transaction boundary for a service operation.
+
+    Repositories never commit. The outermost unit of work takes SQLite's
+    write lock up front with BEGIN IMMEDIATE, so a competing writer is
+    turned away before any work is done rather than at commit time, and
+    commits once on exit (one fsync for the whole operation) or rolls back
+    if the block raised. A unit of work entered while a transaction is
+    already open joins it and leaves the commit to the outermost one.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        """Initialize a unit of work for a connection.
+
+        Args:
+            conn: Database connection
+        """
+        self.conn = conn
+        self._owner = False
+
+    def __enter__(self) -> "UnitOfWork":
+        """Begin a transaction unless one is already open.
+
+        Returns:
+            This unit of work
+        """
+        self._owner = not self.conn.in_transaction
+        if self._owner:
+            self.conn.execute("BEGIN IMMEDIATE")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Commit on success or roll back on error, if this unit began it.
+
+        Args:
+            exc_type: Exception type raised in the block, if any
+            exc: Exception raised in the block, if any
+            tb: Traceback of the exception, if any
+        """
+        if not self._owner:
+            return
+        if exc_type is None:
+            self.conn.commit()
+        else:
+            self.conn.rollback()
+
+
+class _HasConnection(Protocol):
+    conn: sqlite3.Connection
+
+
+S = TypeVar("S", bound=_HasConnection)
+
+
+def transactional(method: Callable[Concatenate[S, P], R]) -> Callable[Concatenate[S, P], R]:
+    """Run a service method inside a unit of work on its ``self.conn``.
+
+    Args:
+        method: Service method whose writes should commit together
+
+    Returns:
+        Wrapped method
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: S, *args: P.args, **kwargs: P.kwargs) -> R:
+        with UnitOfWork(self.conn):
+            return method(self, *args, **kwargs)
+
+    return wrapper
@@ -1,4 +1,10 @@
-"""Data models for Splitfool application."""
+"""Data models for Splitfool application.
+
+Models are frozen, slotted dataclasses. with_id() copies a model after an
+INSERT without dataclasses.replace's field reflection, and _from_db() builds
+one from a stored row. Both take data that was already validated, so models
+with a __post_init__ check set their slots directly instead of re-running it.
+"""
 
 from splitfool.models.assignment import Assignment
 from splitfool.models.balance import Balance
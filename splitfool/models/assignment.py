@@ -1,10 +1,13 @@
 """Assignment entity model."""
 
 from dataclasses import dataclass
+from dataclasses import replace as _dc_replace
 from decimal import Decimal
 
+from splitfool.utils.currency import ONE, ZERO
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Assignment:
     """Immutable assignment entity linking items to users with fractions.
 
@@ -26,7 +29,7 @@ class Assignment:
         Raises:
             ValueError: If assignment data is invalid
         """
-        if not (Decimal("0") < self.fraction <= Decimal("1")):
+        if not (ZERO < self.fraction <= ONE):
             raise ValueError("Fraction must be between 0 and 1")
 
     def replace(self, **kwargs: object) -> "Assignment":
@@ -38,5 +41,41 @@ class Assignment:
         Returns:
             New Assignment instance with updated fields
         """
-        from dataclasses import replace
-        return replace(self, **kwargs)
+        return _dc_replace(self, **kwargs)
+
+    def with_id(self, id: int | None) -> "Assignment":
+        """Create a copy of this Assignment with its database ID set.
+
+        Args:
+            id: Assigned database ID
+
+        Returns:
+            New Assignment instance with the given ID
+        """
+        return Assignment._from_db(id, self.item_id, self.user_id, self.fraction)
+
+    @classmethod
+    def _from_db(
+        cls,
+        id: int | None,
+        item_id: int,
+        user_id: int,
+        fraction: Decimal,
+    ) -> "Assignment":
+        """Build an Assignment from a stored row without re-running validation.
+
+        Args:
+            id: Stored row ID
+            item_id: ID of the assigned item
+            user_id: ID of the assigned user
+            fraction: Stored fraction of the item cost
+
+        Returns:
+            Assignment instance holding the given field values
+        """
+        assignment = object.__new__(cls)
+        object.__setattr__(assignment, "id", id)
+        object.__setattr__(assignment, "item_id", item_id)
+        object.__setattr__(assignment, "user_id", user_id)
+        object.__setattr__(assignment, "fraction", fraction)
+        return assignment
@@ -1,10 +1,13 @@
 """Balance entity model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from dataclasses import replace as _dc_replace
 from decimal import Decimal
 
+from splitfool.utils.currency import ZERO
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Balance:
     """Immutable balance entity representing debt between users.
 
@@ -14,11 +17,15 @@ class Balance:
         debtor_id: ID of user who owes money
         creditor_id: ID of user who is owed money
         amount: Net amount owed (always positive)
+        debtor_name: Display name of the debtor ("" if not resolved)
+        creditor_name: Display name of the creditor ("" if not resolved)
     """
 
     debtor_id: int
     creditor_id: int
     amount: Decimal
+    debtor_name: str = field(default="", compare=False)
+    creditor_name: str = field(default="", compare=False)
 
     def __post_init__(self) -> None:
         """Validate balance data.
@@ -26,7 +33,7 @@ class Balance:
         Raises:
             ValueError: If balance data is invalid
         """
-        if self.amount <= Decimal("0"):
+        if self.amount <= ZERO:
             raise ValueError("Balance amount must be positive")
         if self.debtor_id == self.creditor_id:
             raise ValueError("Debtor and creditor must be different users")
@@ -40,5 +47,36 @@ class Balance:
         Returns:
             New Balance instance with updated fields
         """
-        from dataclasses import replace
-        return replace(self, **kwargs)
+        return _dc_replace(self, **kwargs)
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        debtor_id: int,
+        creditor_id: int,
+        amount: Decimal,
+        debtor_name: str = "",
+        creditor_name: str = "",
+    ) -> "Balance":
+        """Build a Balance from netted debts without re-running validation.
+
+        Netting only emits positive amounts between distinct users, so the
+        service skips __init__ and __post_init__ and sets the slots directly.
+
+        Args:
+            debtor_id: ID of user who owes money
+            creditor_id: ID of user who is owed money
+            amount: Positive net amount owed
+            debtor_name: Display name of the debtor
+            creditor_name: Display name of the creditor
+
+        Returns:
+            Balance instance holding the given field values
+        """
+        balance = object.__new__(cls)
+        object.__setattr__(balance, "debtor_id", debtor_id)
+        object.__setattr__(balance, "creditor_id", creditor_id)
+        object.__setattr__(balance, "amount", amount)
+        object.__setattr__(balance, "debtor_name", debtor_name)
+        object.__setattr__(balance, "creditor_name", creditor_name)
+        return balance
@@ -1,11 +1,14 @@
 """Bill entity model."""
 
 from dataclasses import dataclass
+from dataclasses import replace as _dc_replace
 from datetime import datetime
 from decimal import Decimal
 
+from splitfool.utils.currency import ZERO
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Bill:
     """Immutable bill entity representing a single expense event.
 
@@ -29,7 +32,7 @@ class Bill:
         Raises:
             ValueError: If bill data is invalid
         """
-        if self.tax < Decimal("0"):
+        if self.tax < ZERO:
             raise ValueError("Tax must be non-negative")
         if len(self.description) > 500:
             raise ValueError("Description must be 500 characters or less")
@@ -43,5 +46,44 @@ class Bill:
         Returns:
             New Bill instance with updated fields
         """
-        from dataclasses import replace
-        return replace(self, **kwargs)
+        return _dc_replace(self, **kwargs)
+
+    def with_id(self, id: int | None) -> "Bill":
+        """Create a copy of this Bill with its database ID set.
+
+        Args:
+            id: Assigned database ID
+
+        Returns:
+            New Bill instance with the given ID
+        """
+        return Bill._from_db(id, self.payer_id, self.description, self.tax, self.created_at)
+
+    @classmethod
+    def _from_db(
+        cls,
+        id: int | None,
+        payer_id: int,
+        description: str,
+        tax: Decimal,
+        created_at: datetime,
+    ) -> "Bill":
+        """Build a Bill from a stored row without re-running validation.
+
+        Args:
+            id: Stored row ID
+            payer_id: ID of user who paid the bill
+            description: Stored description
+            tax: Stored tax amount
+            created_at: Stored creation timestamp
+
+        Returns:
+            Bill instance holding the given field values
+        """
+        bill = object.__new__(cls)
+        object.__setattr__(bill, "id", id)
+        object.__setattr__(bill, "payer_id", payer_id)
+        object.__setattr__(bill, "description", description)
+        object.__setattr__(bill, "tax", tax)
+        object.__setattr__(bill, "created_at", created_at)
+        return bill
@@ -1,10 +1,13 @@
 """Item entity model."""
 
 from dataclasses import dataclass
+from dataclasses import replace as _dc_replace
 from decimal import Decimal
 
+from splitfool.utils.currency import ZERO
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Item:
     """Immutable item entity representing a line item within a bill.
 
@@ -26,7 +29,7 @@ class Item:
         Raises:
             ValueError: If item data is invalid
         """
-        if self.cost <= Decimal("0"):
+        if self.cost <= ZERO:
             raise ValueError("Item cost must be positive")
         if len(self.description) > 200:
             raise ValueError("Description must be 200 characters or less")
@@ -40,5 +43,35 @@ class Item:
         Returns:
             New Item instance with updated fields
         """
-        from dataclasses import replace
-        return replace(self, **kwargs)
+        return _dc_replace(self, **kwargs)
+
+    def with_id(self, id: int | None) -> "Item":
+        """Create a copy of this Item with its database ID set.
+
+        Args:
+            id: Assigned database ID
+
+        Returns:
+            New Item instance with the given ID
+        """
+        return Item._from_db(id, self.bill_id, self.description, self.cost)
+
+    @classmethod
+    def _from_db(cls, id: int | None, bill_id: int, description: str, cost: Decimal) -> "Item":
+        """Build an Item from a stored row without re-running validation.
+
+        Args:
+            id: Stored row ID
+            bill_id: ID of parent bill
+            description: Stored description
+            cost: Stored item cost
+
+        Returns:
+            Item instance holding the given field values
+        """
+        item = object.__new__(cls)
+        object.__setattr__(item, "id", id)
+        object.__setattr__(item, "bill_id", bill_id)
+        object.__setattr__(item, "description", description)
+        object.__setattr__(item, "cost", cost)
+        return item
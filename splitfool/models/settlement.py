@@ -1,10 +1,11 @@
 """Settlement entity model."""
 
 from dataclasses import dataclass
+from dataclasses import replace as _dc_replace
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settlement:
     """Immutable settlement record representing bulk balance clearing.
 
@@ -27,5 +28,15 @@ class Settlement:
         Returns:
             New Settlement instance with updated fields
         """
-        from dataclasses import replace
-        return replace(self, **kwargs)
+        return _dc_replace(self, **kwargs)
+
+    def with_id(self, id: int | None) -> "Settlement":
+        """Create a copy of this Settlement with its database ID set.
+
+        Args:
+            id: Assigned database ID
+
+        Returns:
+            New Settlement instance with the given ID
+        """
+        return Settlement(id, self.settled_at, self.note)
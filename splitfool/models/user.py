@@ -1,10 +1,11 @@
 """User entity model."""
 
 from dataclasses import dataclass
+from dataclasses import replace as _dc_replace
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class User:
     """Immutable user entity representing a participant in bill splitting.
 
@@ -38,5 +39,33 @@ class User:
         Returns:
             New User instance with updated fields
         """
-        from dataclasses import replace
-        return replace(self, **kwargs)
+        return _dc_replace(self, **kwargs)
+
+    def with_id(self, id: int | None) -> "User":
+        """Create a copy of this User with its database ID set.
+
+        Args:
+            id: Assigned database ID
+
+        Returns:
+            New User instance with the given ID
+        """
+        return User._from_db(id, self.name, self.created_at)
+
+    @classmethod
+    def _from_db(cls, id: int | None, name: str, created_at: datetime) -> "User":
+        """Build a User from a stored row without re-running validation.
+
+        Args:
+            id: Stored row ID
+            name: Stored display name
+            created_at: Stored creation timestamp
+
+        Returns:
+            User instance holding the given field values
+        """
+        user = object.__new__(cls)
+        object.__setattr__(user, "id", id)
+        object.__setattr__(user, "name", name)
+        object.__setattr__(user, "created_at", created_at)
+        return user
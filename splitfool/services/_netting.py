@@ -0,0 +1,343 @@
+"""Pairwise netting and cycle cancellation of debts held as integer cents.
+
+NumPy and Numba are optional dependencies (``pip install splitfool[fast]``).
+When NumPy is available, larger debt sets are netted over a dense ``int64``
+user x user matrix. When Numba is also available, very large graphs run
+through JIT-compiled loop kernels over the same matrix; Numba is imported
+only the first time such a graph is seen, so ordinary runs never pay its
+import cost. Otherwise a pure Python pass over the sparse debt mapping is
+used. All paths produce identical results.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+# Below this many debt edges the array setup costs more than it saves
+NUMPY_MIN_EDGES = 64
+
+# Below this many debt edges JIT dispatch isn't worth loading Numba for
+JIT_MIN_EDGES = 2048
+
+# (pairwise kernel, cycle kernel) once compiled; False if Numba is unavailable
+_jit_kernels: tuple[Callable[..., Any], Callable[..., Any]] | None | bool = None
+
+
+def net_pairwise(
+    gross_debts: dict[tuple[int, int], int], tolerance: int = 1
+) -> dict[tuple[int, int], int]:
+    """Net mutual debts between each pair of users.
+
+    Args:
+        gross_debts: Mapping of (debtor_id, creditor_id) -> cents owed
+        tolerance: Net amounts at or below this many cents are discarded
+
+    Returns:
+        Mapping of (debtor_id, creditor_id) -> positive net cents owed
+    """
+    if np is not None and len(gross_debts) >= NUMPY_MIN_EDGES:
+        kernels = _load_jit_kernels() if len(gross_debts) >= JIT_MIN_EDGES else None
+        if kernels is not None:
+            user_ids, debt = _to_matrix(gross_debts)
+            return _from_matrix(user_ids, kernels[0](debt, tolerance))
+        return net_pairwise_numpy(gross_debts, tolerance)
+    return net_pairwise_python(gross_debts, tolerance)
+
+
+def net_pairwise_python(
+    gross_debts: dict[tuple[int, int], int], tolerance: int = 1
+) -> dict[tuple[int, int], int]:
+    """Net mutual debts with a single pass over the sparse mapping.
+
+    Args:
+        gross_debts: Mapping of (debtor_id, creditor_id) -> cents owed
+        tolerance: Net amounts at or below this many cents are discarded
+
+    Returns:
+        Mapping of (debtor_id, creditor_id) -> positive net cents owed
+    """
+    net: dict[tuple[int, int], int] = {}
+
+    for pair, amount in gross_debts.items():
+        debtor_id, creditor_id = pair
+        reverse_pair = (creditor_id, debtor_id)
+        reverse = gross_debts.get(reverse_pair)
+        if reverse is not None:
+            # Mutual pairs are decided once, from the lower debtor's edge
+            if creditor_id < debtor_id:
+                continue
+            amount -= reverse
+
+        # The key tuples are reused so each edge costs one lookup
+        if amount > tolerance:
+            net[pair] = amount
+        elif amount < -tolerance:
+            net[reverse_pair] = -amount
+
+    return net
+
+
+def net_pairwise_numpy(
+    gross_debts: dict[tuple[int, int], int], tolerance: int = 1
+) -> dict[tuple[int, int], int]:
+    """Net mutual debts with vectorized operations over a debt matrix.
+
+    Args:
+        gross_debts: Mapping of (debtor_id, creditor_id) -> cents owed
+        tolerance: Net amounts at or below this many cents are discarded
+
+    Returns:
+        Mapping of (debtor_id, creditor_id) -> positive net cents owed
+
+    Raises:
+        RuntimeError: If NumPy is not installed
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required for vectorized netting")
+    if not gross_debts:
+        return {}
+
+    user_ids, debt = _to_matrix(gross_debts)
+
+    # Antisymmetric: at most one direction per pair is above tolerance
+    net = debt - debt.T
+    return _from_matrix(user_ids, np.where(net > tolerance, net, 0))
+
+
+def cancel_cycles(net_debts: dict[tuple[int, int], int]) -> dict[tuple[int, int], int]:
+    """Remove directed debt cycles without changing anyone's net position.
+
+    Repeatedly finds a cycle such as A -> B -> C -> A, subtracts its smallest
+    edge from every edge on it and drops edges that reach zero. Each pass
+    removes at least one edge, so the loop stops once the graph is acyclic.
+
+    Args:
+        net_debts: Mapping of (debtor_id, creditor_id) -> positive cents owed
+
+    Returns:
+        Mapping of (debtor_id, creditor_id) -> positive cents owed, acyclic
+    """
+    if np is not None and len(net_debts) >= JIT_MIN_EDGES:
+        kernels = _load_jit_kernels()
+        if kernels is not None:
+            user_ids, net = _to_matrix(net_debts)
+            return _from_matrix(user_ids, kernels[1](net))
+
+    graph: dict[int, dict[int, int]] = {}
+    for (debtor_id, creditor_id), amount in net_debts.items():
+        graph.setdefault(debtor_id, {})[creditor_id] = amount
+
+    while (cycle := _find_cycle(graph)) is not None:
+        edges = list(zip(cycle, cycle[1:] + cycle[:1], strict=True))
+        delta = min(graph[debtor][creditor] for debtor, creditor in edges)
+
+        for debtor, creditor in edges:
+            remaining = graph[debtor][creditor] - delta
+            if remaining:
+                graph[debtor][creditor] = remaining
+            else:
+                del graph[debtor][creditor]
+
+    return {
+        (debtor_id, creditor_id): amount
+        for debtor_id, creditors in graph.items()
+        for creditor_id, amount in creditors.items()
+    }
+
+
+def _find_cycle(graph: dict[int, dict[int, int]]) -> list[int] | None:
+    """Find one directed cycle with an iterative depth-first search.
+
+    Args:
+        graph: Adjacency mapping of debtor_id -> {creditor_id: amount}
+
+    Returns:
+        Users along the cycle in edge order, or None if the graph is acyclic
+    """
+    on_stack, done = 1, 2
+    state: dict[int, int] = {}
+
+    # Sorted traversal keeps the simplified result deterministic
+    for root in sorted(graph):
+        if root in state:
+            continue
+
+        path = [root]
+        state[root] = on_stack
+        frontier = [iter(sorted(graph[root]))]
+
+        while frontier:
+            for nxt in frontier[-1]:
+                seen = state.get(nxt)
+                if seen == on_stack:
+                    return path[path.index(nxt) :]
+                if seen is None:
+                    state[nxt] = on_stack
+                    path.append(nxt)
+                    frontier.append(iter(sorted(graph.get(nxt, {}))))
+                    break
+            else:
+                state[path.pop()] = done
+                frontier.pop()
+
+    return None
+
+
+def _to_matrix(debts: dict[tuple[int, int], int]) -> tuple[list[int], Any]:
+    """Place sparse debts in a dense int64 debtor x creditor matrix.
+
+    Args:
+        debts: Mapping of (debtor_id, creditor_id) -> cents owed
+
+    Returns:
+        Tuple of (sorted user IDs, matrix indexed by position in that list)
+    """
+    user_ids = sorted({user_id for pair in debts for user_id in pair})
+    index = {user_id: i for i, user_id in enumerate(user_ids)}
+
+    pairs = np.array([(index[d], index[c]) for d, c in debts], dtype=np.intp)
+    amounts = np.fromiter(debts.values(), dtype=np.int64, count=len(debts))
+
+    matrix = np.zeros((len(user_ids), len(user_ids)), dtype=np.int64)
+    if len(debts):
+        np.add.at(matrix, (pairs[:, 0], pairs[:, 1]), amounts)
+    return user_ids, matrix
+
+
+def _from_matrix(user_ids: list[int], matrix: Any) -> dict[tuple[int, int], int]:
+    """Read the positive entries of a debt matrix back into a sparse mapping.
+
+    Args:
+        user_ids: User IDs in matrix index order
+        matrix: Debtor x creditor matrix of cents owed
+
+    Returns:
+        Mapping of (debtor_id, creditor_id) -> positive cents owed
+    """
+    debtors, creditors = np.nonzero(matrix > 0)
+    return {
+        (user_ids[d], user_ids[c]): int(matrix[d, c])
+        for d, c in zip(debtors.tolist(), creditors.tolist(), strict=True)
+    }
+
+
+def pairwise_dense(debt: Any, tolerance: int) -> Any:
+    """Net a dense debt matrix pair by pair with explicit loops.
+
+    Written as plain loops so Numba can compile it; also runs uncompiled.
+
+    Args:
+        debt: int64 debtor x creditor matrix of gross cents owed
+        tolerance: Net amounts at or below this many cents are discarded
+
+    Returns:
+        int64 matrix holding each pair's positive net debt in one direction
+    """
+    n = debt.shape[0]
+    net = np.zeros((n, n), dtype=np.int64)
+    for i in range(n):
+        for j in range(i + 1, n):
+            amount = debt[i, j] - debt[j, i]
+            if amount > tolerance:
+                net[i, j] = amount
+            elif amount < -tolerance:
+                net[j, i] = -amount
+    return net
+
+
+def cancel_cycles_dense(net: Any) -> Any:
+    """Cancel directed cycles in a dense debt matrix with explicit loops.
+
+    Mirrors cancel_cycles: an iterative DFS visiting users and creditors in
+    index order finds one cycle, its smallest edge is subtracted along it,
+    and the search restarts until none remain. Written as plain loops so
+    Numba can compile it; also runs uncompiled.
+
+    Args:
+        net: int64 debtor x creditor matrix of positive cents owed
+
+    Returns:
+        Acyclic int64 matrix with every user's net position unchanged
+    """
+    net = net.copy()
+    n = net.shape[0]
+    state = np.zeros(n, dtype=np.int8)  # 0 unvisited, 1 on stack, 2 done
+    path = np.zeros(n, dtype=np.int64)
+    next_col = np.zeros(n, dtype=np.int64)
+
+    while True:
+        state[:] = 0
+        cycle_start = -1
+        depth = -1
+
+        for root in range(n):
+            if state[root] != 0:
+                continue
+            depth = 0
+            path[0] = root
+            next_col[0] = 0
+            state[root] = 1
+
+            while depth >= 0:
+                u = path[depth]
+                j = next_col[depth]
+                advanced = False
+                while j < n:
+                    if net[u, j] > 0:
+                        if state[j] == 1:
+                            # Back edge: the cycle runs from j's position to u
+                            for k in range(depth + 1):
+                                if path[k] == j:
+                                    cycle_start = k
+                                    break
+                            break
+                        if state[j] == 0:
+                            next_col[depth] = j + 1
+                            depth += 1
+                            path[depth] = j
+                            next_col[depth] = 0
+                            state[j] = 1
+                            advanced = True
+                            break
+                    j += 1
+                if cycle_start >= 0:
+                    break
+                if not advanced:
+                    state[u] = 2
+                    depth -= 1
+            if cycle_start >= 0:
+                break
+
+        if cycle_start < 0:
+            return net
+
+        delta = net[path[depth], path[cycle_start]]
+        for k in range(cycle_start, depth):
+            delta = min(delta, net[path[k], path[k + 1]])
+        for k in range(cycle_start, depth):
+            net[path[k], path[k + 1]] -= delta
+        net[path[depth], path[cycle_start]] -= delta
+
+
+def _load_jit_kernels() -> tuple[Callable[..., Any], Callable[..., Any]] | None:
+    """Compile the dense kernels with Numba on first use.
+
+    Returns:
+        Tuple of (pairwise kernel, cycle kernel), or None without Numba
+    """
+    global _jit_kernels
+    if _jit_kernels is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _jit_kernels = False
+        else:
+            _jit_kernels = (
+                njit(cache=True)(pairwise_dense),
+                njit(cache=True)(cancel_cycles_dense),
+            )
+    return _jit_kernels or None
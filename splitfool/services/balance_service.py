@@ -1,18 +1,19 @@
 """Balance service for calculating and managing balances."""
 
 import sqlite3
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 
-from splitfool.db.repositories.assignment_repository import AssignmentRepository
-from splitfool.db.repositories.bill_repository import BillRepository
-from splitfool.db.repositories.item_repository import ItemRepository
-from splitfool.db.repositories.settlement_repository import SettlementRepository
-from splitfool.db.repositories.user_repository import UserRepository
+from splitfool.db.connection import change_stamp
+from splitfool.db.repositories.registry import Repositories
+from splitfool.db.uow import transactional
 from splitfool.models.balance import Balance
 from splitfool.models.settlement import Settlement
-from splitfool.services.bill_service import BillService
+from splitfool.services._netting import cancel_cycles, net_pairwise
+from splitfool.services.bill_service import share_cents
+from splitfool.utils.currency import from_cents
 
 
 @dataclass(frozen=True)
@@ -26,86 +27,125 @@ class BalancePreview:
 class BalanceService:
     """Service for balance calculation and settlement operations."""
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(
+        self, connection: sqlite3.Connection, repositories: Repositories | None = None
+    ) -> None:
         """Initialize service with database connection.
 
         Args:
             connection: SQLite database connection
+            repositories: Repositories shared with other services; created
+                for the connection if omitted
         """
+        repos = repositories or Repositories.for_connection(connection)
         self.conn = connection
-        self.bill_repo = BillRepository(connection)
-        self.item_repo = ItemRepository(connection)
-        self.assignment_repo = AssignmentRepository(connection)
-        self.user_repo = UserRepository(connection)
-        self.settlement_repo = SettlementRepository(connection)
-        self.bill_service = BillService(connection)
-
-    def get_all_balances(self) -> list[Balance]:
+        self.bill_repo = repos.bills
+        self.item_repo = repos.items
+        self.assignment_repo = repos.assignments
+        self.user_repo = repos.users
+        self.settlement_repo = repos.settlements
+        # Balances by simplify flag, valid while the change stamp is unchanged
+        self._balance_cache: dict[bool, list[Balance]] = {}
+        self._balance_stamp: tuple[int, int] | None = None
+
+    def get_all_balances(self, simplify: bool = False) -> list[Balance]:
         """Calculate net balances from all bills since last settlement.
 
+        Args:
+            simplify: Also cancel directed debt cycles (A owes B owes C owes A),
+                leaving fewer balances with the same net position per user
+
         Returns:
             List of non-zero balances showing who owes whom
 
         Algorithm:
-            1. Get last settlement date (or beginning of time if none)
-            2. Get all bills since that date
-            3. For each bill, calculate each user's share
-            4. Track what each user owes the payer
-            5. Net out mutual debts
-            6. Return only positive balances
+            1. In a single SQL query over bills since the last settlement
+               (or all bills if none), share out each participant's item
+               costs plus proportional tax in integer cents, and sum what
+               each user owes each payer
+            2. Net out mutual debts (and debt cycles when simplifying)
+            3. Return only positive balances
+
+        Results are reused until any row in the database changes, whether
+        written by this connection (a bill, a settlement, a rename) or
+        committed by another one.
         """
-        # Get last settlement date
-        last_settlement = self.settlement_repo.get_latest()
-        cutoff_date = (
-            last_settlement.settled_at if last_settlement else datetime.min
-        )
+        return list(self._cached_balances(simplify))
+
+    def _cached_balances(self, simplify: bool = False) -> list[Balance]:
+        """Get the cached balance list, recomputing it if the data changed.
 
-        # Get all bills since last settlement
-        bills = self.bill_repo.get_since_date(cutoff_date)
+        Args:
+            simplify: Also cancel directed debt cycles
+
+        Returns:
+            The cache's own list; callers must not modify it
+        """
+        stamp = change_stamp(self.conn)
+        if stamp != self._balance_stamp:
+            self._balance_cache.clear()
+            self._balance_stamp = stamp
+        balances = self._balance_cache.get(simplify)
+        if balances is None:
+            balances = self._balance_cache[simplify] = self._compute_balances(simplify)
+        return balances
+
+    def _compute_balances(self, simplify: bool) -> list[Balance]:
+        """Calculate net balances since the last settlement from the database.
 
-        if not bills:
+        Args:
+            simplify: Also cancel directed debt cycles
+
+        Returns:
+            List of non-zero balances showing who owes whom
+        """
+        gross_debts = self.assignment_repo.aggregate_unsettled_debts()
+        if gross_debts is None:
+            # Amounts too large for SQLite's integers; share out in Python
+            rows = self.assignment_repo.aggregate_unsettled_debt_units()
+            gross_debts = self._gross_debts(rows)
+
+        if not gross_debts:
             return []
 
-        # Track gross debts: (debtor_id, creditor_id) -> amount
-        gross_debts: dict[tuple[int, int], Decimal] = {}
+        # Net out mutual debts
+        return self._net_balances(gross_debts, simplify=simplify)
+
+    def _gross_debts(
+        self, rows: list[tuple[int, int, int, int, int]]
+    ) -> dict[tuple[int, int], int]:
+        """Sum what each participant owes each payer, in integer cents.
 
-        # Calculate debts for each bill
-        for bill in bills:
-            assert bill.id is not None, "Bill must have ID"
+        Args:
+            rows: (payer_id, user_id, units, subtotal_cents, tax_cents) rows,
+                one per bill participant
 
-            # Get all users involved in this bill
-            items = self.item_repo.get_by_bill(bill.id)
-            user_ids: set[int] = set()
-            for item in items:
-                assert item.id is not None, "Item must have ID"
-                assignments = self.assignment_repo.get_by_item(item.id)
-                user_ids.update(a.user_id for a in assignments)
+        Returns:
+            Mapping of (debtor_id, creditor_id) -> gross cents owed
+        """
+        gross_debts: defaultdict[tuple[int, int], int] = defaultdict(int)
 
-            # Calculate each user's share and debt to payer
-            for user_id in user_ids:
-                if user_id == bill.payer_id:
-                    # Payer doesn't owe themselves
-                    continue
+        for payer_id, user_id, units, subtotal_cents, tax_cents in rows:
+            if user_id == payer_id:
+                # Payer doesn't owe themselves
+                continue
 
-                user_share = self.bill_service.calculate_user_share(bill.id, user_id)
+            user_share = share_cents(units, subtotal_cents, tax_cents)
 
-                if user_share > Decimal("0"):
-                    # User owes the payer
-                    debt_key = (user_id, bill.payer_id)
-                    gross_debts[debt_key] = (
-                        gross_debts.get(debt_key, Decimal("0")) + user_share
-                    )
+            if user_share > 0:
+                # User owes the payer
+                gross_debts[user_id, payer_id] += user_share
 
-        # Net out mutual debts
-        return self._net_balances(gross_debts)
+        return gross_debts
 
     def _net_balances(
-        self, gross_debts: dict[tuple[int, int], Decimal]
+        self, gross_debts: dict[tuple[int, int], int], simplify: bool = False
     ) -> list[Balance]:
         """Net out mutual debts and return only non-zero balances.
 
         Args:
-            gross_debts: Mapping of (debtor_id, creditor_id) -> amount
+            gross_debts: Mapping of (debtor_id, creditor_id) -> amount in cents
+            simplify: Cancel directed cycles after pairwise netting
 
         Returns:
             List of net balances with positive amounts only
@@ -117,47 +157,35 @@ class BalanceService:
         - Result: Alice owes Bob $20 (single net balance)
 
         Steps:
-        1. Iterate through all gross debts (debtor → creditor relationships)
-        2. For each debt, check if reverse debt exists (creditor → debtor)
-        3. Calculate net amount = forward_debt - reverse_debt
-        4. If net > $0.01: keep as forward balance (A owes B)
-        5. If net < -$0.01: keep as reverse balance (B owes A)
-        6. If |net| ≤ $0.01: discard (debts cancel out within rounding tolerance)
-        7. Mark both directions as processed to avoid duplicate processing
-
-        This reduces the number of balances users need to track and simplifies
-        settlement by eliminating circular debts.
-        """
-        net_balances: dict[tuple[int, int], Decimal] = {}
+        1. Place gross debts in a debtor x creditor matrix
+        2. Subtract its transpose: net = forward_debt - reverse_debt
+        3. If net > 1 cent: keep as forward balance (A owes B)
+        4. If |net| <= 1 cent: discard (debts cancel out within rounding tolerance)
 
-        # Track processed pairs to avoid processing (A,B) and (B,A) separately
-        processed: set[tuple[int, int]] = set()
+        The matrix is built with NumPy when installed; see
+        splitfool.services._netting for the pure Python fallback.
 
-        for (debtor_id, creditor_id), amount in gross_debts.items():
-            if (debtor_id, creditor_id) in processed:
-                continue
-
-            # Check for reverse debt (creditor owes debtor)
-            reverse_debt = gross_debts.get((creditor_id, debtor_id), Decimal("0"))
-
-            # Net out the mutual debts
-            # Example: A owes B $50, B owes A $30 → net = $50 - $30 = $20 (A owes B)
-            net_amount = amount - reverse_debt
-
-            if net_amount > Decimal("0.01"):  # Significant debt forward direction
-                net_balances[(debtor_id, creditor_id)] = net_amount
-            elif net_amount < Decimal("-0.01"):  # Significant debt reverse direction
-                net_balances[(creditor_id, debtor_id)] = -net_amount
-            # else: debts cancel out within $0.01 tolerance, skip
+        With simplify, any remaining cycle A -> B -> C -> A has its smallest
+        edge subtracted from every edge on it until the debt graph is acyclic.
+        """
+        net_balances = net_pairwise(gross_debts)
+        if simplify:
+            net_balances = cancel_cycles(net_balances)
 
-            # Mark both directions as processed to prevent reprocessing
-            processed.add((debtor_id, creditor_id))
-            processed.add((creditor_id, debtor_id))
+        # Resolve every participant's name with one query
+        names = self.user_repo.get_names(sorted({uid for pair in net_balances for uid in pair}))
 
-        # Convert to Balance objects with stable sort
+        # Convert to Balance objects with stable sort; netting already
+        # guarantees positive amounts between distinct users
         return [
-            Balance(debtor_id=debtor, creditor_id=creditor, amount=amt)
-            for (debtor, creditor), amt in sorted(net_balances.items())
+            Balance._from_trusted(
+                debtor,
+                creditor,
+                from_cents(cents),
+                names.get(debtor, ""),
+                names.get(creditor, ""),
+            )
+            for (debtor, creditor), cents in sorted(net_balances.items())
         ]
 
     def get_user_balances(self, user_id: int) -> tuple[list[Balance], list[Balance]]:
@@ -171,10 +199,16 @@ class BalanceService:
                 - debts: list of balances where user is debtor (owes money)
                 - credits: list of balances where user is creditor (is owed money)
         """
-        all_balances = self.get_all_balances()
+        debts: list[Balance] = []
+        credits: list[Balance] = []
 
-        debts = [b for b in all_balances if b.debtor_id == user_id]
-        credits = [b for b in all_balances if b.creditor_id == user_id]
+        # One pass over the cached balances, without copying them first; a
+        # balance never has the same user on both sides
+        for balance in self._cached_balances():
+            if balance.debtor_id == user_id:
+                debts.append(balance)
+            elif balance.creditor_id == user_id:
+                credits.append(balance)
 
         return debts, credits
 
@@ -187,20 +221,30 @@ class BalanceService:
         Returns:
             True if user has any debts or credits
         """
-        debts, credits = self.get_user_balances(user_id)
-        return len(debts) > 0 or len(credits) > 0
-
-    def preview_settlement(self) -> BalancePreview:
+        # Pairwise netting only offsets the two directions of a pair, so the
+        # user's own pairs decide; no other debts need to be computed
+        gross_debts = self.assignment_repo.aggregate_unsettled_debts(user_id)
+        if gross_debts is None:
+            debts, credits = self.get_user_balances(user_id)
+            return len(debts) > 0 or len(credits) > 0
+        return bool(net_pairwise(gross_debts))
+
+    def preview_settlement(self, simplify: bool = False) -> BalancePreview:
         """Preview current balances that would be cleared by settlement.
 
+        Args:
+            simplify: Show balances with debt cycles cancelled, as in
+                get_all_balances
+
         Returns:
             Preview showing all current balances and total debt amount
         """
-        balances = self.get_all_balances()
+        balances = self.get_all_balances(simplify=simplify)
         total_debts = sum((b.amount for b in balances), Decimal("0"))
 
         return BalancePreview(balances=balances, total_debts=total_debts)
 
+    @transactional
     def settle_all_balances(self, note: str = "") -> Settlement:
         """Settle all outstanding balances.
 
@@ -1,17 +1,26 @@
 """Bill service for business logic operations."""
 
 import sqlite3
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
-from splitfool.db.repositories.assignment_repository import AssignmentRepository
-from splitfool.db.repositories.bill_repository import BillRepository
-from splitfool.db.repositories.item_repository import ItemRepository
-from splitfool.db.repositories.user_repository import UserRepository
+from splitfool.db.repositories.bill_repository import BillDetails
+from splitfool.db.repositories.registry import Repositories
+from splitfool.db.uow import UnitOfWork
 from splitfool.models.assignment import Assignment
 from splitfool.models.bill import Bill
 from splitfool.models.item import Item
+from splitfool.utils.currency import (
+    FRACTION_TOLERANCE,
+    ONE,
+    PPM_ONE,
+    ZERO,
+    from_cents,
+    to_cents,
+    to_ppm,
+)
 from splitfool.utils.errors import BillNotFoundError, UserNotFoundError, ValidationError
 
 
@@ -50,6 +59,11 @@ class BillDetail:
     items: list[tuple[Item, list[Assignment]]]
     payer_name: str
     calculated_shares: dict[int, Decimal]
+    user_names: dict[int, str] = field(default_factory=dict)  # user_id -> name
+    # The same data with names resolved, in display order, for views to format as-is
+    share_rows: list[tuple[str, Decimal]] = field(default_factory=list)  # (user_name, amount)
+    # (description, cost, [(user_name, fraction), ...]) per item
+    item_rows: list[tuple[str, Decimal, list[tuple[str, Decimal]]]] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -64,20 +78,50 @@ class BillPreview:
     user_shares: dict[str, Decimal]  # user_name -> amount
 
 
+def share_cents(user_units: int, subtotal_cents: int, tax_cents: int) -> int:
+    """Compute a user's share of a bill, including proportional tax, in cents.
+
+    All inputs are integers so the calculation is exact; the result is
+    rounded half-up to the cent exactly once.
+
+    Formula: share = user_items + total_tax × (user_items / total_items)
+                   = user_items × (total_items + total_tax) / total_items
+
+    Args:
+        user_units: User's portion of item costs in cents × ppm
+            (sum of item_cost_cents × fraction_ppm)
+        subtotal_cents: Total cost of all items on the bill in cents
+        tax_cents: Total tax/tip/fees on the bill in cents
+
+    Returns:
+        User's total share in cents (zero when the bill has no items)
+    """
+    if subtotal_cents <= 0:
+        return 0  # No items means no share and no tax
+    numerator = user_units * (subtotal_cents + tax_cents)
+    denominator = PPM_ONE * subtotal_cents
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
 class BillService:
     """Service for bill-related operations."""
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(
+        self, connection: sqlite3.Connection, repositories: Repositories | None = None
+    ) -> None:
         """Initialize service with database connection.
 
         Args:
             connection: SQLite database connection
+            repositories: Repositories shared with other services; created
+                for the connection if omitted
         """
+        repos = repositories or Repositories.for_connection(connection)
         self.conn = connection
-        self.bill_repo = BillRepository(connection)
-        self.item_repo = ItemRepository(connection)
-        self.assignment_repo = AssignmentRepository(connection)
-        self.user_repo = UserRepository(connection)
+        self.bill_repo = repos.bills
+        self.item_repo = repos.items
+        self.assignment_repo = repos.assignments
+        self.user_repo = repos.users
 
     def create_bill(self, bill_input: BillInput) -> Bill:
         """Create a bill with items and assignments.
@@ -90,13 +134,21 @@ class BillService:
 
         Raises:
             ValidationError: If validation fails
-            UserNotFoundError: If payer doesn't exist
+            UserNotFoundError: If the payer or an assigned user doesn't exist
         """
+        # Look up the payer and every assigned user with one query instead of
+        # one per assignment
+        known_users = self.user_repo.get_names(
+            sorted(
+                {bill_input.payer_id}
+                | {a.user_id for item_input in bill_input.items for a in item_input.assignments}
+            )
+        )
+
         # Validate payer exists
-        payer = self.user_repo.get(bill_input.payer_id)
-        if payer is None:
+        if bill_input.payer_id not in known_users:
             raise UserNotFoundError(
-                f"Payer with ID {bill_input.payer_id} not found", code="BILL_002"
+                f"User with ID {bill_input.payer_id} not found", code="USER_004"
             )
 
         # Validate at least one item
@@ -104,21 +156,32 @@ class BillService:
             raise ValidationError("Bill must have at least one item", code="BILL_004")
 
         # Validate tax non-negative
-        if bill_input.tax < Decimal("0"):
+        if bill_input.tax < ZERO:
             raise ValidationError("Tax must be non-negative", code="BILL_003")
 
-        # Validate all items and assignments
-        for item_input in bill_input.items:
-            # Validate item cost positive
-            if item_input.cost <= Decimal("0"):
+        # Validate all items and assignments, collecting the rows to insert in
+        # the same pass: (description, cost) per item and (item position,
+        # user_id, fraction) per assignment
+        item_rows: list[tuple[str, Decimal]] = []
+        assignment_rows: list[tuple[int, int, Decimal]] = []
+        for position, item_input in enumerate(bill_input.items):
+            # Validate item cost positive once stored as whole cents
+            if to_cents(item_input.cost) <= 0:
                 raise ValidationError(
-                    f"Item '{item_input.description}' cost must be positive", code="ITEM_001"
+                    f"Item '{item_input.description}' cost must be positive (at least $0.01)",
+                    code="ITEM_001",
                 )
 
             # Validate item description non-empty
             if not item_input.description or item_input.description.isspace():
                 raise ValidationError("Item description cannot be empty", code="ITEM_002")
 
+            # Same limit as the Item model; rows are inserted without building one
+            if len(item_input.description) > 200:
+                raise ValidationError(
+                    "Item description must be 200 characters or less", code="ITEM_003"
+                )
+
             # Validate at least one assignment per item
             if not item_input.assignments:
                 raise ValidationError(
@@ -128,7 +191,7 @@ class BillService:
 
             # Validate fractions sum to 1.0
             total_fraction = sum(a.fraction for a in item_input.assignments)
-            if abs(total_fraction - Decimal("1.0")) > Decimal("0.001"):
+            if abs(total_fraction - ONE) > FRACTION_TOLERANCE:
                 raise ValidationError(
                     f"Item '{item_input.description}' fractions sum to {total_fraction}, "
                     f"must equal 1.0",
@@ -137,22 +200,25 @@ class BillService:
 
             # Validate all assigned users exist
             for assignment_input_item in item_input.assignments:
-                user = self.user_repo.get(assignment_input_item.user_id)
-                if user is None:
+                if assignment_input_item.user_id not in known_users:
                     raise UserNotFoundError(
                         f"User with ID {assignment_input_item.user_id} not found",
-                        code="BILL_002",
+                        code="USER_004",
                     )
 
                 # Validate fraction range
-                if not (Decimal("0") < assignment_input_item.fraction <= Decimal("1")):
+                if not (ZERO < assignment_input_item.fraction <= ONE):
                     raise ValidationError(
                         "Assignment fraction must be between 0 and 1", code="ASSIGN_001"
                     )
 
-        # Create bill, items, and assignments in transaction
-        try:
-            # Create bill
+                assignment_rows.append(
+                    (position, assignment_input_item.user_id, assignment_input_item.fraction)
+                )
+            item_rows.append((item_input.description, item_input.cost))
+
+        # Create bill, items, and assignments in one transaction
+        with UnitOfWork(self.conn):
             bill = Bill(
                 id=None,
                 payer_id=bill_input.payer_id,
@@ -162,31 +228,19 @@ class BillService:
             )
             created_bill = self.bill_repo.create(bill)
 
-            # Create items and assignments
-            for item_input in bill_input.items:
-                assert created_bill.id is not None, "Bill ID should be set after creation"
-                item = Item(
-                    id=None,
-                    bill_id=created_bill.id,
-                    description=item_input.description,
-                    cost=item_input.cost,
-                )
-                created_item = self.item_repo.create(item)
-                assert created_item.id is not None, "Item ID should be set after creation"
-
-                for assignment_input in item_input.assignments:
-                    assignment = Assignment(
-                        id=None,
-                        item_id=created_item.id,
-                        user_id=assignment_input.user_id,
-                        fraction=assignment_input.fraction,
-                    )
-                    self.assignment_repo.create(assignment)
+            assert created_bill.id is not None, "Bill ID should be set after creation"
 
-            return created_bill
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            # Create all items, then all their assignments, in one batch each;
+            # the rows were validated above, so no models are built to re-check them
+            item_ids = self.item_repo.create_rows(created_bill.id, item_rows)
+            self.assignment_repo.create_rows(
+                [
+                    (item_ids[position], user_id, fraction)
+                    for position, user_id, fraction in assignment_rows
+                ]
+            )
+
+        return created_bill
 
     def calculate_user_share(self, bill_id: int, user_id: int) -> Decimal:
         """Calculate a user's share of a bill.
@@ -196,7 +250,8 @@ class BillService:
             user_id: ID of user
 
         Returns:
-            User's total share (items + proportional tax)
+            User's total share (items + proportional tax); zero for users
+            not assigned to the bill
 
         Raises:
             BillNotFoundError: If bill doesn't exist
@@ -218,32 +273,35 @@ class BillService:
         This ensures tax is distributed fairly based on actual consumption,
         not equally among all participants.
         """
-        bill = self.bill_repo.get(bill_id)
-        if bill is None:
-            raise BillNotFoundError(f"Bill with ID {bill_id} not found", code="BILL_001")
+        return self.calculate_all_shares(bill_id).get(user_id, from_cents(0))
 
-        items = self.item_repo.get_by_bill(bill_id)
-        subtotal = Decimal("0")  # Total cost of all items
-        user_subtotal = Decimal("0")  # User's portion of item costs
+    def calculate_all_shares(self, bill_id: int) -> dict[int, Decimal]:
+        """Calculate every assigned user's share of a bill at once.
 
-        # Calculate user's share of item costs based on assigned fractions
-        for item in items:
-            subtotal += item.cost
-            assignments = self.assignment_repo.get_by_item(item.id)  # type: ignore
-            for assignment in assignments:
-                if assignment.user_id == user_id:
-                    # Add user's fractional share of this item
-                    # Example: $30 item × 0.5 fraction = $15 for this user
-                    user_subtotal += item.cost * assignment.fraction
+        Loads the bill's subtotal and tax and the per-user item costs once, so
+        callers needing several users' shares should prefer this over
+        repeated calculate_user_share calls.
 
-        # Distribute tax proportionally based on user's share of item costs
-        # Formula: user_tax = total_tax × (user_items / total_items)
-        if subtotal > Decimal("0"):
-            tax_share = bill.tax * (user_subtotal / subtotal)
-        else:
-            tax_share = Decimal("0")  # No items means no tax
+        Args:
+            bill_id: ID of bill
 
-        return user_subtotal + tax_share
+        Returns:
+            Mapping of user_id -> total share (items + proportional tax)
+
+        Raises:
+            BillNotFoundError: If bill doesn't exist
+        """
+        subtotal_cents, tax_cents = self.bill_repo.get_cost_cents(bill_id)
+
+        # Each user's portion of item costs (cost x fraction), aggregated in SQL
+        # Example: $30 item × 0.5 fraction = $15 for this user
+        user_units = self.assignment_repo.aggregate_user_cost_units(bill_id)
+
+        # Integer math throughout; converted to Decimal once at the boundary
+        return {
+            user_id: from_cents(share_cents(units, subtotal_cents, tax_cents))
+            for user_id, units in user_units.items()
+        }
 
     def calculate_total_cost(self, bill_id: int) -> Decimal:
         """Calculate total cost of a bill.
@@ -257,14 +315,23 @@ class BillService:
         Raises:
             BillNotFoundError: If bill doesn't exist
         """
-        bill = self.bill_repo.get(bill_id)
-        if bill is None:
-            raise BillNotFoundError(f"Bill with ID {bill_id} not found", code="BILL_001")
+        subtotal_cents, tax_cents = self.bill_repo.get_cost_cents(bill_id)
+        return from_cents(subtotal_cents + tax_cents)
 
-        items = self.item_repo.get_by_bill(bill_id)
-        subtotal = sum(item.cost for item in items)
+    def calculate_total_costs(self, bill_ids: list[int]) -> dict[int, Decimal]:
+        """Calculate the total cost of several bills with one query.
 
-        return subtotal + bill.tax
+        Args:
+            bill_ids: IDs of bills
+
+        Returns:
+            Mapping of bill_id -> total cost (items + tax); bills that
+            don't exist are left out
+        """
+        return {
+            bill_id: from_cents(cents)
+            for bill_id, cents in self.bill_repo.get_total_cents_many(bill_ids).items()
+        }
 
     def preview_bill(self, bill_input: BillInput) -> BillPreview:
         """Preview bill calculations without saving.
@@ -279,42 +346,41 @@ class BillService:
             ValidationError: If validation fails
             UserNotFoundError: If payer or assigned users don't exist
         """
-        # Validate payer exists
+        # Validate payer exists; raises UserNotFoundError if not
         payer = self.user_repo.get(bill_input.payer_id)
-        if payer is None:
-            raise UserNotFoundError(
-                f"Payer with ID {bill_input.payer_id} not found", code="BILL_002"
-            )
 
         # Validate items exist
         if not bill_input.items:
             raise ValidationError("Bill must have at least one item", code="BILL_004")
 
-        # Calculate subtotal
-        subtotal: Decimal = sum((item.cost for item in bill_input.items), Decimal("0"))
-        total = subtotal + bill_input.tax
-
-        # Calculate each user's share
-        user_shares: dict[int, Decimal] = {}
+        # Weighted units in the same integer cents x ppm encoding as storage,
+        # so the preview matches the saved bill
+        user_units: defaultdict[int, int] = defaultdict(int)
+        subtotal_cents = 0
         for item_input in bill_input.items:
+            cost_cents = to_cents(item_input.cost)
+            subtotal_cents += cost_cents
             for assignment in item_input.assignments:
-                if assignment.user_id not in user_shares:
-                    user_shares[assignment.user_id] = Decimal("0")
-                user_shares[assignment.user_id] += item_input.cost * assignment.fraction
+                user_units[assignment.user_id] += cost_cents * to_ppm(assignment.fraction)
+
+        # Totals in the same integer cents the bill is stored in
+        tax_cents = to_cents(bill_input.tax)
+        subtotal = from_cents(subtotal_cents)
+        total = from_cents(subtotal_cents + tax_cents)
 
         # Add proportional tax to each user
-        if subtotal > Decimal("0"):
-            for user_id, user_subtotal in user_shares.items():
-                tax_share = bill_input.tax * (user_subtotal / subtotal)
-                user_shares[user_id] += tax_share
+        user_shares = {
+            user_id: from_cents(share_cents(units, subtotal_cents, tax_cents))
+            for user_id, units in user_units.items()
+        }
 
-        # Convert user IDs to names
+        # Convert user IDs to names with one query
+        names = self.user_repo.get_names(sorted(user_shares))
         user_share_names: dict[str, Decimal] = {}
         for user_id, amount in user_shares.items():
-            user = self.user_repo.get(user_id)
-            if user is None:
-                raise UserNotFoundError(f"User with ID {user_id} not found", code="BILL_002")
-            user_share_names[user.name] = amount
+            if user_id not in names:
+                raise UserNotFoundError(f"User with ID {user_id} not found", code="USER_004")
+            user_share_names[names[user_id]] = amount
 
         return BillPreview(
             description=bill_input.description,
@@ -325,43 +391,80 @@ class BillService:
             user_shares=user_share_names,
         )
 
-    def get_bill(self, bill_id: int) -> BillDetail | None:
+    def get_bill(self, bill_id: int) -> BillDetail:
         """Get complete bill details with items and assignments.
 
         Args:
             bill_id: ID of bill
 
         Returns:
-            Complete bill details or None if not found
+            Complete bill details
+
+        Raises:
+            BillNotFoundError: If bill doesn't exist
         """
-        bill = self.bill_repo.get(bill_id)
-        if bill is None:
-            return None
+        details = self.get_bills_with_details([bill_id])
+        if not details:
+            raise BillNotFoundError(f"Bill with ID {bill_id} not found", code="BILL_001")
+        return details[0]
 
-        items = self.item_repo.get_by_bill(bill_id)
-        items_with_assignments: list[tuple[Item, list[Assignment]]] = []
+    def get_bills_with_details(self, bill_ids: list[int]) -> list[BillDetail]:
+        """Get complete details for several bills with a single query.
 
-        for item in items:
-            assignments = self.assignment_repo.get_by_item(item.id)  # type: ignore
-            items_with_assignments.append((item, assignments))
+        Args:
+            bill_ids: IDs of bills; unknown IDs are skipped
+
+        Returns:
+            Bill details ordered by created_at DESC (most recent first)
+        """
+        return [
+            self._build_detail(row) for row in self.bill_repo.fetch_bills_with_details(bill_ids)
+        ]
 
-        # Get payer name
-        payer = self.user_repo.get(bill.payer_id)
-        payer_name = payer.name if payer else "Unknown"
+    def _build_detail(self, details: BillDetails) -> BillDetail:
+        """Assemble a BillDetail and compute each participant's share.
+
+        Args:
+            details: Bill, items with assignments and user names from the repository
+
+        Returns:
+            Complete bill details with shares ordered by user name
+        """
+        bill, items, user_names = details
+
+        # Same integer cents x ppm encoding as storage and calculate_user_share;
+        # one pass yields the subtotal and the distinct participants
+        subtotal_cents = 0
+        tax_cents = to_cents(bill.tax)
+        user_units: defaultdict[int, int] = defaultdict(int)
+        item_rows: list[tuple[str, Decimal, list[tuple[str, Decimal]]]] = []
+        for item, assignments in items:
+            cost_cents = to_cents(item.cost)
+            subtotal_cents += cost_cents
+            assignment_rows: list[tuple[str, Decimal]] = []
+            for assignment in assignments:
+                user_units[assignment.user_id] += cost_cents * to_ppm(assignment.fraction)
+                if name := user_names.get(assignment.user_id):
+                    assignment_rows.append((name, assignment.fraction))
+            item_rows.append((item.description, item.cost, assignment_rows))
 
-        # Calculate shares for all users
-        all_users = self.user_repo.get_all()
         calculated_shares: dict[int, Decimal] = {}
-        for user in all_users:
-            share = self.calculate_user_share(bill_id, user.id)  # type: ignore
-            if share > Decimal("0"):
-                calculated_shares[user.id] = share  # type: ignore
+        share_rows: list[tuple[str, Decimal]] = []
+        for user_id in sorted(user_units, key=lambda uid: (user_names.get(uid, ""), uid)):
+            cents = share_cents(user_units[user_id], subtotal_cents, tax_cents)
+            if cents > 0:
+                amount = calculated_shares[user_id] = from_cents(cents)
+                if name := user_names.get(user_id):
+                    share_rows.append((name, amount))
 
         return BillDetail(
             bill=bill,
-            items=items_with_assignments,
-            payer_name=payer_name,
+            items=items,
+            payer_name=user_names.get(bill.payer_id, "Unknown"),
             calculated_shares=calculated_shares,
+            user_names=user_names,
+            share_rows=share_rows,
+            item_rows=item_rows,
         )
 
     def get_all_bills(self, limit: int = 100, offset: int = 0) -> list[Bill]:
@@ -374,8 +477,5 @@ class BillService:
         Returns:
             List of bills ordered by created_at DESC (most recent first)
         """
-        all_bills = self.bill_repo.get_all()
-        # Sort by creation date, most recent first
-        sorted_bills = sorted(all_bills, key=lambda b: b.created_at, reverse=True)
-        # Apply pagination
-        return sorted_bills[offset : offset + limit]
+        # Ordering and pagination happen in SQL
+        return self.bill_repo.get_all(limit=limit, offset=offset)
@@ -4,7 +4,9 @@ import sqlite3
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from splitfool.db.repositories.registry import Repositories
 from splitfool.db.repositories.user_repository import UserRepository
+from splitfool.db.uow import transactional
 from splitfool.models.user import User
 from splitfool.services.validation import validate_user_name
 from splitfool.utils.errors import UserHasBalancesError
@@ -16,14 +18,20 @@ if TYPE_CHECKING:
 class UserService:
     """Service for user-related business logic."""
 
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(
+        self, connection: sqlite3.Connection, repositories: Repositories | None = None
+    ) -> None:
         """Initialize service with database connection.
 
         Args:
             connection: SQLite database connection
+            repositories: Repositories shared with other services; created
+                for the connection if omitted
         """
         self.conn = connection
-        self.user_repo = UserRepository(connection)
+        self.user_repo = (
+            repositories.users if repositories is not None else UserRepository(connection)
+        )
         self._balance_service: BalanceService | None = None
 
     def set_balance_service(self, balance_service: "BalanceService") -> None:
@@ -34,6 +42,7 @@ class UserService:
         """
         self._balance_service = balance_service
 
+    @transactional
     def create_user(self, name: str) -> User:
         """Create a new user.
 
@@ -71,6 +80,17 @@ class UserService:
         """
         return self.user_repo.get(user_id)
 
+    def get_user_names(self, user_ids: list[int]) -> dict[int, str]:
+        """Get names for several users at once.
+
+        Args:
+            user_ids: IDs of users; unknown IDs are skipped
+
+        Returns:
+            Mapping of user_id -> name
+        """
+        return self.user_repo.get_names(user_ids)
+
     def get_all_users(self) -> list[User]:
         """Get all users.
 
@@ -79,6 +99,7 @@ class UserService:
         """
         return self.user_repo.get_all()
 
+    @transactional
     def update_user(self, user_id: int, name: str) -> User:
         """Update user's name.
 
@@ -104,6 +125,7 @@ class UserService:
 
         return self.user_repo.update(updated_user)
 
+    @transactional
     def delete_user(self, user_id: int) -> None:
         """Delete user if they have no outstanding balances.
 
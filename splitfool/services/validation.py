@@ -3,6 +3,7 @@
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from splitfool.utils.currency import FRACTION_TOLERANCE, ONE, ZERO
 from splitfool.utils.errors import ValidationError
 
 if TYPE_CHECKING:
@@ -36,15 +37,22 @@ def validate_bill_fractions(assignments: list["Assignment"]) -> None:
         ValidationError: If fractions don't sum to 1.0 for any item
     """
     item_fractions: dict[int, Decimal] = {}
+    limit = ONE + FRACTION_TOLERANCE
 
+    # Fractions are positive, so an item is rejected as soon as its running
+    # total passes the limit; only sums that fall short wait for the end
     for assignment in assignments:
         item_id = assignment.item_id
-        item_fractions[item_id] = (
-            item_fractions.get(item_id, Decimal("0")) + assignment.fraction
-        )
+        total = item_fractions.get(item_id, ZERO) + assignment.fraction
+        if total > limit:
+            raise ValidationError(
+                f"Item {item_id} fractions sum to at least {total}, must equal 1.0",
+                code="ASSIGN_002",
+            )
+        item_fractions[item_id] = total
 
     for item_id, total in item_fractions.items():
-        if abs(total - Decimal("1.0")) > Decimal("0.001"):
+        if abs(total - ONE) > FRACTION_TOLERANCE:
             raise ValidationError(
                 f"Item {item_id} fractions sum to {total}, must equal 1.0",
                 code="ASSIGN_002",
@@ -61,7 +69,7 @@ def validate_positive_decimal(value: Decimal, field_name: str = "value") -> None
     Raises:
         ValidationError: If value is not positive
     """
-    if value <= Decimal("0"):
+    if value <= ZERO:
         raise ValidationError(
             f"{field_name} must be positive, got {value}", code="VALIDATION_001"
         )
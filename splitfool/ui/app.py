@@ -1,17 +1,26 @@
 """Main Textual application."""
 
+import asyncio
+import functools
 import sqlite3
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ParamSpec, TypeVar
 
 from textual.app import App, ComposeResult
 from textual.widgets import Footer, Header
 
 from splitfool.config import Config
-from splitfool.db.connection import get_connection, initialize_database
+from splitfool.db.connection import connection_pool, initialize_database
+from splitfool.db.repositories import Repositories
 from splitfool.services.balance_service import BalanceService
 from splitfool.services.bill_service import BillService
 from splitfool.services.user_service import UserService
 from splitfool.ui.screens.home import HomeScreen
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
 
 class SplitfoolApp(App[None]):
     """Splitfool TUI application."""
@@ -51,6 +60,9 @@ class SplitfoolApp(App[None]):
     }
     """
 
+    # Installed once and kept for the life of the app
+    SCREENS = {"home": HomeScreen}
+
     BINDINGS = [
         ("q", "quit", "Quit"),
         ("?", "help", "Help"),
@@ -61,37 +73,81 @@ class SplitfoolApp(App[None]):
     # Subtitle shown in header
     SUB_TITLE = "Bill Splitting Application"
 
-    def __init__(self, config: Config | None = None) -> None:
+    def __init__(
+        self, config: Config | None = None, conn: sqlite3.Connection | None = None
+    ) -> None:
         """Initialize application.
 
         Args:
             config: Application configuration
+            conn: Optional already-open database connection to reuse
         """
         super().__init__()
         self.config = config or Config()
-        self.conn: sqlite3.Connection | None = None
-        self.user_service: UserService | None = None
-        self.bill_service: BillService | None = None
-        self.balance_service: BalanceService | None = None
+        self.conn: sqlite3.Connection | None = conn
+        # One worker, so database calls run one at a time off the event loop.
+        # It starts with the default decimal context; currency rounding
+        # doesn't depend on it, so money rounds the same as on this thread
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="splitfool-db")
 
     def on_mount(self) -> None:
         """Initialize application on mount."""
-        # Initialize database
-        initialize_database(self.config.db_path_str)
+        # Reuse the process-wide connection unless one was handed in
+        if self.conn is None:
+            self.conn = connection_pool.get(self.config.db_path_str)
 
-        # Create connection
-        self.conn = get_connection(self.config.db_path_str)
+        # Initialize database; services are built when a screen first uses them
+        initialize_database(self.config.db_path_str, conn=self.conn)
 
-        # Initialize services
-        self.user_service = UserService(self.conn)
-        self.bill_service = BillService(self.conn)
-        self.balance_service = BalanceService(self.conn)
+        # Push home screen
+        self.push_screen("home")
+
+    @functools.cached_property
+    def repositories(self) -> Repositories:
+        """Repositories shared by every service over the app's connection."""
+        assert self.conn is not None, "Connection is opened on mount"
+        return Repositories.for_connection(self.conn)
+
+    @functools.cached_property
+    def user_service(self) -> UserService:
+        """User service, created on first use and wired to the balance service."""
+        assert self.conn is not None, "Connection is opened on mount"
+        service = UserService(self.conn, self.repositories)
+        # Deleting a user checks for outstanding balances
+        service.set_balance_service(self.balance_service)
+        return service
+
+    @functools.cached_property
+    def bill_service(self) -> BillService:
+        """Bill service, created on first use."""
+        assert self.conn is not None, "Connection is opened on mount"
+        return BillService(self.conn, self.repositories)
+
+    @functools.cached_property
+    def balance_service(self) -> BalanceService:
+        """Balance service, created on first use."""
+        assert self.conn is not None, "Connection is opened on mount"
+        return BalanceService(self.conn, self.repositories)
+
+    async def run_db(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run a service call on the database thread without blocking the UI.
+
+        Every database call from the screens goes through here, so the
+        shared connection and its cached cursors are only ever used by one
+        thread at a time.
 
-        # Wire up balance service to user service
-        self.user_service.set_balance_service(self.balance_service)
+        Args:
+            func: Service method to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
 
-        # Push home screen
-        self.push_screen(HomeScreen())
+        Returns:
+            Whatever func returns; exceptions it raises propagate
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._db_executor, functools.partial(func, *args, **kwargs)
+        )
 
     def compose(self) -> ComposeResult:
         """Compose app layout.
@@ -110,5 +166,9 @@ class SplitfoolApp(App[None]):
 
     async def on_unmount(self) -> None:
         """Clean up resources on unmount."""
+        # Let any queued database call finish before the final commit
+        self._db_executor.shutdown(wait=True)
+
+        # The connection is owned by the pool and closed at process exit
         if self.conn:
-            self.conn.close()
+            self.conn.commit()
@@ -1,11 +1,15 @@
 """Balance view screen for displaying outstanding balances."""
 
+from decimal import Decimal
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Button, DataTable, Footer, Header, Label, Static
 
 from splitfool.models.balance import Balance
+from splitfool.ui.widgets.confirmation_dialog import ConfirmationDialog
+from splitfool.utils.currency import format_currency
 
 
 class BalanceViewScreen(Screen[bool]):
@@ -68,12 +72,25 @@ class BalanceViewScreen(Screen[bool]):
         ("escape", "cancel", "Back"),
         ("s", "settle", "Settle All"),
         ("r", "refresh", "Refresh"),
+        ("m", "toggle_simplify", "Simplify"),
     ]
 
+    # App-wide name the settle confirmation dialog is installed under
+    SETTLE_DIALOG_NAME = "settle-confirm"
+
     def __init__(self) -> None:
         """Initialize balance view screen."""
         super().__init__()
         self.balances: list[Balance] = []
+        # Sum of self.balances, kept in step by load_balances
+        self._balance_total = Decimal("0")
+        # Text last shown in #settlement-info, so unchanged refreshes skip it
+        self._last_settlement_text: str | None = None
+        # Installed on the app while this screen lives, so each settle
+        # reuses it instead of composing a new dialog
+        self._settle_dialog: ConfirmationDialog | None = None
+        # Cancel debt cycles so fewer payments settle the same net positions
+        self.simplify = False
 
     def compose(self) -> ComposeResult:
         """Compose balance view screen.
@@ -87,8 +104,10 @@ class BalanceViewScreen(Screen[bool]):
             yield Label("⚖️  Outstanding Balances", id="title")
 
             with Container(id="balance-container"):
-                # Table will be dynamically created
-                yield Static("Loading balances...", id="balance-content")
+                # Both stay mounted; refreshes refill the table and toggle
+                # which of the two is shown
+                yield Static("Loading balances...", id="empty-message")
+                yield DataTable(id="balance-table")
 
             yield Static("", id="settlement-info")
 
@@ -101,6 +120,9 @@ class BalanceViewScreen(Screen[bool]):
 
     async def on_mount(self) -> None:
         """Called when screen is mounted."""
+        table = self.query_one("#balance-table", DataTable)
+        table.add_columns("Debtor", "Creditor", "Amount")
+        table.display = False
         await self.load_balances()
 
     async def load_balances(self) -> None:
@@ -112,10 +134,13 @@ class BalanceViewScreen(Screen[bool]):
         assert app.balance_service is not None, "BalanceService must be initialized"
 
         # Get balances
-        self.balances = app.balance_service.get_all_balances()
+        self.balances = await app.run_db(
+            app.balance_service.get_all_balances, simplify=self.simplify
+        )
+        self._balance_total = sum((b.amount for b in self.balances), Decimal("0"))
 
         # Get last settlement info
-        last_settlement = app.balance_service.get_last_settlement()
+        last_settlement = await app.run_db(app.balance_service.get_last_settlement)
         settlement_text = ""
         if last_settlement:
             settlement_text = (
@@ -126,63 +151,39 @@ class BalanceViewScreen(Screen[bool]):
         else:
             settlement_text = "No previous settlements"
 
-        settlement_info = self.query_one("#settlement-info", Static)
-        settlement_info.update(settlement_text)
+        if settlement_text != self._last_settlement_text:
+            self.query_one("#settlement-info", Static).update(settlement_text)
+            self._last_settlement_text = settlement_text
 
         # Update display
         await self.update_balance_display()
 
     async def update_balance_display(self) -> None:
         """Update the balance display."""
-        from splitfool.ui.app import SplitfoolApp
-
-        app = self.app
-        assert isinstance(app, SplitfoolApp), "App must be SplitfoolApp"
-        assert app.user_service is not None, "UserService must be initialized"
+        table = self.query_one("#balance-table", DataTable)
+        empty_msg = self.query_one("#empty-message", Static)
+        settle_btn = self.query_one("#settle-btn", Button)
 
-        container = self.query_one("#balance-container", Container)
-
-        # Remove old content
-        try:
-            old_content = container.query_one("#balance-content")
-            await old_content.remove()
-        except Exception:
-            pass
+        # Refill the persistent table instead of remounting a new one
+        table.clear()
 
         if not self.balances:
-            # No balances - show success message
-            empty_msg = Static(
-                "🎉 All balances settled!\nNo outstanding debts.",
-                id="balance-content",
-                classes="empty-message",
-            )
-            await container.mount(empty_msg)
-
-            # Disable settle button
-            settle_btn = self.query_one("#settle-btn", Button)
+            # No balances - show success message and disable settle button
+            empty_msg.update("🎉 All balances settled!\nNo outstanding debts.")
+            empty_msg.display = True
+            table.display = False
             settle_btn.disabled = True
             return
 
-        # Create table
-        table: DataTable = DataTable(id="balance-content")
-        table.add_columns("Debtor", "Creditor", "Amount")
-
-        # Add balance rows
-        for balance in self.balances:
-            debtor = app.user_service.get_user(balance.debtor_id)
-            creditor = app.user_service.get_user(balance.creditor_id)
-
-            if debtor and creditor:
-                table.add_row(
-                    debtor.name,
-                    creditor.name,
-                    f"${balance.amount:.2f}",
-                )
-
-        await container.mount(table)
+        # Add balance rows in one batch; names are resolved by the service
+        table.add_rows(
+            (balance.debtor_name, balance.creditor_name, format_currency(balance.amount))
+            for balance in self.balances
+            if balance.debtor_name and balance.creditor_name
+        )
 
-        # Enable settle button
-        settle_btn = self.query_one("#settle-btn", Button)
+        empty_msg.display = False
+        table.display = True
         settle_btn.disabled = False
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -205,15 +206,19 @@ class BalanceViewScreen(Screen[bool]):
         await self.load_balances()
         self.app.notify("Balances refreshed", severity="information")
 
+    async def action_toggle_simplify(self) -> None:
+        """Toggle debt simplification and redisplay balances."""
+        self.simplify = not self.simplify
+        await self.load_balances()
+        state = "on" if self.simplify else "off"
+        self.app.notify(f"Debt simplification {state}", severity="information")
+
     async def action_settle(self) -> None:
         """Initiate settlement with confirmation."""
         if not self.balances:
             self.app.notify("No balances to settle", severity="warning")
             return
 
-        # Show confirmation dialog
-        from splitfool.ui.widgets.confirmation_dialog import ConfirmationDialog
-
         preview = self._format_settlement_preview()
 
         def handle_confirmation(confirmed: bool) -> None:
@@ -221,13 +226,24 @@ class BalanceViewScreen(Screen[bool]):
             if confirmed:
                 self.call_later(self.perform_settlement)
 
-        dialog = ConfirmationDialog(
-            title="Settle All Balances",
-            message=preview,
-            confirm_label="Settle",
-            cancel_label="Cancel",
-        )
-        self.app.push_screen(dialog, handle_confirmation)
+        # Show confirmation dialog
+        if self._settle_dialog is None:
+            self._settle_dialog = ConfirmationDialog(
+                title="Settle All Balances",
+                message=preview,
+                confirm_label="Settle",
+                cancel_label="Cancel",
+            )
+            self.app.install_screen(self._settle_dialog, self.SETTLE_DIALOG_NAME)
+        else:
+            self._settle_dialog.set_message(preview)
+        self.app.push_screen(self._settle_dialog, handle_confirmation)
+
+    def on_unmount(self) -> None:
+        """Release the installed settle dialog along with this screen."""
+        if self._settle_dialog is not None:
+            self.app.uninstall_screen(self._settle_dialog)
+            self._settle_dialog = None
 
     def _format_settlement_preview(self) -> str:
         """Format preview of balances to be settled.
@@ -235,28 +251,21 @@ class BalanceViewScreen(Screen[bool]):
         Returns:
             Formatted preview text
         """
-        from splitfool.ui.app import SplitfoolApp
-
-        app = self.app
-        assert isinstance(app, SplitfoolApp), "App must be SplitfoolApp"
-        assert app.user_service is not None, "UserService must be initialized"
-
-        lines = ["The following balances will be cleared:", ""]
-
-        for balance in self.balances:
-            debtor = app.user_service.get_user(balance.debtor_id)
-            creditor = app.user_service.get_user(balance.creditor_id)
-
-            if debtor and creditor:
-                lines.append(f"  • {debtor.name} owes {creditor.name}: ${balance.amount:.2f}")
-
-        lines.append("")
-        total = sum(b.amount for b in self.balances)
-        lines.append(f"Total debts: ${total:.2f}")
-        lines.append("")
-        lines.append("Are you sure you want to settle all balances?")
-
-        return "\n".join(lines)
+        balance_lines = (
+            f"  • {balance.debtor_name} owes {balance.creditor_name}: "
+            f"{format_currency(balance.amount)}"
+            for balance in self.balances
+            if balance.debtor_name and balance.creditor_name
+        )
+        return "\n".join((
+            "The following balances will be cleared:",
+            "",
+            *balance_lines,
+            "",
+            f"Total debts: {format_currency(self._balance_total)}",
+            "",
+            "Are you sure you want to settle all balances?",
+        ))
 
     async def perform_settlement(self) -> None:
         """Perform the actual settlement."""
@@ -268,8 +277,8 @@ class BalanceViewScreen(Screen[bool]):
 
         try:
             # Create settlement record
-            app.balance_service.settle_all_balances(
-                note="Manual settlement via TUI"
+            await app.run_db(
+                app.balance_service.settle_all_balances, note="Manual settlement via TUI"
             )
 
             # Reload balances
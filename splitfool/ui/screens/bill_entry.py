@@ -1,16 +1,34 @@
 """Bill entry screen for creating new bills."""
 
+import heapq
+from collections import defaultdict
 from decimal import Decimal
+from typing import Any
 
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.screen import Screen
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Button, Footer, Header, Input, Label, Select, Static
 
 from splitfool.models.user import User
-from splitfool.services.bill_service import AssignmentInput, BillInput, ItemInput
+from splitfool.services.bill_service import AssignmentInput, BillInput, ItemInput, share_cents
+from splitfool.utils.currency import format_currency, from_cents, to_cents, to_ppm
 from splitfool.utils.errors import ValidationError
 
+# Quiet period after the last tax keystroke before the preview is recomputed
+PREVIEW_DEBOUNCE_SECONDS = 0.15
+# User shares listed in the collapsed preview; ctrl+o shows them all
+PREVIEW_MAX_SHARES = 20
+
+# Bills with at least this many items mount only the rows near the viewport
+VIRTUALIZE_MIN_ITEMS = 50
+# Screen lines per item row: 3-line buttons plus the 1-line bottom margin
+ITEM_ROW_HEIGHT = 4
+# Rows mounted beyond each edge of the viewport, so short scrolls need no remount
+ITEM_OVERSCAN = 5
+
 
 class ItemData:
     """Temporary storage for item being created."""
@@ -20,6 +38,34 @@ class ItemData:
         self.description: str = ""
         self.cost: Decimal = Decimal("0")
         self.assignments: list[tuple[int, Decimal]] = []  # (user_id, fraction)
+        # user_id -> cost cents x fraction ppm, filled in once when the item
+        # is confirmed; the same integer units the bill is stored in
+        self.share_by_user: dict[int, int] = {}
+
+    def compute_shares(self) -> None:
+        """Fill share_by_user from the item's cost and assignments."""
+        cost_cents = to_cents(self.cost)
+        shares: defaultdict[int, int] = defaultdict(int)
+        for user_id, fraction in self.assignments:
+            shares[user_id] += cost_cents * to_ppm(fraction)
+        self.share_by_user = dict(shares)
+
+
+class ItemActionButton(Button):
+    """Edit or delete button on an item row, carrying the item it acts on."""
+
+    def __init__(self, label: str, action: str, index: int, **kwargs: Any) -> None:
+        """Initialize an item row button.
+
+        Args:
+            label: Button label
+            action: "edit" or "delete"
+            index: Index of the item in the bill
+            **kwargs: Passed through to Button
+        """
+        super().__init__(label, **kwargs)
+        self.item_action = action
+        self.item_index = index
 
 
 class BillEntryScreen(Screen[bool]):
@@ -82,10 +128,15 @@ class BillEntryScreen(Screen[bool]):
 
     .item-button-row {
         width: 100%;
-        height: auto;
+        height: 3;
         margin-bottom: 1;
     }
 
+    .item-spacer {
+        width: 100%;
+        height: 0;
+    }
+
     .item-display-btn {
         width: 1fr;
         text-align: left;
@@ -112,6 +163,7 @@ class BillEntryScreen(Screen[bool]):
         ("ctrl+s", "save", "Save Bill"),
         ("ctrl+i", "add_item", "Add Item"),
         ("ctrl+p", "preview", "Preview"),
+        ("ctrl+o", "toggle_preview", "Expand Preview"),
     ]
 
     def __init__(self, users: list[User]) -> None:
@@ -122,8 +174,21 @@ class BillEntryScreen(Screen[bool]):
         """
         super().__init__()
         self.users = users
+        # Built once per screen: the payer Select's (name, id) options, and
+        # the name map the preview reads on every tax keystroke
+        self._payer_options = [(user.name, user.id) for user in users]
+        self._user_name_by_id = {user_id: name for name, user_id in self._payer_options}
         self.items: list[ItemData] = []
         self.current_item: ItemData | None = None
+        self._preview_timer: Timer | None = None
+        # List every user share in the preview instead of the first few
+        self._preview_expanded = False
+        # Item-only parts of the preview, refreshed when items change so a
+        # tax edit only reapplies the proration
+        self._subtotal_cents = 0
+        self._subtotal_shares: dict[int, int] = {}
+        # Item indexes [start, end) currently mounted as rows
+        self._visible_range = (0, 0)
 
     def compose(self) -> ComposeResult:
         """Compose bill entry screen.
@@ -141,7 +206,7 @@ class BillEntryScreen(Screen[bool]):
                 yield Input(placeholder="e.g., Dinner at restaurant", id="description")
                 yield Label("Payer:")
                 yield Select(
-                    options=[(user.name, user.id) for user in self.users],
+                    options=self._payer_options,
                     id="payer",
                     allow_blank=False,
                 )
@@ -151,7 +216,10 @@ class BillEntryScreen(Screen[bool]):
             # Items section
             with Container(id="items-section"):
                 yield Label("Items", classes="section-title")
+                # Stand in for unmounted rows above and below the viewport
+                yield Static("", id="items-spacer-top", classes="item-spacer")
                 yield Static("No items added yet.", id="items-list")
+                yield Static("", id="items-spacer-bottom", classes="item-spacer")
                 with Horizontal(classes="button-row"):
                     yield Button("Add Item", id="add-item-btn", variant="primary")
 
@@ -167,28 +235,46 @@ class BillEntryScreen(Screen[bool]):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Look up the widgets used on every refresh and follow scrolling."""
+        # Held for the screen's lifetime, so refreshes skip the DOM query
+        self._form = self.query_one("#form-container", VerticalScroll)
+        self._tax_input = self.query_one("#tax", Input)
+        self._preview = self.query_one("#preview-content", Static)
+        self._items_section = self.query_one("#items-section", Container)
+        self._items_spacer_top = self.query_one("#items-spacer-top", Static)
+        self._items_spacer_bottom = self.query_one("#items-spacer-bottom", Static)
+
+        # Keep the mounted item rows near the viewport
+        self.watch(self._form, "scroll_y", self._check_item_window, init=False)
+
+    def on_resize(self) -> None:
+        """Recheck which item rows should be mounted after a resize."""
+        self._check_item_window()
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press.
 
         Args:
             event: Button pressed event
         """
-        button_id = str(event.button.id)
+        button = event.button
+
+        # Item row buttons carry their action and index; no ID parsing
+        if isinstance(button, ItemActionButton):
+            if button.item_action == "edit":
+                self.action_edit_item(button.item_index)
+            else:
+                await self.action_delete_item(button.item_index)
+            return
 
+        button_id = button.id
         if button_id == "add-item-btn":
             self.action_add_item()
         elif button_id == "save-btn":
             await self.action_save()
         elif button_id == "cancel-btn":
             await self.action_cancel()
-        elif button_id.startswith("edit-"):
-            # Extract item index and edit
-            index = int(button_id.replace("edit-", ""))
-            self.action_edit_item(index)
-        elif button_id.startswith("delete-"):
-            # Extract item index and delete
-            index = int(button_id.replace("delete-", ""))
-            await self.action_delete_item(index)
 
     def action_add_item(self) -> None:
         """Open item entry dialog."""
@@ -198,6 +284,7 @@ class BillEntryScreen(Screen[bool]):
             """Handle result from item entry screen."""
             if item_data:
                 self.items.append(item_data)
+                self._recompute_item_aggregates()
                 self.call_later(self.update_items_display)
                 self.call_later(self.update_preview)
 
@@ -218,6 +305,7 @@ class BillEntryScreen(Screen[bool]):
                 """Handle result from item edit screen."""
                 if item_data:
                     self.items[index] = item_data
+                    self._recompute_item_aggregates()
                     self.call_later(self.update_items_display)
                     self.call_later(self.update_preview)
 
@@ -234,6 +322,7 @@ class BillEntryScreen(Screen[bool]):
         """
         if 0 <= index < len(self.items):
             self.items.pop(index)
+            self._recompute_item_aggregates()
             await self.update_items_display()
             await self.update_preview()
 
@@ -241,13 +330,18 @@ class BillEntryScreen(Screen[bool]):
         """Update preview display."""
         await self.update_preview()
 
+    async def action_toggle_preview(self) -> None:
+        """Show all user shares in the preview, or only the first few."""
+        self._preview_expanded = not self._preview_expanded
+        await self.update_preview()
+
     async def action_save(self) -> None:
         """Save the bill."""
         try:
             # Validate and collect bill data
             description_input = self.query_one("#description", Input)
             payer_select = self.query_one("#payer", Select)
-            tax_input = self.query_one("#tax", Input)
+            tax_input = self._tax_input
 
             description = description_input.value.strip()
             if not description:
@@ -298,15 +392,13 @@ class BillEntryScreen(Screen[bool]):
             assert isinstance(app, SplitfoolApp), "App must be SplitfoolApp"
             assert app.bill_service is not None, "BillService must be initialized"
 
-            app.bill_service.create_bill(bill_input)
+            await app.run_db(app.bill_service.create_bill, bill_input)
             self.dismiss(True)
 
         except ValidationError as e:
-            preview_content = self.query_one("#preview-content", Static)
-            preview_content.update(f"[red]Error: {e.message}[/red]")
+            self._preview.update(f"[red]Error: {e.message}[/red]")
         except Exception as e:
-            preview_content = self.query_one("#preview-content", Static)
-            preview_content.update(f"[red]Unexpected error: {str(e)}[/red]")
+            self._preview.update(f"[red]Unexpected error: {str(e)}[/red]")
 
     async def action_cancel(self) -> None:
         """Cancel bill entry."""
@@ -314,38 +406,38 @@ class BillEntryScreen(Screen[bool]):
 
     async def update_items_display(self) -> None:
         """Update the items list display."""
-        items_container = self.query_one("#items-section", Container)
+        items_container = self._items_section
+        top_spacer = self._items_spacer_top
+        bottom_spacer = self._items_spacer_bottom
 
-        # Remove old items display (but keep the section title and add button)
-        try:
-            old_list = items_container.query_one("#items-list")
-            await old_list.remove()
-        except Exception:
-            pass
-
-        # Remove old item button rows
-        for widget in items_container.query(".item-button-row"):
-            await widget.remove()
-
-        # Find the add button container to use as reference
-        try:
-            add_button_row = items_container.query_one(".button-row")
-        except Exception:
-            # If button row doesn't exist for some reason, we have a problem
-            # This shouldn't happen, but let's handle it gracefully
-            return
+        # Remove the old list and item rows in one pass, keeping the section
+        # title, spacers and add button; awaited so the row IDs are free again
+        await items_container.remove_children("#items-list, .item-button-row")
 
         if not self.items:
             # Show "no items" message before the add button
+            top_spacer.styles.height = 0
+            bottom_spacer.styles.height = 0
+            self._visible_range = (0, 0)
             static = Static("No items added yet.", id="items-list")
-            await items_container.mount(static, before=add_button_row)
+            await items_container.mount(static, before=bottom_spacer)
             return
 
-        # Create clickable item list - mount each row before the add button
-        for i, item in enumerate(self.items):
+        # Large bills mount only the window of rows around the viewport; the
+        # spacers keep the scroll height of the rows left out
+        start, end = self._item_window()
+        top_spacer.styles.height = start * ITEM_ROW_HEIGHT
+        bottom_spacer.styles.height = (len(self.items) - end) * ITEM_ROW_HEIGHT
+        self._visible_range = (start, end)
+
+        # Build every clickable row in the window, then mount them together
+        # so layout runs once rather than per row
+        rows = []
+        for i in range(start, end):
+            item = self.items[i]
             user_count = len(item.assignments)
             item_text = (
-                f"{i+1}. {item.description} - ${item.cost:.2f} "
+                f"{i+1}. {item.description} - {format_currency(item.cost)} "
                 f"(split {user_count} way{'s' if user_count != 1 else ''})"
             )
 
@@ -354,60 +446,101 @@ class BillEntryScreen(Screen[bool]):
                 id=f"item-{i}",
                 classes="item-display-btn"
             )
-            edit_btn = Button("Edit", id=f"edit-{i}", variant="warning", classes="item-action-btn")
-            delete_btn = Button("Delete", id=f"delete-{i}", variant="error", classes="item-action-btn")
+            edit_btn = ItemActionButton(
+                "Edit", "edit", i, id=f"edit-{i}", variant="warning", classes="item-action-btn"
+            )
+            delete_btn = ItemActionButton(
+                "Delete", "delete", i, id=f"delete-{i}", variant="error", classes="item-action-btn"
+            )
 
-            item_row = Horizontal(item_btn, edit_btn, delete_btn, classes="item-button-row")
-            await items_container.mount(item_row, before=add_button_row)
+            rows.append(Horizontal(item_btn, edit_btn, delete_btn, classes="item-button-row"))
+        await items_container.mount_all(rows, before=bottom_spacer)
+
+    def _item_window(self) -> tuple[int, int]:
+        """Get the range of item rows that should be mounted.
+
+        Returns:
+            Item indexes [start, end): every item for small bills, otherwise
+            the rows overlapping the viewport plus ITEM_OVERSCAN on each side
+        """
+        count = len(self.items)
+        if count < VIRTUALIZE_MIN_ITEMS:
+            return 0, count
+
+        form = self._form
+        # Line of the form's scrolled content where the first item's slot
+        # begins; layout offsets stay valid while a scroll is mid-render
+        origin = 0
+        node: Widget | None = self._items_spacer_top
+        while node is not None and node is not form:
+            origin += node.virtual_region.y
+            node = node.parent if isinstance(node.parent, Widget) else None
+
+        top = round(form.scroll_y) - origin
+        first = top // ITEM_ROW_HEIGHT
+        last = -(-(top + form.scrollable_content_region.height) // ITEM_ROW_HEIGHT)
+        start = max(0, min(count, first) - ITEM_OVERSCAN)
+        end = min(count, max(0, last) + ITEM_OVERSCAN)
+        return start, max(start, end)
+
+    def _check_item_window(self) -> None:
+        """Remount the item rows if scrolling moved the window."""
+        if len(self.items) >= VIRTUALIZE_MIN_ITEMS and self._item_window() != self._visible_range:
+            self.call_later(self.update_items_display)
+
+    def _recompute_item_aggregates(self) -> None:
+        """Recompute the subtotal and each user's item costs after an item change."""
+        self._subtotal_cents = sum(to_cents(item.cost) for item in self.items)
+        # Sum each item's precomputed shares; no multiplication per refresh
+        shares: defaultdict[int, int] = defaultdict(int)
+        for item in self.items:
+            for user_id, share in item.share_by_user.items():
+                shares[user_id] += share
+        self._subtotal_shares = dict(shares)
 
     async def update_preview(self) -> None:
         """Update the preview display."""
-        preview_content = self.query_one("#preview-content", Static)
+        preview_content = self._preview
 
         if not self.items:
             preview_content.update("Add items to see preview")
             return
 
-        # Calculate subtotal
-        subtotal = sum(item.cost for item in self.items)
+        subtotal_cents = self._subtotal_cents
 
         # Get tax
-        tax_input = self.query_one("#tax", Input)
-        tax_str = tax_input.value.strip() or "0"
+        tax_str = self._tax_input.value.strip() or "0"
         try:
-            tax = Decimal(tax_str)
+            tax_cents = to_cents(Decimal(tax_str))
         except (ValueError, ArithmeticError):
-            tax = Decimal("0")
+            tax_cents = 0
 
-        total = subtotal + tax
-
-        # Calculate user shares
-        user_shares: dict[int, Decimal] = {}
-        for item in self.items:
-            for user_id, fraction in item.assignments:
-                if user_id not in user_shares:
-                    user_shares[user_id] = Decimal("0")
-                user_shares[user_id] += item.cost * fraction
-
-        # Add proportional tax
-        if subtotal > Decimal("0"):
-            for user_id in user_shares:
-                tax_share = tax * (user_shares[user_id] / subtotal)
-                user_shares[user_id] += tax_share
+        # Collapsed, only the listed users are prorated and formatted, so the
+        # per-keystroke cost stays flat however many people share the bill
+        item_shares = self._subtotal_shares
+        if self._preview_expanded or len(item_shares) <= PREVIEW_MAX_SHARES:
+            shown_ids = sorted(item_shares)
+        else:
+            shown_ids = heapq.nsmallest(PREVIEW_MAX_SHARES, item_shares)
+        hidden = len(item_shares) - len(shown_ids)
 
         # Build preview text
         lines = [
-            f"Subtotal: ${subtotal:.2f}",
-            f"Tax/Tip: ${tax:.2f}",
-            f"Total: ${total:.2f}",
+            f"Subtotal: {format_currency(from_cents(subtotal_cents))}",
+            f"Tax/Tip: {format_currency(from_cents(tax_cents))}",
+            f"Total: {format_currency(from_cents(subtotal_cents + tax_cents))}",
             "",
             "User Shares:",
         ]
 
-        user_dict = {user.id: user.name for user in self.users}
-        for user_id, amount in sorted(user_shares.items()):
-            user_name = user_dict.get(user_id, f"User {user_id}")
-            lines.append(f"  {user_name}: ${amount:.2f}")
+        # Add proportional tax to the cached item units per user, rounded to
+        # the cent exactly as the saved bill is
+        for user_id in shown_ids:
+            amount = from_cents(share_cents(item_shares[user_id], subtotal_cents, tax_cents))
+            user_name = self._user_name_by_id.get(user_id, f"User {user_id}")
+            lines.append(f"  {user_name}: {format_currency(amount)}")
+        if hidden:
+            lines.append(f"  … and {hidden} more (ctrl+o to show all)")
 
         preview_content.update("\n".join(lines))
 
@@ -418,4 +551,7 @@ class BillEntryScreen(Screen[bool]):
             event: Input changed event
         """
         if event.input.id == "tax":
-            await self.update_preview()
+            # Trailing-edge debounce: only the last edit in a burst recomputes
+            if self._preview_timer is not None:
+                self._preview_timer.stop()
+            self._preview_timer = self.set_timer(PREVIEW_DEBOUNCE_SECONDS, self.update_preview)
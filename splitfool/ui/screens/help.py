@@ -1,269 +1,97 @@
 """Help screen with comprehensive documentation."""
 
+import functools
+import importlib.resources
+import re
+from collections.abc import MutableMapping
+from typing import Any
+
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.screen import Screen
-from textual.widgets import Footer, Header, Markdown
+from textual.widgets import Footer, Header, Markdown, Static
 
-HELP_CONTENT = """
-# 🧾 Splitfool Help
+# "## <emoji> Title {#anchor}" section headings, listed in the table of contents
+_TOC_HEADING = re.compile(r"(?m)^## \S+ (.+?) \{#([\w-]+)\}$")
 
-**Version 0.1.0** - Bill Splitting Application
 
----
+def _read_help_content() -> str:
+    """Read the help text and fill in its table of contents.
 
-## 📚 Table of Contents
-
-1. [Quick Start](#quick-start)
-2. [User Management](#user-management)
-3. [Creating Bills](#creating-bills)
-4. [Viewing Balances](#viewing-balances)
-5. [Bill History](#bill-history)
-6. [Keyboard Shortcuts](#keyboard-shortcuts)
-7. [Tips & Tricks](#tips-tricks)
-
----
-
-## 🚀 Quick Start {#quick-start}
-
-Splitfool helps you split bills among multiple people. Here's the basic workflow:
-
-1. **Add Users** - Create entries for people who participate in bill splitting
-2. **Create Bills** - Enter bills with items and assign costs to users
-3. **View Balances** - See who owes whom
-4. **Settle Up** - Clear all balances when debts are paid
-5. **Review History** - Check past bills anytime
-
----
-
-## 👥 User Management {#user-management}
-
-**Access**: Press `[u]` from home screen or select "Manage Users"
-
-### Adding a User
-1. Click "Add User" or press `Ctrl+N`
-2. Enter the person's name
-3. Press Enter to save
-
-### Editing a User
-1. Select the user from the list
-2. Click "Edit" or press Enter
-3. Modify the name
-4. Press Enter to save
-
-### Deleting a User
-1. Select the user from the list
-2. Click "Delete" or press Delete key
-3. Confirm deletion
-
-**Note**: You cannot delete users with outstanding balances.
-
----
-
-## 💵 Creating Bills {#creating-bills}
-
-**Access**: Press `[b]` from home screen or select "New Bill"
-
-### Step 1: Bill Details
-- **Description**: What's the bill for? (e.g., "Dinner at Pizza Place")
-- **Payer**: Who paid the bill?
-- **Tax/Tip/Fees**: Any additional charges (optional, default: $0.00)
-
-### Step 2: Add Items
-1. Click "Add Item" or press `Ctrl+I`
-2. Enter item description (e.g., "Margherita Pizza")
-3. Enter item cost (e.g., "15.99")
-4. Assign users to this item:
-   - Select users who share this item
-   - Set fractions (e.g., 0.5 for 50%, 1.0 for 100%)
-   - **Fractions must sum to 1.0** for each item
-   - Default: Equal split among selected users
-
-### Step 3: Preview & Save
-- Review the calculated shares in the preview section
-- Each user's share includes:
-  - Their portion of assigned items
-  - Proportional share of tax/tips based on their items
-- Press `Ctrl+S` to save the bill
-- Press `Esc` to cancel
-
-### Example: $100 Dinner Bill
-```
-Items:
-- Pizza ($60) → Alice: 50%, Bob: 50%
-- Salad ($40) → Bob: 100%
-Tax: $10
-
-Calculations:
-Alice: $60 × 0.5 = $30 + tax ($3) = $33
-Bob: $60 × 0.5 + $40 = $70 + tax ($7) = $77
-```
-
----
-
-## ⚖️ Viewing Balances {#viewing-balances}
-
-**Access**: Press `[v]` from home screen or select "View Balances"
-
-### Understanding Balances
-- Shows **net** balances (mutual debts are offset)
-- Only displays positive amounts owed
-- Updates automatically when bills are created
-
-### Example
-If Alice owes Bob $50 and Bob owes Alice $30:
-- Display shows: "Alice owes Bob: $27.00"
-- The $30 is subtracted from the $50
-
-### Settling Balances
-1. Click "Settle All" or press `[s]`
-2. Review the confirmation dialog showing all balances
-3. Confirm to clear all balances
-4. **Note**: Bills remain in history for records
-
-**When to Settle**: After you've transferred money in real life and want to reset the app.
-
----
-
-## 📜 Bill History {#bill-history}
-
-**Access**: Press `[h]` from home screen or select "View History"
-
-### Viewing Bills
-- Bills are listed chronologically (most recent first)
-- Shows: Date, Description, Payer, Total
-
-### Bill Details
-1. Select any bill from the list
-2. Press Enter to view full details:
-   - All items with costs
-   - User assignments and fractions
-   - Calculated shares for each user
-   - Tax/tip distribution
-3. Press `[b]` or Esc to return to list
-
----
-
-## ⌨️ Keyboard Shortcuts {#keyboard-shortcuts}
-
-### Global Shortcuts (Work Everywhere)
-- `F1` or `?` - Show this help screen
-- `Esc` - Go back / Cancel
-- `q` - Quit application
-- `Tab` - Navigate between fields
-- `Arrow Keys` - Move selection up/down/left/right
-- `Enter` - Select / Confirm
-
-### Home Screen
-- `u` - Manage Users
-- `b` - New Bill
-- `v` - View Balances
-- `h` - View History
-- `?` - Help
-
-### User Management
-- `Ctrl+N` - Add new user
-- `Enter` - Edit selected user
-- `Delete` - Delete selected user
-- `Esc` - Return to home
-
-### Bill Entry
-- `Ctrl+I` - Add item to bill
-- `Ctrl+P` - Preview calculations
-- `Ctrl+S` - Save bill
-- `Esc` - Cancel bill entry
-
-### Balance View
-- `s` - Settle all balances
-- `r` - Refresh balances
-- `Esc` - Return to home
-
-### History View
-- `Enter` - View bill details
-- `b` - Back to bill list (when in detail view)
-- `r` - Refresh history
-- `Esc` - Return to home
-
----
-
-## 💡 Tips & Tricks {#tips-tricks}
-
-### 1. Equal Splits Made Easy
-When adding items, if you want an equal split:
-- Select all users who share the item
-- Leave fractions at default
-- The system automatically divides evenly
+    Returns:
+        Help Markdown with a numbered link to every anchored section in
+        place of its ``<!-- toc -->`` marker
+    """
+    text = (importlib.resources.files("splitfool.ui.screens") / "help.md").read_text(
+        encoding="utf-8"
+    )
+    toc = "\n".join(
+        f"{number}. [{title}](#{anchor})"
+        for number, (title, anchor) in enumerate(_TOC_HEADING.findall(text), start=1)
+    )
+    return text.replace("<!-- toc -->", toc, 1)
 
-### 2. Complex Splits
-For unequal splits (e.g., someone ate more):
-- Manually set fractions for each user
-- Example: Alice 0.6, Bob 0.4 (Alice pays 60%)
-- Always ensure fractions sum to exactly 1.0
 
-### 3. Tax Distribution
-Tax/tips are distributed **proportionally**:
-- If you pay 30% of items, you pay 30% of tax
-- This ensures fair distribution
+# This module is imported when help is first opened, so the file is read then
+HELP_CONTENT = _read_help_content()
 
-### 4. Settlement Strategy
-**Option A - Settle Often**: Clear balances after each bill is paid
-**Option B - Settle Monthly**: Let balances accumulate, settle at month-end
 
-Both work! Choose what fits your group's payment style.
+# HELP_CONTENT split before each "## " heading; each section is its own
+# Markdown widget, mounted once it scrolls near the viewport
+HELP_SECTIONS: tuple[str, ...] = tuple(re.split(r"(?m)^(?=## )", HELP_CONTENT))
 
-### 5. Data Persistence
-All data is saved automatically to `splitfool.db`:
-- No manual save required
-- Bills persist even after settlement
-- Safe to close and reopen anytime
+# Sections mounted up front, covering the first screenful
+HELP_EAGER_SECTIONS = 3
 
-### 6. Checking Calculations
-Use History view to verify any bill:
-- See exact items and assignments
-- Review calculated shares
-- Confirm tax distribution
+# Explicit heading anchors such as {#quick-start}, targets of the contents links
+_ANCHOR = re.compile(r"\{#([\w-]+)\}")
 
----
 
-## 🆘 Troubleshooting
+class _HelpParser(MarkdownIt):
+    """Markdown parser that tokenizes each help section only once per process."""
 
-### "Cannot delete user with outstanding balances"
-**Solution**: Settle balances first, then delete the user.
+    def parse(self, src: str, env: MutableMapping[str, Any] | None = None) -> list[Token]:
+        """Parse source, reusing the cached tokens for help sections.
 
-### "Fractions must sum to 1.0"
-**Solution**: Check your fraction values for each item. They must add up to exactly 1.0.
-- ✓ Correct: 0.5 + 0.5 = 1.0
-- ✗ Wrong: 0.6 + 0.6 = 1.2
+        Args:
+            src: Markdown source
+            env: Parser environment; a caller-supplied one bypasses the cache
 
-### "No users found"
-**Solution**: Add at least one user before creating bills.
+        Returns:
+            Block tokens for the source
+        """
+        if env is None and src in _SECTION_INDEX:
+            return list(_help_tokens(src))
+        return super().parse(src, env)
 
-### "Tax cannot be negative"
-**Solution**: Enter 0 or a positive number for tax/tips.
 
----
+# Section text -> index, also the set of sources _HelpParser caches
+_SECTION_INDEX = {section: index for index, section in enumerate(HELP_SECTIONS)}
 
-## 📝 About
 
-**Splitfool** is a terminal-based bill splitting application designed for simplicity and efficiency.
+@functools.cache
+def _help_tokens(section: str) -> tuple[Token, ...]:
+    """Tokenize a help section on first use.
 
-**Features**:
-- Manual bill entry with itemized costs
-- Flexible user assignments with custom fractions
-- Automatic tax distribution
-- Net balance calculation (mutual debts offset)
-- All-or-nothing settlement
-- Complete bill history
-- Data persistence across sessions
+    Args:
+        section: One of HELP_SECTIONS
 
-**Technology**: Built with Python and Textual framework
+    Returns:
+        The section's block tokens
+    """
+    return tuple(MarkdownIt("gfm-like").parse(section))
 
-**License**: MIT (see LICENSE file)
 
----
+@functools.cache
+def _help_parser() -> MarkdownIt:
+    """Get the shared help parser, built on first use.
 
-Press `Esc` to return to the application.
-"""
+    Returns:
+        Parser handed to the help screen's Markdown widgets
+    """
+    return _HelpParser("gfm-like")
 
 
 class HelpScreen(Screen[None]):
@@ -282,10 +110,14 @@ class HelpScreen(Screen[None]):
 
     Markdown {
         width: 100%;
-        height: 100%;
+        height: auto;
         background: $surface;
         color: $text;
-        padding: 1;
+        padding: 0 1;
+    }
+
+    .help-placeholder {
+        width: 100%;
     }
     """
 
@@ -294,6 +126,13 @@ class HelpScreen(Screen[None]):
         ("q", "close", "Close Help"),
     ]
 
+    def __init__(self) -> None:
+        """Initialize help screen."""
+        super().__init__()
+        # Indexes of sections mounted as Markdown; the rest are placeholders
+        self._mounted_sections = set(range(min(HELP_EAGER_SECTIONS, len(HELP_SECTIONS))))
+        self._container: VerticalScroll | None = None
+
     def compose(self) -> ComposeResult:
         """Compose help screen.
 
@@ -303,10 +142,103 @@ class HelpScreen(Screen[None]):
         yield Header()
 
         with VerticalScroll(id="help-container"):
-            yield Markdown(HELP_CONTENT)
+            for index, section in enumerate(HELP_SECTIONS):
+                if index in self._mounted_sections:
+                    yield self._section_markdown(index)
+                else:
+                    # Sized to the section's source lines, roughly its
+                    # rendered height, so the scrollbar starts out close
+                    placeholder = Static(
+                        "", id=f"help-placeholder-{index}", classes="help-placeholder"
+                    )
+                    placeholder.styles.height = section.count("\n") + 1
+                    yield placeholder
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Mount further sections as they scroll into view."""
+        self._container = self.query_one("#help-container", VerticalScroll)
+        self.watch(self._container, "scroll_y", self._check_sections, init=False)
+
+    def on_resize(self) -> None:
+        """Recheck which sections are near the viewport after a resize."""
+        self._check_sections()
+
+    def _section_markdown(self, index: int) -> Markdown:
+        """Build the Markdown widget for one help section.
+
+        Args:
+            index: Index into HELP_SECTIONS
+
+        Returns:
+            Markdown widget whose tokens come from the shared cache
+        """
+        return Markdown(
+            HELP_SECTIONS[index],
+            id=f"help-section-{index}",
+            parser_factory=_help_parser,
+            open_links=False,
+        )
+
+    def _check_sections(self) -> None:
+        """Mount placeholders lying within a screen of the viewport."""
+        if self._container is None or len(self._mounted_sections) == len(HELP_SECTIONS):
+            return
+        container = self._container
+        height = container.scrollable_content_region.height
+        top = container.scroll_y - height
+        bottom = container.scroll_y + 2 * height
+        for placeholder in container.query(".help-placeholder"):
+            region = placeholder.virtual_region
+            if region.bottom >= top and region.y <= bottom:
+                self.call_later(self._mount_section, int(str(placeholder.id).rsplit("-", 1)[1]))
+
+    async def _mount_section(self, index: int) -> Markdown:
+        """Replace a section's placeholder with its Markdown, once.
+
+        Args:
+            index: Index into HELP_SECTIONS
+
+        Returns:
+            The section's mounted Markdown widget
+        """
+        if index in self._mounted_sections:
+            return self.query_one(f"#help-section-{index}", Markdown)
+        self._mounted_sections.add(index)
+        placeholder = self.query_one(f"#help-placeholder-{index}", Static)
+        markdown = self._section_markdown(index)
+        await self.query_one("#help-container", VerticalScroll).mount(markdown, after=placeholder)
+        await placeholder.remove()
+        return markdown
+
+    async def on_markdown_link_clicked(self, event: Markdown.LinkClicked) -> None:
+        """Follow table of contents links to their section.
+
+        Args:
+            event: Link clicked event
+        """
+        if not event.href.startswith("#"):
+            self.app.open_url(event.href)
+            return
+        anchor = event.href[1:]
+        for index, section in enumerate(HELP_SECTIONS):
+            match = _ANCHOR.search(section.partition("\n")[0])
+            if match and match.group(1) == anchor:
+                # Mount everything above the target too, so estimated
+                # placeholder heights can't shift it after the scroll
+                for earlier in range(index):
+                    await self._mount_section(earlier)
+                markdown = await self._mount_section(index)
+                # Scroll once the new sections have been laid out
+                self.call_after_refresh(
+                    self.query_one("#help-container", VerticalScroll).scroll_to_widget,
+                    markdown,
+                    top=True,
+                    animate=False,
+                )
+                return
+
     def action_close(self) -> None:
         """Close help screen and return to previous screen."""
         self.dismiss()
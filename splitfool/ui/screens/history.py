@@ -1,12 +1,59 @@
 """History screen for viewing past bills."""
 
+import functools
+import io
+from collections import OrderedDict
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Button, DataTable, Footer, Header, Label, Static
+from textual.worker import Worker, WorkerCancelled
 
+from splitfool.db.connection import change_stamp
 from splitfool.models.bill import Bill
-from splitfool.services.bill_service import BillDetail
+from splitfool.services.bill_service import BillDetail, BillService
+from splitfool.services.user_service import UserService
+from splitfool.utils.currency import format_currency
+from splitfool.utils.errors import BillNotFoundError
+
+if TYPE_CHECKING:
+    from splitfool.ui.app import SplitfoolApp
+
+# Descriptions longer than this are cut short in the bill list
+DESCRIPTION_MAX_CHARS = 40
+
+# Formatted bill details kept for re-viewing, least recently viewed dropped first
+DETAIL_CACHE_SIZE = 64
+
+
+def _truncate(text: str) -> str:
+    """Shorten text to the bill list's description width.
+
+    Args:
+        text: Full description
+
+    Returns:
+        The text, or its first DESCRIPTION_MAX_CHARS characters and an ellipsis
+    """
+    return text if len(text) <= DESCRIPTION_MAX_CHARS else f"{text[:DESCRIPTION_MAX_CHARS]}…"
+
+
+def _format_total(totals: dict[int, Decimal], bill_id: int | None) -> str:
+    """Format a bill's total for the bill list.
+
+    Args:
+        totals: Mapping of bill ID -> total cost
+        bill_id: ID of the listed bill
+
+    Returns:
+        The formatted total, or a dash if the bill was deleted before its
+        total was looked up
+    """
+    total = totals.get(bill_id) if bill_id is not None else None
+    return "—" if total is None else format_currency(total)
 
 
 class HistoryScreen(Screen[None]):
@@ -80,12 +127,22 @@ class HistoryScreen(Screen[None]):
         ("b", "back_to_list", "Back to List"),
     ]
 
+    # Button id -> action run on press
+    _BUTTON_ACTIONS = {"refresh-btn": "refresh", "back-btn": "back"}
+
     def __init__(self) -> None:
         """Initialize history screen."""
         super().__init__()
         self.bills: list[Bill] = []
         self.selected_bill_id: int | None = None
         self.current_detail: BillDetail | None = None
+        # Database change stamp the list was last built at; while it holds,
+        # a refresh would rebuild exactly the same rows
+        self._list_stamp: tuple[int, int] | None = None
+        # bill_id -> (detail, formatted text), valid as long as _list_stamp
+        self._detail_cache: OrderedDict[int, tuple[BillDetail, str]] = OrderedDict()
+        # Mounted with the first non-empty list, then refilled in place
+        self._table: DataTable | None = None
 
     def compose(self) -> ComposeResult:
         """Compose history screen.
@@ -99,7 +156,7 @@ class HistoryScreen(Screen[None]):
             yield Label("📜 Bill History", id="title")
 
             with Container(id="list-container"):
-                yield Static("Loading bills...", id="bill-content")
+                yield Static("Loading bills...", id="empty-message")
 
             # Detail container (hidden initially)
             with Container(id="detail-container") as detail:
@@ -112,70 +169,118 @@ class HistoryScreen(Screen[None]):
 
         yield Footer()
 
-    async def on_mount(self) -> None:
+    def on_mount(self) -> None:
         """Called when screen is mounted."""
-        await self.load_bills()
+        # Paint the loading placeholder now and swap in the list when it's ready
+        self._start_load()
 
-    async def load_bills(self) -> None:
-        """Load and display bill list."""
+    def _start_load(self) -> Worker[None]:
+        """Load the bill list in a worker, cancelling any load still running.
+
+        Returns:
+            Worker running the load
+        """
+        return self.run_worker(self.load_bills(), exclusive=True, group="history-load")
+
+    @functools.cached_property
+    def _splitfool_app(self) -> "SplitfoolApp":
+        """The running app, type-checked once per screen."""
         from splitfool.ui.app import SplitfoolApp
 
         app = self.app
         assert isinstance(app, SplitfoolApp), "App must be SplitfoolApp"
-        assert app.bill_service is not None, "BillService must be initialized"
+        return app
+
+    def _services(self) -> tuple[BillService, UserService]:
+        """Get the services this screen reads from.
+
+        Returns:
+            Tuple of (bill service, user service)
+        """
+        app = self._splitfool_app
+        return app.bill_service, app.user_service
+
+    async def load_bills(self) -> None:
+        """Load and display bill list."""
+        app = self._splitfool_app
+        bill_svc, _ = self._services()
+        assert app.conn is not None, "Connection must be open"
+
+        # Nothing was written since the last build, so the list is current.
+        # The stamp is read before the bills, so a write landing in between
+        # only costs one extra rebuild later.
+        stamp = await app.run_db(change_stamp, app.conn)
+        if stamp == self._list_stamp:
+            return
+        self._detail_cache.clear()
 
         # Get all bills
-        self.bills = app.bill_service.get_all_bills(limit=100)
+        self.bills = await app.run_db(bill_svc.get_all_bills, limit=100)
 
         # Update display
         await self.update_bill_list()
+        self._list_stamp = stamp
 
     async def update_bill_list(self) -> None:
         """Update the bill list display."""
-        from splitfool.ui.app import SplitfoolApp
-
-        app = self.app
-        assert isinstance(app, SplitfoolApp), "App must be SplitfoolApp"
-        assert app.user_service is not None, "UserService must be initialized"
-
-        container = self.query_one("#list-container", Container)
-
-        # Remove old content
-        try:
-            old_content = container.query_one("#bill-content")
-            await old_content.remove()
-        except Exception:
-            pass
+        message = self.query_one("#empty-message", Static)
 
         if not self.bills:
             # No bills - show empty message
-            empty_msg = Static(
-                "📭 No bills entered yet.\nCreate your first bill from the home screen!",
-                id="bill-content",
-                classes="empty-message",
-            )
-            await container.mount(empty_msg)
+            message.update("📭 No bills entered yet.\nCreate your first bill from the home screen!")
+            message.display = True
+            if self._table is not None:
+                self._table.display = False
             return
 
-        # Create table
-        table: DataTable = DataTable(id="bill-content", cursor_type="row")
-        table.add_columns("Date", "Description", "Payer", "Total")
-
-        # Add bill rows
-        for bill in self.bills:
-            assert app.bill_service is not None
-            payer = app.user_service.get_user(bill.payer_id)
-            total = app.bill_service.calculate_total_cost(bill.id)  # type: ignore[arg-type]
-
-            table.add_row(
-                bill.created_at.strftime("%Y-%m-%d %H:%M"),
-                bill.description[:40] + "..." if len(bill.description) > 40 else bill.description,
-                payer.name if payer else "Unknown",
-                f"${total:.2f}",
-                key=str(bill.id),
+        # Payer names and totals take one query each, fetched together in
+        # one trip to the database thread
+        payer_names, totals = await self._splitfool_app.run_db(self._fetch_row_data)
+
+        # Format every cell before touching the table
+        rows = [
+            (
+                bill.created_at.isoformat(sep=" ", timespec="minutes"),
+                _truncate(bill.description),
+                payer_names.get(bill.payer_id, "Unknown"),
+                _format_total(totals, bill.id),
+                str(bill.id),
             )
+            for bill in self.bills
+        ]
+
+        # Create the table once; later loads only swap its rows
+        table = self._table
+        if table is None:
+            table = self._table = DataTable(id="bill-table", cursor_type="row")
+            table.add_columns("Date", "Description", "Payer", "Total")
+            await self.query_one("#list-container", Container).mount(table)
+        else:
+            table.clear()
+
+        # Rows go one at a time because add_rows can't take row keys (it
+        # calls add_row per row anyway); plain unpacking skips building a
+        # list of cells for every row
+        for date, description, payer, total, key in rows:
+            table.add_row(date, description, payer, total, key=key)
+
+        message.display = False
+        table.display = True
 
-        await container.mount(table)
+    def _fetch_row_data(self) -> tuple[dict[int, str], dict[int, Decimal]]:
+        """Look up payer names and totals for the listed bills.
+
+        Runs on the app's database thread.
+
+        Returns:
+            Tuple of (payer ID -> name, bill ID -> total cost)
+        """
+        bill_svc, user_svc = self._services()
+        payer_names = user_svc.get_user_names(sorted({bill.payer_id for bill in self.bills}))
+        totals = bill_svc.calculate_total_costs(
+            [bill.id for bill in self.bills if bill.id is not None]
+        )
+        return payer_names, totals
 
     async def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle bill row selection.
@@ -193,23 +298,34 @@ class HistoryScreen(Screen[None]):
         Args:
             bill_id: ID of bill to show
         """
-        from splitfool.ui.app import SplitfoolApp
-
-        app = self.app
-        assert isinstance(app, SplitfoolApp), "App must be SplitfoolApp"
-        assert app.bill_service is not None, "BillService must be initialized"
-        assert app.user_service is not None, "UserService must be initialized"
-
-        # Get bill details
-        self.current_detail = app.bill_service.get_bill(bill_id)
-        if not self.current_detail:
-            self.app.notify("Bill not found", severity="error")
+        # Already shown or still loading: selected_bill_id is claimed before
+        # the database trip, and going back to the list clears it
+        if self.selected_bill_id == bill_id:
             return
-
         self.selected_bill_id = bill_id
 
-        # Format detail view
-        detail_text = self._format_bill_detail(self.current_detail)
+        cached = self._detail_cache.get(bill_id)
+        if cached is not None:
+            self._detail_cache.move_to_end(bill_id)
+            self.current_detail, detail_text = cached
+        else:
+            bill_svc, _ = self._services()
+
+            # Get bill details
+            try:
+                detail = await self._splitfool_app.run_db(bill_svc.get_bill, bill_id)
+            except BillNotFoundError:
+                self.selected_bill_id = None
+                self.current_detail = None
+                self.app.notify("Bill not found", severity="error")
+                return
+
+            # Format detail view
+            detail_text = self._format_bill_detail(detail)
+            self.current_detail = detail
+            self._detail_cache[bill_id] = (detail, detail_text)
+            if len(self._detail_cache) > DETAIL_CACHE_SIZE:
+                self._detail_cache.popitem(last=False)
 
         # Update detail container
         detail_container = self.query_one("#detail-container", Container)
@@ -230,47 +346,38 @@ class HistoryScreen(Screen[None]):
         Returns:
             Formatted detail text
         """
-        from splitfool.ui.app import SplitfoolApp
-
-        app = self.app
-        assert isinstance(app, SplitfoolApp), "App must be SplitfoolApp"
-        assert app.user_service is not None, "UserService must be initialized"
-
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
+        bill = detail.bill
+        created = bill.created_at.isoformat(sep=" ", timespec="minutes")
 
         # Bill header
-        lines.append("[bold cyan]Bill Details[/bold cyan]")
-        lines.append("")
-        lines.append(f"[bold]Description:[/bold] {detail.bill.description}")
-        lines.append(f"[bold]Date:[/bold] {detail.bill.created_at.strftime('%Y-%m-%d %H:%M')}")
-        lines.append(f"[bold]Payer:[/bold] {detail.payer_name}")
-        lines.append(f"[bold]Tax/Fees:[/bold] ${detail.bill.tax:.2f}")
-        lines.append("")
-
-        # Items
-        lines.append("[bold cyan]Items:[/bold cyan]")
-        for item, assignments in detail.items:
-            lines.append(f"  • {item.description}: ${item.cost:.2f}")
-            for assignment in assignments:
-                user = app.user_service.get_user(assignment.user_id)
-                if user:
-                    fraction_pct = float(assignment.fraction * 100)
-                    lines.append(f"    - {user.name}: {fraction_pct:.1f}%")
-        lines.append("")
+        write("[bold cyan]Bill Details[/bold cyan]\n\n")
+        write(f"[bold]Description:[/bold] {bill.description}\n")
+        write(f"[bold]Date:[/bold] {created}\n")
+        write(f"[bold]Payer:[/bold] {detail.payer_name}\n")
+        write(f"[bold]Tax/Fees:[/bold] {format_currency(bill.tax)}\n\n")
+
+        # Items, summing the subtotal in the same pass
+        write("[bold cyan]Items:[/bold cyan]\n")
+        subtotal = Decimal("0")
+        for description, cost, assignment_rows in detail.item_rows:
+            subtotal += cost
+            write(f"  • {description}: {format_currency(cost)}\n")
+            for name, fraction in assignment_rows:
+                write(f"    - {name}: {float(fraction * 100):.1f}%\n")
+        write("\n")
 
         # Calculated shares
-        lines.append("[bold cyan]Calculated Shares:[/bold cyan]")
-        for user_id, amount in detail.calculated_shares.items():
-            user = app.user_service.get_user(user_id)
-            if user:
-                lines.append(f"  • {user.name}: ${amount:.2f}")
-        lines.append("")
+        write("[bold cyan]Calculated Shares:[/bold cyan]\n")
+        for name, amount in detail.share_rows:
+            write(f"  • {name}: {format_currency(amount)}\n")
+        write("\n")
 
         # Total
-        total = sum(item.cost for item, _ in detail.items) + detail.bill.tax
-        lines.append(f"[bold]Total Bill: ${total:.2f}[/bold]")
+        write(f"[bold]Total Bill: {format_currency(subtotal + bill.tax)}[/bold]")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     async def action_back_to_list(self) -> None:
         """Return to bill list view."""
@@ -291,17 +398,17 @@ class HistoryScreen(Screen[None]):
         Args:
             event: Button pressed event
         """
-        button_id = str(event.button.id)
-
-        if button_id == "refresh-btn":
-            await self.action_refresh()
-        elif button_id == "back-btn":
-            await self.action_back()
+        action = self._BUTTON_ACTIONS.get(str(event.button.id))
+        if action is not None:
+            await self.run_action(action)
 
     async def action_refresh(self) -> None:
         """Refresh bill list."""
         await self.action_back_to_list()  # First go back to list if in detail view
-        await self.load_bills()
+        try:
+            await self._start_load().wait()
+        except WorkerCancelled:
+            return  # A newer refresh took over and will report instead
         self.app.notify("Bill history refreshed", severity="information")
 
     async def action_back(self) -> None:
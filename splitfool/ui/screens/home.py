@@ -44,6 +44,17 @@ class HomeScreen(Screen[None]):
         ("escape", "quit", "Quit"),
     ]
 
+    # (label, button id, variant, action run on press) per menu button
+    _MENU_ITEMS = (
+        ("👥 Manage Users [u]", "btn-users", "primary", "manage_users"),
+        ("💵 New Bill [b]", "btn-bill", "default", "new_bill"),
+        ("⚖️  View Balances [v]", "btn-balances", "default", "view_balances"),
+        ("📜 View History [h]", "btn-history", "default", "view_history"),
+        ("❓ Help [?]", "btn-help", "default", "app.help"),
+        ("🚪 Quit [q]", "btn-quit", "error", "app.quit"),
+    )
+    _BUTTON_ACTIONS = {button_id: action for _, button_id, _, action in _MENU_ITEMS}
+
     def compose(self) -> ComposeResult:
         """Compose home screen.
 
@@ -53,40 +64,25 @@ class HomeScreen(Screen[None]):
         with Container(id="menu"):
             yield Static("🧾 Splitfool", id="title")
             yield Static("Bill Splitting Application\n", id="subtitle")
-            yield Button("👥 Manage Users [u]", id="btn-users", variant="primary")
-            yield Button("💵 New Bill [b]", id="btn-bill", variant="default")
-            yield Button("⚖️  View Balances [v]", id="btn-balances", variant="default")
-            yield Button("📜 View History [h]", id="btn-history", variant="default")
-            yield Button("❓ Help [?]", id="btn-help", variant="default")
-            yield Button("🚪 Quit [q]", id="btn-quit", variant="error")
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+            for label, button_id, variant, _ in self._MENU_ITEMS:
+                yield Button(label, id=button_id, variant=variant)  # type: ignore[arg-type]
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses.
 
         Args:
             event: Button press event
         """
-        button_id = event.button.id
-
-        if button_id == "btn-users":
-            self.action_manage_users()
-        elif button_id == "btn-bill":
-            self.action_new_bill()
-        elif button_id == "btn-balances":
-            self.action_view_balances()
-        elif button_id == "btn-history":
-            self.action_view_history()
-        elif button_id == "btn-help":
-            self.app.action_help()
-        elif button_id == "btn-quit":
-            self.app.exit()
+        action = self._BUTTON_ACTIONS.get(str(event.button.id))
+        if action is not None:
+            await self.run_action(action)
 
     def action_manage_users(self) -> None:
         """Navigate to user management screen."""
         from splitfool.ui.screens.user_management import UserManagementScreen
         self.app.push_screen(UserManagementScreen())
 
-    def action_new_bill(self) -> None:
+    async def action_new_bill(self) -> None:
         """Navigate to bill entry screen."""
         from splitfool.ui.app import SplitfoolApp
         from splitfool.ui.screens.bill_entry import BillEntryScreen
@@ -95,7 +91,7 @@ class HomeScreen(Screen[None]):
         assert isinstance(app, SplitfoolApp), "App must be SplitfoolApp"
 
         # Get all users
-        users = app.user_service.get_all_users()
+        users = await app.run_db(app.user_service.get_all_users)
         if not users:
             self.app.notify("No users found. Please add users first.", severity="error")
             return
@@ -281,6 +281,7 @@ class ItemEntryScreen(ModalScreen[ItemData | None]):
             item_data.description = description
             item_data.cost = cost
             item_data.assignments = assignments
+            item_data.compute_shares()
 
             self.dismiss(item_data)
 
@@ -5,6 +5,7 @@ from textual.containers import Container, Horizontal
 from textual.screen import Screen
 from textual.widgets import Button, DataTable, Input, Static
 
+from splitfool.models.user import User
 from splitfool.utils.errors import DuplicateUserError, ValidationError
 
 
@@ -67,6 +68,8 @@ class UserManagementScreen(Screen[None]):
         """Initialize user management screen."""
         super().__init__()
         self.selected_user_id: int | None = None
+        # Users shown in the table by ID, so edit and delete need no lookup
+        self._users: dict[int, User] = {}
 
     def compose(self) -> ComposeResult:
         """Compose user management screen.
@@ -87,7 +90,7 @@ class UserManagementScreen(Screen[None]):
                 yield Button("Delete [d]", id="btn-delete", variant="error")
             yield Static("", id="error-message")
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Initialize screen on mount."""
         table = self.query_one("#user-table", DataTable)
 
@@ -100,12 +103,12 @@ class UserManagementScreen(Screen[None]):
         table.zebra_stripes = True  # Alternate row colors for visibility
         table.show_cursor = True
 
-        self.load_users()
+        await self.load_users()
 
         # Focus the table to ensure it's visible
         table.focus()
 
-    def load_users(self) -> None:
+    async def load_users(self) -> None:
         """Load users from database and populate table."""
         table = self.query_one("#user-table", DataTable)
 
@@ -117,38 +120,39 @@ class UserManagementScreen(Screen[None]):
         assert isinstance(app, SplitfoolApp)
 
         if app.user_service:
-            users = app.user_service.get_all_users()
+            users = await app.run_db(app.user_service.get_all_users)
+            self._users = {user.id: user for user in users if user.id is not None}
             self.notify(f"Loading {len(users)} users...")
             for user in users:
-                created_str = user.created_at.strftime("%Y-%m-%d %H:%M")
+                created_str = user.created_at.isoformat(sep=" ", timespec="minutes")
                 table.add_row(str(user.id), user.name, created_str, key=str(user.id))
 
             # Force table to refresh and update display
             table.refresh()
             self.notify(f"✓ Loaded {table.row_count} rows")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses.
 
         Args:
             event: Button press event
         """
         if event.button.id == "btn-add":
-            self.add_user()
+            await self.add_user()
         elif event.button.id == "btn-edit":
-            self.action_edit_user()
+            await self.action_edit_user()
         elif event.button.id == "btn-delete":
-            self.action_delete_user()
+            await self.action_delete_user()
 
-    def on_input_submitted(self, event: Input.Submitted) -> None:
+    async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle input submission (Enter key).
 
         Args:
             event: Input submission event
         """
-        self.add_user()
+        await self.add_user()
 
-    def add_user(self) -> None:
+    async def add_user(self) -> None:
         """Add a new user or update existing user if one is selected."""
         user_input = self.query_one("#user-input", Input)
         error_message = self.query_one("#error-message", Static)
@@ -167,17 +171,17 @@ class UserManagementScreen(Screen[None]):
             if app.user_service:
                 # If a user is selected, update it; otherwise create new
                 if self.selected_user_id is not None:
-                    app.user_service.update_user(self.selected_user_id, name)
+                    await app.run_db(app.user_service.update_user, self.selected_user_id, name)
                     user_input.value = ""
                     error_message.update("")
                     self.selected_user_id = None
-                    self.load_users()
+                    await self.load_users()
                     self.app.notify(f"✅ User updated to '{name}'")
                 else:
-                    app.user_service.create_user(name)
+                    await app.run_db(app.user_service.create_user, name)
                     user_input.value = ""
                     error_message.update("")
-                    self.load_users()
+                    await self.load_users()
                     self.app.notify(f"✅ User '{name}' created")
         except ValidationError as e:
             error_message.update(f"⚠️ {e.message}")
@@ -198,7 +202,7 @@ class UserManagementScreen(Screen[None]):
         user_input.value = ""
         user_input.focus()
 
-    def action_edit_user(self) -> None:
+    async def action_edit_user(self) -> None:
         """Edit the selected user."""
         error_message = self.query_one("#error-message", Static)
         user_input = self.query_one("#user-input", Input)
@@ -213,7 +217,9 @@ class UserManagementScreen(Screen[None]):
 
         try:
             if app.user_service:
-                user = app.user_service.get_user(self.selected_user_id)
+                user = self._users.get(self.selected_user_id) or await app.run_db(
+                    app.user_service.get_user, self.selected_user_id
+                )
 
                 # Pre-fill the input with current name
                 user_input.value = user.name
@@ -224,7 +230,7 @@ class UserManagementScreen(Screen[None]):
         except Exception as e:
             error_message.update(f"⚠️ {str(e)}")
 
-    def action_delete_user(self) -> None:
+    async def action_delete_user(self) -> None:
         """Delete the selected user with confirmation."""
         error_message = self.query_one("#error-message", Static)
 
@@ -238,17 +244,21 @@ class UserManagementScreen(Screen[None]):
 
         try:
             if app.user_service:
-                user = app.user_service.get_user(self.selected_user_id)
+                user = self._users.get(self.selected_user_id) or await app.run_db(
+                    app.user_service.get_user, self.selected_user_id
+                )
 
                 # Show confirmation dialog
-                def check_delete(confirmed: bool) -> None:
+                async def check_delete(confirmed: bool) -> None:
                     """Handle delete confirmation."""
                     if confirmed and app.user_service:
                         try:
-                            app.user_service.delete_user(self.selected_user_id)  # type: ignore
+                            await app.run_db(
+                                app.user_service.delete_user, self.selected_user_id  # type: ignore
+                            )
                             error_message.update("")
                             self.selected_user_id = None
-                            self.load_users()
+                            await self.load_users()
                             self.app.notify(f"✅ User '{user.name}' deleted")
                         except Exception as e:
                             error_message.update(f"⚠️ {str(e)}")
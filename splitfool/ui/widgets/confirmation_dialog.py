@@ -73,6 +73,16 @@ class ConfirmationDialog(ModalScreen[bool]):
         self.confirm_label = confirm_label
         self.cancel_label = cancel_label
 
+    def set_message(self, message: str) -> None:
+        """Replace the dialog message, so one dialog can be shown again.
+
+        Args:
+            message: New dialog message
+        """
+        self.dialog_message = message
+        if self.is_mounted:
+            self.query_one("#message", Static).update(message)
+
     def compose(self) -> ComposeResult:
         """Compose dialog.
 
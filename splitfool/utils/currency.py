@@ -1,10 +1,27 @@
 """Currency handling utilities using Decimal for precision."""
 
-from decimal import ROUND_HALF_UP, Decimal, getcontext
+from decimal import ROUND_HALF_UP, Decimal
 
-# Set global precision for currency calculations
-getcontext().prec = 10
-getcontext().rounding = ROUND_HALF_UP
+# Storage scales: money is persisted as integer cents, fractions as integer
+# parts-per-million, so database reads avoid the float -> str -> Decimal trip
+CENTS_PER_UNIT = Decimal(100)
+PPM_PER_UNIT = Decimal(1_000_000)
+PPM_ONE = 1_000_000
+
+ZERO = Decimal(0)
+ONE = Decimal(1)
+_CENT = Decimal("0.01")
+
+# An item's assignment fractions must sum to 1.0 within this tolerance, which
+# keeps rounded splits such as 0.334 + 0.333 + 0.334 valid; the schema's
+# fraction-sum trigger and the repository checks use the ppm form
+FRACTION_TOLERANCE = Decimal("0.001")
+FRACTION_TOLERANCE_PPM = 1_000
+
+# Rounding is passed to every quantize call rather than set on the decimal
+# context, which is per thread: the UI runs service calls on a worker thread
+# that would otherwise round half-even
+ROUNDING = ROUND_HALF_UP
 
 
 def format_currency(amount: Decimal) -> str:
@@ -22,7 +39,7 @@ def format_currency(amount: Decimal) -> str:
         >>> format_currency(Decimal('0.5'))
         '$0.50'
     """
-    return f"${amount.quantize(Decimal('0.01'))}"
+    return f"${amount.quantize(_CENT, rounding=ROUNDING)}"
 
 
 def parse_currency(value: str) -> Decimal:
@@ -60,5 +77,72 @@ def validate_positive_decimal(value: Decimal, field_name: str = "value") -> None
     Raises:
         ValueError: If value is not positive
     """
-    if value <= Decimal("0"):
+    if value <= ZERO:
         raise ValueError(f"{field_name} must be positive, got {value}")
+
+
+def to_cents(amount: Decimal) -> int:
+    """Convert a Decimal amount to integer cents for storage.
+
+    Args:
+        amount: Decimal amount (rounded half-up to the nearest cent)
+
+    Returns:
+        Amount in cents
+
+    Examples:
+        >>> to_cents(Decimal('12.345'))
+        1235
+    """
+    return int((amount * CENTS_PER_UNIT).quantize(ONE, rounding=ROUNDING))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert stored integer cents back to a Decimal amount.
+
+    Args:
+        cents: Amount in cents
+
+    Returns:
+        Decimal amount
+
+    Examples:
+        >>> from_cents(1235)
+        Decimal('12.35')
+        >>> from_cents(1200)
+        Decimal('12.00')
+    """
+    # Shifting the exponent is exact and cheaper than dividing by 100
+    return Decimal(cents).scaleb(-2)
+
+
+def to_ppm(fraction: Decimal) -> int:
+    """Convert a Decimal fraction to integer parts-per-million for storage.
+
+    Args:
+        fraction: Fraction between 0 and 1 (rounded half-up to 6 places)
+
+    Returns:
+        Fraction in parts-per-million
+
+    Examples:
+        >>> to_ppm(Decimal('0.5'))
+        500000
+    """
+    return int((fraction * PPM_PER_UNIT).quantize(ONE, rounding=ROUNDING))
+
+
+def from_ppm(ppm: int) -> Decimal:
+    """Convert stored parts-per-million back to a Decimal fraction.
+
+    Args:
+        ppm: Fraction in parts-per-million
+
+    Returns:
+        Decimal fraction
+
+    Examples:
+        >>> from_ppm(500000)
+        Decimal('0.5')
+    """
+    return Decimal(ppm) / PPM_PER_UNIT
@@ -4,20 +4,24 @@ import sqlite3
 from pathlib import Path
 
 
-def check_database_integrity(db_path: str) -> tuple[bool, str | None]:
+def check_database_integrity(db: str | sqlite3.Connection) -> tuple[bool, str | None]:
     """Check database integrity.
 
     Args:
-        db_path: Path to database file
+        db: Open connection to check, or path to a database file to open
 
     Returns:
         Tuple of (is_valid, error_message)
     """
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.execute("PRAGMA integrity_check")
-        result = cursor.fetchone()[0]
-        conn.close()
+        if isinstance(db, sqlite3.Connection):
+            result = db.execute("PRAGMA integrity_check").fetchone()[0]
+        else:
+            conn = sqlite3.connect(db)
+            try:
+                result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+            finally:
+                conn.close()
 
         if result == "ok":
             return True, None
@@ -76,8 +80,10 @@ def recover_database(db_path: str) -> tuple[bool, str]:
         backup_msg = "Failed to create backup"
 
     try:
-        # Remove corrupted database
+        # Remove corrupted database, along with any WAL files left beside it
         Path(db_path).unlink()
+        for suffix in ("-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
 
         # Initialize fresh database
         initialize_database(db_path)
@@ -18,7 +18,7 @@ def in_memory_db() -> sqlite3.Connection:
         SQLite connection to in-memory database
     """
     initialize_database(":memory:")
-    conn = sqlite3.connect(":memory:")
+    conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     
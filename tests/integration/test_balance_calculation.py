@@ -15,7 +15,7 @@ from splitfool.services.user_service import UserService
 @pytest.fixture
 def db_connection() -> sqlite3.Connection:
     """Create in-memory database for testing."""
-    conn = sqlite3.connect(":memory:")
+    conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     conn.executescript(SCHEMA_SQL)
@@ -1,11 +1,14 @@
 """Integration tests for complete bill workflow."""
 
+import asyncio
 import sqlite3
 from datetime import datetime
 from decimal import Decimal
 
 import pytest
 
+from splitfool.config import Config
+from splitfool.db.connection import get_connection
 from splitfool.db.schema import SCHEMA_SQL
 from splitfool.models.user import User
 from splitfool.services.bill_service import AssignmentInput, BillInput, BillService, ItemInput
@@ -15,7 +18,7 @@ from splitfool.services.user_service import UserService
 @pytest.fixture
 def db_connection() -> sqlite3.Connection:
     """Create in-memory database for testing."""
-    conn = sqlite3.connect(":memory:")
+    conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     conn.executescript(SCHEMA_SQL)
@@ -551,3 +554,100 @@ def test_complex_bill_scenario(services: tuple[UserService, BillService]) -> Non
     # Tax: (60/200) * $25 = $7.50
     # Total: $67.50
     assert abs(alice_share - Decimal("67.50")) < Decimal("0.01")
+
+
+def test_half_cent_cost_saved_through_app_db_thread_rounds_half_up(tmp_path):  # type: ignore
+    """Test that the app's database thread stores half-cent costs rounded half-up."""
+    from splitfool.ui.app import SplitfoolApp
+
+    db_path = str(tmp_path / "test.db")
+    conn = get_connection(db_path)
+    app = SplitfoolApp(config=Config(db_path), conn=conn)
+    
+    async def save_bill() -> Decimal:
+        async with app.run_test():
+            alice = await app.run_db(app.user_service.create_user, "Alice")
+            assert alice.id is not None
+            bill = await app.run_db(
+                app.bill_service.create_bill,
+                BillInput(
+                    payer_id=alice.id,
+                    description="Half cent",
+                    tax=Decimal("0.00"),
+                    items=[
+                        ItemInput(
+                            description="Gum",
+                            cost=Decimal("2.125"),
+                            assignments=[
+                                AssignmentInput(user_id=alice.id, fraction=Decimal("1.0"))
+                            ],
+                        )
+                    ],
+                ),
+            )
+            assert bill.id is not None
+            return await app.run_db(app.bill_service.calculate_total_cost, bill.id)
+    
+    assert asyncio.run(save_bill()) == Decimal("2.13")
+    conn.close()
+
+
+def test_bill_entry_preview_matches_stored_shares(tmp_path):  # type: ignore
+    """Test that the bill entry preview rounds shares the same way they are stored."""
+    from splitfool.ui.app import SplitfoolApp
+    from splitfool.ui.screens.bill_entry import BillEntryScreen, ItemData
+
+    db_path = str(tmp_path / "test.db")
+    conn = get_connection(db_path)
+    app = SplitfoolApp(config=Config(db_path), conn=conn)
+    
+    async def preview_and_save() -> tuple[str, dict[int, Decimal], list[User]]:
+        async with app.run_test() as pilot:
+            users = [
+                await app.run_db(app.user_service.create_user, name) for name in ("Alice", "Bob")
+            ]
+            alice, bob = users
+            assert alice.id is not None and bob.id is not None
+            screen = BillEntryScreen(users)
+            await app.push_screen(screen)
+            await pilot.pause()
+            
+            # $4.25 split in half is $2.125 each, stored half-up as $2.13
+            item = ItemData()
+            item.description = "Fries"
+            item.cost = Decimal("4.25")
+            item.assignments = [(alice.id, Decimal("0.5")), (bob.id, Decimal("0.5"))]
+            item.compute_shares()
+            screen.items.append(item)
+            screen._recompute_item_aggregates()
+            await screen.update_preview()
+            preview = str(screen._preview.content)
+            
+            bill = await app.run_db(
+                app.bill_service.create_bill,
+                BillInput(
+                    payer_id=alice.id,
+                    description="Lunch",
+                    tax=Decimal("0.00"),
+                    items=[
+                        ItemInput(
+                            description=item.description,
+                            cost=item.cost,
+                            assignments=[
+                                AssignmentInput(user_id=user_id, fraction=fraction)
+                                for user_id, fraction in item.assignments
+                            ],
+                        )
+                    ],
+                ),
+            )
+            assert bill.id is not None
+            shares = await app.run_db(app.bill_service.calculate_all_shares, bill.id)
+            return preview, shares, users
+    
+    preview, shares, users = asyncio.run(preview_and_save())
+    for user in users:
+        assert user.id is not None
+        assert shares[user.id] == Decimal("2.13")
+        assert f"{user.name}: ${shares[user.id]}" in preview
+    conn.close()
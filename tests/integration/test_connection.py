@@ -0,0 +1,378 @@
+"""Integration tests for database connection management."""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from splitfool.db.connection import (
+    ConnectionPool,
+    StatementCache,
+    iter_rows,
+    get_connection,
+    get_schema_version,
+    initialize_database,
+    tuple_cursor,
+)
+from splitfool.db.mapping import make_row_mapper
+from splitfool.db.schema import SCHEMA_VERSION, from_epoch, to_epoch
+from splitfool.db.uow import UnitOfWork, transactional
+from splitfool.services.bill_service import BillService
+
+# Schema as shipped in version 1 (REAL money and fraction columns)
+V1_SCHEMA_SQL = """
+-- Users table
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_users_name ON users(name);
+
+-- Bills table
+CREATE TABLE IF NOT EXISTS bills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payer_id INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    tax REAL NOT NULL CHECK(tax >= 0),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (payer_id) REFERENCES users(id)
+);
+CREATE INDEX IF NOT EXISTS idx_bills_payer_id ON bills(payer_id);
+CREATE INDEX IF NOT EXISTS idx_bills_created_at ON bills(created_at DESC);
+
+-- Items table
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    bill_id INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    cost REAL NOT NULL CHECK(cost > 0),
+    FOREIGN KEY (bill_id) REFERENCES bills(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_items_bill_id ON items(bill_id);
+
+-- Assignments table
+CREATE TABLE IF NOT EXISTS assignments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    fraction REAL NOT NULL CHECK(fraction > 0 AND fraction <= 1),
+    FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(id),
+    UNIQUE(item_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS idx_assignments_item_id ON assignments(item_id);
+CREATE INDEX IF NOT EXISTS idx_assignments_user_id ON assignments(user_id);
+
+-- Settlements table
+CREATE TABLE IF NOT EXISTS settlements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    settled_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    note TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_settlements_settled_at ON settlements(settled_at DESC);
+
+-- Schema version tracking
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+INSERT OR IGNORE INTO schema_version (version) VALUES (1);
+"""
+
+
+def test_connection_pool_reuses_connection(tmp_path):  # type: ignore
+    """Test that the pool hands out one connection per database path."""
+    pool = ConnectionPool()
+    db_path = str(tmp_path / "test.db")
+    
+    conn1 = pool.get(db_path)
+    conn2 = pool.get(db_path)
+    
+    assert conn1 is conn2
+    pool.close_all()
+
+
+def test_connection_pool_close_reopens(tmp_path):  # type: ignore
+    """Test that closing a pooled connection makes the next get reopen it."""
+    pool = ConnectionPool()
+    db_path = str(tmp_path / "test.db")
+    
+    conn1 = pool.get(db_path)
+    pool.close(db_path)
+    conn2 = pool.get(db_path)
+    
+    assert conn1 is not conn2
+    assert conn2.execute("SELECT 1").fetchone()[0] == 1
+    pool.close_all()
+
+
+def test_connection_pool_close_refreshes_statistics(tmp_path):  # type: ignore
+    """Test that closing a pooled connection leaves planner statistics."""
+    pool = ConnectionPool()
+    db_path = str(tmp_path / "test.db")
+    initialize_database(db_path)
+    
+    pool.get(db_path).execute("INSERT INTO users (name) VALUES ('Alice')")
+    pool.close(db_path)
+    
+    conn = get_connection(db_path)
+    tables = {row[0] for row in conn.execute("SELECT tbl FROM sqlite_stat1")}
+    assert "users" in tables
+    conn.close()
+
+
+def test_connection_pool_closes_when_statistics_fail(tmp_path, monkeypatch):  # type: ignore
+    """Test that a failing statistics refresh still closes every pooled connection."""
+    def locked(conn: sqlite3.Connection) -> None:
+        raise sqlite3.OperationalError("database is locked")
+    
+    monkeypatch.setattr("splitfool.db.connection.refresh_statistics", locked)
+    pool = ConnectionPool()
+    conns = [pool.get(str(tmp_path / name)) for name in ("a.db", "b.db")]
+    
+    pool.close_all()
+    
+    for conn in conns:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_get_connection_uses_wal(tmp_path):  # type: ignore
+    """Test that read-write connections are switched to WAL journaling."""
+    db_path = str(tmp_path / "test.db")
+    conn = get_connection(db_path)
+    
+    mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    
+    assert mode == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    conn.close()
+
+
+def test_get_connection_read_only(tmp_path):  # type: ignore
+    """Test that read-only connections can read but not write."""
+    db_path = str(tmp_path / "test.db")
+    initialize_database(db_path)
+    conn = get_connection(db_path, read_only=True)
+    
+    assert conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("INSERT INTO users (name) VALUES ('Alice')")
+    conn.close()
+
+
+def test_get_connection_usable_from_worker_thread(tmp_path):  # type: ignore
+    """Test that a connection opened here can be queried from another thread."""
+    db_path = str(tmp_path / "test.db")
+    initialize_database(db_path)
+    conn = get_connection(db_path)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        count = executor.submit(
+            lambda: conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        ).result()
+    
+    assert count == 0
+    conn.close()
+
+
+def test_tuple_cursor_returns_plain_tuples(tmp_path):  # type: ignore
+    """Test that tuple cursors bypass the connection's Row factory."""
+    conn = get_connection(str(tmp_path / "test.db"))
+    
+    row = tuple_cursor(conn).execute("SELECT 1, 'a'").fetchone()
+    
+    assert type(row) is tuple
+    assert row == (1, "a")
+    assert isinstance(conn.execute("SELECT 1").fetchone(), sqlite3.Row)
+    conn.close()
+
+
+def test_timestamps_stored_as_epoch_microseconds(tmp_path):  # type: ignore
+    """Test that timestamps bind and default to integer epoch microseconds."""
+    db_path = str(tmp_path / "test.db")
+    initialize_database(db_path)
+    conn = get_connection(db_path)
+    created = datetime(2024, 5, 1, 12, 30, 15, 250)
+    
+    conn.execute("INSERT INTO users (name, created_at) VALUES ('Alice', ?)", (created,))
+    conn.execute("INSERT INTO users (name) VALUES ('Bob')")
+    rows = conn.execute("SELECT name, created_at FROM users ORDER BY name").fetchall()
+    
+    assert rows[0]["created_at"] == to_epoch(created)
+    assert from_epoch(rows[0]["created_at"]) == created
+    assert abs(from_epoch(rows[1]["created_at"]) - datetime.now()) < timedelta(minutes=1)
+    conn.close()
+
+
+def test_statement_cache_reuses_cursor_per_statement(tmp_path):  # type: ignore
+    """Test that each SQL string gets one cursor that is reused across calls."""
+    conn = get_connection(str(tmp_path / "test.db"))
+    stmts = StatementCache(conn)
+    
+    first = stmts.execute("SELECT ?", (1,))
+    assert first.fetchone()[0] == 1
+    second = stmts.execute("SELECT ?", (2,))
+    
+    assert second is first
+    assert second.fetchone()[0] == 2
+    assert stmts.execute("SELECT 3") is not first
+    conn.close()
+
+
+def test_statement_cache_tuple_rows(tmp_path):  # type: ignore
+    """Test that a tuple-row cache reuses cursors that yield plain tuples."""
+    conn = get_connection(str(tmp_path / "test.db"))
+    stmts = StatementCache(conn, tuple_rows=True)
+    
+    first = stmts.execute("SELECT ?, 'a'", (1,))
+    assert first.fetchone() == (1, "a")
+    second = stmts.execute("SELECT ?, 'a'", (2,))
+    
+    assert second is first
+    assert type(second.fetchone()) is tuple
+    assert isinstance(conn.execute("SELECT 1").fetchone(), sqlite3.Row)
+    conn.close()
+
+
+def test_iter_rows_streams_in_batches(tmp_path):  # type: ignore
+    """Test that iter_rows yields every row and can stop early."""
+    conn = get_connection(str(tmp_path / "test.db"))
+    cursor = conn.execute(
+        "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 10) "
+        "SELECT x FROM n"
+    )
+    
+    rows = iter_rows(cursor, batch_size=3)
+    assert [next(rows)[0] for _ in range(4)] == [1, 2, 3, 4]
+    assert [row[0] for row in rows] == [5, 6, 7, 8, 9, 10]
+    conn.close()
+
+
+def test_make_row_mapper_reads_named_and_positional_columns(tmp_path):  # type: ignore
+    """Test that generated mappers convert columns by row name or index."""
+    conn = get_connection(str(tmp_path / "test.db"))
+    by_name = make_row_mapper(
+        lambda *values: values, [("b", None), ("a", Decimal)], name="by_name"
+    )
+    by_index = make_row_mapper(lambda *values: values, [(1, str), (0, None)])
+    
+    row = conn.execute("SELECT 1 AS a, 'x' AS b").fetchone()
+    
+    assert by_name(row) == ("x", Decimal(1))
+    assert by_index(tuple(row)) == ("x", 1)
+    assert by_name.__name__ == "by_name"
+    conn.close()
+
+
+def test_unit_of_work_commits_or_rolls_back(tmp_path):  # type: ignore
+    """Test that a unit of work commits on success and rolls back on error."""
+    db_path = str(tmp_path / "test.db")
+    initialize_database(db_path)
+    conn = get_connection(db_path)
+    other = get_connection(db_path)
+    
+    with UnitOfWork(conn):
+        conn.execute("INSERT INTO users (name) VALUES ('Alice')")
+    with pytest.raises(RuntimeError), UnitOfWork(conn):
+        conn.execute("INSERT INTO users (name) VALUES ('Bob')")
+        raise RuntimeError("boom")
+    
+    names = [row[0] for row in other.execute("SELECT name FROM users")]
+    assert names == ["Alice"]
+    conn.close()
+    other.close()
+
+
+def test_write_outside_unit_of_work_autocommits(tmp_path):  # type: ignore
+    """Test that a bare write doesn't leave an implicit transaction open."""
+    db_path = str(tmp_path / "test.db")
+    initialize_database(db_path)
+    conn = get_connection(db_path)
+    other = get_connection(db_path)
+    
+    conn.execute("INSERT INTO users (name) VALUES ('Alice')")
+    
+    assert not conn.in_transaction
+    assert other.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 1
+    conn.close()
+    other.close()
+
+
+def test_nested_unit_of_work_commits_once_at_outermost(tmp_path):  # type: ignore
+    """Test that inner units join the outer transaction and its rollback."""
+    db_path = str(tmp_path / "test.db")
+    initialize_database(db_path)
+    conn = get_connection(db_path)
+    other = get_connection(db_path)
+    
+    class Service:
+        def __init__(self) -> None:
+            self.conn = conn
+    
+        @transactional
+        def add(self, name: str) -> None:
+            self.conn.execute("INSERT INTO users (name) VALUES (?)", (name,))
+    
+    service = Service()
+    with UnitOfWork(conn):
+        service.add("Alice")
+        assert conn.in_transaction  # Inner unit did not commit
+        assert other.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0
+    with pytest.raises(RuntimeError), UnitOfWork(conn):
+        service.add("Bob")
+        raise RuntimeError("boom")
+    service.add("Carol")
+    
+    names = [row[0] for row in other.execute("SELECT name FROM users ORDER BY name")]
+    assert names == ["Alice", "Carol"]
+    assert not conn.in_transaction
+    conn.close()
+    other.close()
+
+
+def test_initialize_database_migrates_v1_schema(tmp_path):  # type: ignore
+    """Test that a version 1 database is upgraded to integer storage."""
+    db_path = str(tmp_path / "test.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(V1_SCHEMA_SQL)
+    conn.execute("INSERT INTO users (id, name) VALUES (1, 'Alice')")
+    conn.execute(
+        "INSERT INTO bills (id, payer_id, description, tax) VALUES (1, 1, 'Dinner', 4.5)"
+    )
+    conn.execute("INSERT INTO items (id, bill_id, description, cost) VALUES (1, 1, 'Pizza', 12.34)")
+    conn.execute("INSERT INTO assignments (item_id, user_id, fraction) VALUES (1, 1, 1.0)")
+    conn.execute(
+        "INSERT INTO settlements (settled_at, note) VALUES ('2024-05-01 12:30:15.00025', '')"
+    )
+    conn.commit()
+    conn.close()
+    
+    initialize_database(db_path)
+    
+    conn = get_connection(db_path)
+    
+    assert get_schema_version(conn) == SCHEMA_VERSION
+    assert conn.execute("SELECT tax FROM bills").fetchone()[0] == 450
+    assert conn.execute("SELECT cost FROM items").fetchone()[0] == 1234
+    assert conn.execute("SELECT fraction FROM assignments").fetchone()[0] == 1_000_000
+    assert BillService(conn).calculate_total_cost(1) == Decimal("16.84")
+    settled_at = conn.execute("SELECT settled_at FROM settlements").fetchone()[0]
+    assert from_epoch(settled_at) == datetime(2024, 5, 1, 12, 30, 15, 250)
+    assert conn.execute("SELECT typeof(created_at) FROM bills").fetchone()[0] == "integer"
+    assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+    index_rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    indexes = {row[0] for row in index_rows}
+    assert "idx_bills_payer_created" in indexes
+    assert "idx_bills_payer_id" not in indexes
+    assert {"idx_items_bill_cost", "idx_assignments_item_share"} <= indexes
+    assert not {"idx_items_bill_id", "idx_assignments_item_id"} & indexes
+    # Upgrades leave planner statistics behind
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+    conn.close()
@@ -1,5 +1,6 @@
 """Integration tests for database repositories."""
 
+import sqlite3
 from datetime import datetime
 from decimal import Decimal
 
@@ -9,10 +10,11 @@ from splitfool.db.repositories import (
     AssignmentRepository,
     BillRepository,
     ItemRepository,
+    SettlementRepository,
     UserRepository,
 )
-from splitfool.models import Assignment, Bill, Item, User
-from splitfool.utils.errors import DuplicateUserError, UserNotFoundError
+from splitfool.models import Assignment, Bill, Item, Settlement, User
+from splitfool.utils.errors import BillNotFoundError, DuplicateUserError, UserNotFoundError
 from tests.fixtures import in_memory_db
 
 
@@ -165,6 +167,59 @@ def test_bill_repository_get_all(in_memory_db):  # type: ignore
     assert all_bills[0].description == "Bill 2"  # Newest first
 
 
+def test_bill_repository_get_all_pages_in_sql(in_memory_db):  # type: ignore
+    """Test that pages come from the created_at index and never overlap."""
+    user = UserRepository(in_memory_db).create(
+        User(id=None, name="Alice", created_at=datetime.now())
+    )
+    bill_repo = BillRepository(in_memory_db)
+    same_time = datetime(2025, 1, 1)
+    created = [
+        bill_repo.create(
+            Bill(id=None, payer_id=user.id, description=f"Bill {n}", tax=Decimal("0.00"), created_at=same_time)  # type: ignore
+        )
+        for n in range(5)
+    ]
+    
+    pages = [bill_repo.get_all(limit=2, offset=offset) for offset in (0, 2, 4)]
+    plan = " ".join(
+        row[3]
+        for row in in_memory_db.execute(
+            "EXPLAIN QUERY PLAN " + BillRepository._SQL_GET_ALL, (2, 0)
+        )
+    )
+    
+    assert [bill.id for page in pages for bill in page] == [bill.id for bill in created]
+    assert "idx_bills_created_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_bill_repository_get_by_user_uses_sorted_index(in_memory_db):  # type: ignore
+    """Test that payer lookups read the composite index in order, unsorted."""
+    plan = " ".join(
+        row[3]
+        for row in in_memory_db.execute(
+            "EXPLAIN QUERY PLAN " + BillRepository._SQL_GET_BY_USER, (1,)
+        )
+    )
+    
+    assert "idx_bills_payer_created" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_bill_repository_get_since_date_uses_sorted_index(in_memory_db):  # type: ignore
+    """Test that date-range reads search the created_at index without sorting."""
+    plan = " ".join(
+        row[3]
+        for row in in_memory_db.execute(
+            "EXPLAIN QUERY PLAN " + BillRepository._SQL_GET_SINCE, (0,)
+        )
+    )
+    
+    assert "idx_bills_created_at (created_at>?)" in plan
+    assert "TEMP B-TREE" not in plan
+
+
 def test_item_repository_create_and_get(in_memory_db):  # type: ignore
     """Test creating and retrieving items."""
     user_repo = UserRepository(in_memory_db)
@@ -194,6 +249,35 @@ def test_item_repository_create_and_get(in_memory_db):  # type: ignore
     
     assert len(items) == 1
     assert items[0].description == "Pizza"
+    assert item_repo.subtotal_cents(bill.id) == 2500  # type: ignore
+    assert item_repo.subtotal_cents(9999) == 0
+
+
+def test_bill_repository_get_cost_cents(in_memory_db):  # type: ignore
+    """Test reading a bill's subtotal and tax in cents with one query."""
+    user = UserRepository(in_memory_db).create(
+        User(id=None, name="Alice", created_at=datetime.now())
+    )
+    bill_repo = BillRepository(in_memory_db)
+    item_repo = ItemRepository(in_memory_db)
+    bill = bill_repo.create(
+        Bill(id=None, payer_id=user.id, description="Dinner", tax=Decimal("1.50"), created_at=datetime.now())  # type: ignore
+    )
+    empty = bill_repo.create(
+        Bill(id=None, payer_id=user.id, description="Empty", tax=Decimal("0"), created_at=datetime.now())  # type: ignore
+    )
+    item_repo.create(Item(id=None, bill_id=bill.id, description="Pizza", cost=Decimal("25.00")))  # type: ignore
+    item_repo.create(Item(id=None, bill_id=bill.id, description="Soda", cost=Decimal("2.25")))  # type: ignore
+    
+    assert bill_repo.get_cost_cents(bill.id) == (2725, 150)  # type: ignore
+    assert bill_repo.get_cost_cents(empty.id) == (0, 0)  # type: ignore
+    with pytest.raises(BillNotFoundError):
+        bill_repo.get_cost_cents(9999)
+    assert bill_repo.get_total_cents_many([bill.id, empty.id, 9999]) == {  # type: ignore
+        bill.id: 2875,
+        empty.id: 0,
+    }
+    assert bill_repo.get_total_cents_many([]) == {}
 
 
 def test_assignment_repository_create_and_get(in_memory_db):  # type: ignore
@@ -282,3 +366,180 @@ def test_assignment_repository_validate_fractions(in_memory_db):  # type: ignore
     )
     
     assert assign_repo.validate_fractions_sum(item.id)  # type: ignore
+
+
+def test_assignment_fraction_sum_trigger_rejects_overassignment(in_memory_db):  # type: ignore
+    """Test that the schema rejects fractions summing past 1.0 for an item."""
+    user_repo = UserRepository(in_memory_db)
+    bill_repo = BillRepository(in_memory_db)
+    item_repo = ItemRepository(in_memory_db)
+    assign_repo = AssignmentRepository(in_memory_db)
+    
+    alice = user_repo.create(User(id=None, name="Alice", created_at=datetime.now()))
+    bob = user_repo.create(User(id=None, name="Bob", created_at=datetime.now()))
+    bill = bill_repo.create(
+        Bill(
+            id=None,
+            payer_id=alice.id,  # type: ignore
+            description="Dinner",
+            tax=Decimal("0"),
+            created_at=datetime.now(),
+        )
+    )
+    item = item_repo.create(
+        Item(id=None, bill_id=bill.id, description="Pizza", cost=Decimal("25.00"))  # type: ignore
+    )
+    assign_repo.create(
+        Assignment(id=None, item_id=item.id, user_id=alice.id, fraction=Decimal("0.7"))  # type: ignore
+    )
+    
+    with pytest.raises(sqlite3.IntegrityError, match="exceed"):
+        assign_repo.create(
+            Assignment(id=None, item_id=item.id, user_id=bob.id, fraction=Decimal("0.5"))  # type: ignore
+        )
+    
+    assert len(assign_repo.get_by_item(item.id)) == 1  # type: ignore
+
+
+def test_assignment_repository_aggregate_unsettled_debt_units(in_memory_db):  # type: ignore
+    """Test that unsettled debt rows start after the latest settlement."""
+    user_repo = UserRepository(in_memory_db)
+    bill_repo = BillRepository(in_memory_db)
+    item_repo = ItemRepository(in_memory_db)
+    assign_repo = AssignmentRepository(in_memory_db)
+    
+    alice = user_repo.create(User(id=None, name="Alice", created_at=datetime.now()))
+    bob = user_repo.create(User(id=None, name="Bob", created_at=datetime.now()))
+    for month, cost in [(1, Decimal("10.00")), (3, Decimal("30.00"))]:
+        bill = bill_repo.create(
+            Bill(
+                id=None,
+                payer_id=alice.id,  # type: ignore
+                description=f"Month {month}",
+                tax=Decimal("1.00"),
+                created_at=datetime(2024, month, 1),
+            )
+        )
+        item = item_repo.create(
+            Item(id=None, bill_id=bill.id, description="Food", cost=cost)  # type: ignore
+        )
+        assign_repo.create(
+            Assignment(id=None, item_id=item.id, user_id=bob.id, fraction=Decimal("1"))  # type: ignore
+        )
+    
+    assert len(assign_repo.aggregate_unsettled_debt_units()) == 2
+    
+    SettlementRepository(in_memory_db).create(
+        Settlement(id=None, settled_at=datetime(2024, 2, 1), note="")
+    )
+    
+    assert assign_repo.aggregate_unsettled_debt_units() == [
+        (alice.id, bob.id, 3000 * 1_000_000, 3000, 100)
+    ]
+
+
+def test_item_and_assignment_repository_create_rows(in_memory_db):  # type: ignore
+    """Test batch-creating items and assignments from plain rows."""
+    user_repo = UserRepository(in_memory_db)
+    bill_repo = BillRepository(in_memory_db)
+    item_repo = ItemRepository(in_memory_db)
+    assign_repo = AssignmentRepository(in_memory_db)
+    
+    user = user_repo.create(User(id=None, name="Alice", created_at=datetime.now()))
+    bill = bill_repo.create(
+        Bill(
+            id=None,
+            payer_id=user.id,  # type: ignore
+            description="Dinner",
+            tax=Decimal("0"),
+            created_at=datetime.now(),
+        )
+    )
+    
+    item_ids = item_repo.create_rows(
+        bill.id, [("Pizza", Decimal("25.00")), ("Salad", Decimal("10.00"))]  # type: ignore
+    )
+    assign_repo.create_rows([(item_id, user.id, Decimal("0.5")) for item_id in item_ids])  # type: ignore
+    
+    items = item_repo.get_by_bill(bill.id)  # type: ignore
+    assert [item.id for item in items] == item_ids
+    assert [item.cost for item in items] == [Decimal("25.00"), Decimal("10.00")]
+    assert [a.fraction for a in assign_repo.get_by_item(item_ids[1])] == [Decimal("0.5")]
+    assert item_repo.create_rows(bill.id, []) == []  # type: ignore
+
+
+def test_item_repository_create_rows_requires_transaction():  # type: ignore
+    """Test that batched item IDs are never derived outside a transaction."""
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    
+    with pytest.raises(AssertionError):
+        ItemRepository(conn).create_rows(1, [("Pizza", Decimal("25.00"))])
+    conn.close()
+
+
+def test_bill_repository_fetch_bills_with_details(in_memory_db):  # type: ignore
+    """Test fetching bills with items, assignments and names in one query."""
+    user_repo = UserRepository(in_memory_db)
+    bill_repo = BillRepository(in_memory_db)
+    item_repo = ItemRepository(in_memory_db)
+    assign_repo = AssignmentRepository(in_memory_db)
+    
+    alice = user_repo.create(User(id=None, name="Alice", created_at=datetime.now()))
+    bob = user_repo.create(User(id=None, name="Bob", created_at=datetime.now()))
+    older = bill_repo.create(
+        Bill(
+            id=None,
+            payer_id=alice.id,  # type: ignore
+            description="Lunch",
+            tax=Decimal("2.00"),
+            created_at=datetime(2024, 1, 1, 12, 0),
+        )
+    )
+    newer = bill_repo.create(
+        Bill(
+            id=None,
+            payer_id=bob.id,  # type: ignore
+            description="Empty",
+            tax=Decimal("0"),
+            created_at=datetime(2024, 1, 2, 12, 0),
+        )
+    )
+    items = [
+        item_repo.create(
+            Item(id=None, bill_id=older.id, description=description, cost=cost)  # type: ignore
+        )
+        for description, cost in [("Pizza", Decimal("20.00")), ("Salad", Decimal("5.00"))]
+    ]
+    for item, user, fraction in [
+        (items[0], alice, Decimal("0.5")),
+        (items[0], bob, Decimal("0.5")),
+        (items[1], bob, Decimal("1.0")),
+    ]:
+        assign_repo.create(
+            Assignment(id=None, item_id=item.id, user_id=user.id, fraction=fraction)  # type: ignore
+        )
+    
+    details = bill_repo.fetch_bills_with_details([older.id, newer.id, 9999])  # type: ignore
+    
+    assert [bill.id for bill, _, _ in details] == [newer.id, older.id]
+    assert details[0][1] == []
+    assert details[0][2] == {bob.id: "Bob"}
+    
+    bill, bill_items, names = details[1]
+    assert bill.tax == Decimal("2.00")
+    assert [item.description for item, _ in bill_items] == ["Pizza", "Salad"]
+    assert [a.user_id for a in bill_items[0][1]] == [alice.id, bob.id]
+    assert bill_items[0][1][0].fraction == Decimal("0.5")
+    assert names == {alice.id: "Alice", bob.id: "Bob"}
+
+
+def test_user_repository_get_names(in_memory_db):  # type: ignore
+    """Test resolving several user names with one query."""
+    repo = UserRepository(in_memory_db)
+    alice = repo.create(User(id=None, name="Alice", created_at=datetime.now()))
+    bob = repo.create(User(id=None, name="Bob", created_at=datetime.now()))
+    
+    names = repo.get_names([alice.id, bob.id, 9999])  # type: ignore
+    
+    assert names == {alice.id: "Alice", bob.id: "Bob"}
+    assert repo.get_names([]) == {}
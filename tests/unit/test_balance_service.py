@@ -1,5 +1,6 @@
 """Unit tests for BalanceService."""
 
+import importlib.util
 import sqlite3
 from datetime import datetime
 from decimal import Decimal
@@ -16,7 +17,7 @@ def db_connection() -> sqlite3.Connection:
     """Create in-memory database for testing."""
     from splitfool.db.schema import SCHEMA_SQL
 
-    conn = sqlite3.Connection(":memory:")
+    conn = sqlite3.Connection(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     conn.executescript(SCHEMA_SQL)
@@ -92,6 +93,8 @@ def test_get_all_balances_single_bill_equal_split(
     assert balances[0].debtor_id == bob.id
     assert balances[0].creditor_id == alice.id
     assert balances[0].amount == Decimal("15.00")
+    assert balances[0].debtor_name == "Bob"
+    assert balances[0].creditor_name == "Alice"
 
 
 def test_get_all_balances_with_tax_distribution(
@@ -354,9 +357,179 @@ def test_get_all_balances_ignores_payer_own_share(
     assert balances == []
 
 
+def test_get_all_balances_simplify_cancels_debt_cycle(
+    balance_service: BalanceService,
+    bill_service: BillService,
+    sample_users: list[User],
+) -> None:
+    """Test that simplify removes cycles while preserving net positions."""
+    alice, bob, charlie = sample_users
+    assert alice.id is not None
+    assert bob.id is not None
+    assert charlie.id is not None
+
+    # Bob owes Alice $20, Charlie owes Bob $10, Alice owes Charlie $10
+    for payer, debtor, cost in [
+        (alice, bob, "20.00"),
+        (bob, charlie, "10.00"),
+        (charlie, alice, "10.00"),
+    ]:
+        assert payer.id is not None
+        assert debtor.id is not None
+        bill_service.create_bill(
+            BillInput(
+                payer_id=payer.id,
+                description="Cycle",
+                tax=Decimal("0.00"),
+                items=[
+                    ItemInput(
+                        description="Item",
+                        cost=Decimal(cost),
+                        assignments=[
+                            AssignmentInput(user_id=debtor.id, fraction=Decimal("1.0")),
+                        ],
+                    )
+                ],
+            )
+        )
+    
+    assert len(balance_service.get_all_balances()) == 3
+
+    balances = balance_service.get_all_balances(simplify=True)
+
+    # The $10 cycle cancels, leaving Bob owing Alice the remaining $10
+    assert len(balances) == 1
+    assert balances[0].debtor_id == bob.id
+    assert balances[0].creditor_id == alice.id
+    assert balances[0].amount == Decimal("10.00")
+
+
+def test_get_all_balances_sql_shares_match_python_shares(
+    balance_service: BalanceService,
+    bill_service: BillService,
+    sample_users: list[User],
+) -> None:
+    """Test that shares summed in SQL round exactly like share_cents."""
+    alice, bob, charlie = sample_users
+    assert alice.id is not None
+    assert bob.id is not None
+    assert charlie.id is not None
+    third = Decimal("0.333333")
+
+    for n, payer in enumerate([alice, bob, charlie, alice, bob]):
+        assert payer.id is not None
+        bill_service.create_bill(
+            BillInput(
+                payer_id=payer.id,
+                description=f"Bill {n}",
+                tax=Decimal(f"{n}.37"),
+                items=[
+                    ItemInput(
+                        description="Split three ways",
+                        cost=Decimal(f"{10 + n}.01"),
+                        assignments=[
+                            AssignmentInput(user_id=alice.id, fraction=third),
+                            AssignmentInput(user_id=bob.id, fraction=third),
+                            AssignmentInput(user_id=charlie.id, fraction=Decimal("0.333334")),
+                        ],
+                    ),
+                    ItemInput(
+                        description="Single",
+                        cost=Decimal("3.99"),
+                        assignments=[AssignmentInput(user_id=bob.id, fraction=Decimal("1.0"))],
+                    ),
+                ],
+            )
+        )
+
+    repo = balance_service.assignment_repo
+    gross_debts = repo.aggregate_unsettled_debts()
+    
+    assert gross_debts == balance_service._gross_debts(repo.aggregate_unsettled_debt_units())
+    assert repo.aggregate_unsettled_debts(charlie.id) == {
+        pair: debt for pair, debt in gross_debts.items() if charlie.id in pair
+    }
+
+
+def test_get_all_balances_falls_back_when_sql_overflows(
+    balance_service: BalanceService,
+    bill_service: BillService,
+    sample_users: list[User],
+) -> None:
+    """Test that amounts overflowing SQLite integers are shared out in Python."""
+    alice, bob = sample_users[:2]
+    assert alice.id is not None
+    assert bob.id is not None
+
+    bill_service.create_bill(
+        BillInput(
+            payer_id=alice.id,
+            description="Very large",
+            tax=Decimal("1000.00"),
+            items=[
+                ItemInput(
+                    description="Item",
+                    cost=Decimal("50000000.00"),
+                    assignments=[
+                        AssignmentInput(user_id=alice.id, fraction=Decimal("0.5")),
+                        AssignmentInput(user_id=bob.id, fraction=Decimal("0.5")),
+                    ],
+                )
+            ],
+        )
+    )
+    
+    assert balance_service.assignment_repo.aggregate_unsettled_debts() is None
+    
+    balances = balance_service.get_all_balances()
+
+    assert len(balances) == 1
+    assert balances[0].amount == Decimal("25000500.00")
+
+def test_get_all_balances_reuses_result_until_data_changes(
+    balance_service: BalanceService,
+    bill_service: BillService,
+    db_connection: sqlite3.Connection,
+    sample_users: list[User],
+) -> None:
+    """Test that balances are recomputed only after a write."""
+    alice, bob = sample_users[:2]
+    assert alice.id is not None
+    assert bob.id is not None
+
+    def lunch(cost: str) -> BillInput:
+        return BillInput(
+            payer_id=alice.id,  # type: ignore[arg-type]
+            description="Lunch",
+            tax=Decimal("0.00"),
+            items=[
+                ItemInput(
+                    description="Lunch",
+                    cost=Decimal(cost),
+                    assignments=[AssignmentInput(user_id=bob.id, fraction=Decimal("1.0"))],  # type: ignore[arg-type]
+                )
+            ],
+        )
+
+    bill_service.create_bill(lunch("10.00"))
+    first = balance_service.get_all_balances()
+    statements: list[str] = []
+    db_connection.set_trace_callback(statements.append)
+    second = balance_service.get_all_balances()
+    db_connection.set_trace_callback(None)
+
+    assert second == first
+    assert not any("FROM bills" in sql for sql in statements)
+
+    bill_service.create_bill(lunch("5.00"))
+    assert balance_service.get_all_balances()[0].amount == Decimal("15.00")
+    balance_service.settle_all_balances()
+    assert balance_service.get_all_balances() == []
+
 # T091: Test BalanceService.get_user_balances()
 
 
+
 def test_get_user_balances_no_balances(
     balance_service: BalanceService, sample_users: list[User]
 ) -> None:
@@ -593,6 +766,44 @@ def test_user_has_outstanding_balances_true_with_credits(
     assert balance_service.user_has_outstanding_balances(alice.id) is True
 
 
+def test_user_has_outstanding_balances_false_when_debts_cancel(
+    balance_service: BalanceService,
+    bill_service: BillService,
+    sample_users: list[User],
+) -> None:
+    """Test that mutual debts netting to zero leave nothing outstanding."""
+    alice, bob, charlie = sample_users
+    assert charlie.id is not None
+
+    # Alice and Bob each pay $10 for the other; Charlie owes Alice
+    for payer, debtor, cost in [
+        (alice, bob, "10.00"),
+        (bob, alice, "10.00"),
+        (alice, charlie, "5.00"),
+    ]:
+        assert payer.id is not None
+        assert debtor.id is not None
+        bill_service.create_bill(
+            BillInput(
+                payer_id=payer.id,
+                description="Swap",
+                tax=Decimal("0.00"),
+                items=[
+                    ItemInput(
+                        description="Item",
+                        cost=Decimal(cost),
+                        assignments=[
+                            AssignmentInput(user_id=debtor.id, fraction=Decimal("1.0")),
+                        ],
+                    )
+                ],
+            )
+        )
+
+    assert balance_service.user_has_outstanding_balances(bob.id) is False  # type: ignore
+    assert balance_service.user_has_outstanding_balances(charlie.id) is True
+
+
 # T091: Test BalanceService.preview_settlement()
 
 
@@ -604,6 +815,46 @@ def test_preview_settlement_empty(balance_service: BalanceService) -> None:
     assert preview.total_debts == Decimal("0")
 
 
+def test_preview_settlement_simplify_reduces_total(
+    balance_service: BalanceService,
+    bill_service: BillService,
+    sample_users: list[User],
+) -> None:
+    """Test that a simplified preview settles a debt cycle with less money moved."""
+    alice, bob, charlie = sample_users
+
+    # Bob owes Alice $20, Charlie owes Bob $10, Alice owes Charlie $10
+    for payer, debtor, cost in [
+        (alice, bob, "20.00"),
+        (bob, charlie, "10.00"),
+        (charlie, alice, "10.00"),
+    ]:
+        assert payer.id is not None
+        assert debtor.id is not None
+        bill_service.create_bill(
+            BillInput(
+                payer_id=payer.id,
+                description="Cycle",
+                tax=Decimal("0.00"),
+                items=[
+                    ItemInput(
+                        description="Item",
+                        cost=Decimal(cost),
+                        assignments=[
+                            AssignmentInput(user_id=debtor.id, fraction=Decimal("1.0")),
+                        ],
+                    )
+                ],
+            )
+        )
+
+    preview = balance_service.preview_settlement(simplify=True)
+
+    assert len(preview.balances) == 1
+    assert preview.total_debts == Decimal("10.00")
+    assert balance_service.preview_settlement().total_debts == Decimal("40.00")
+
+
 def test_preview_settlement_with_balances(
     balance_service: BalanceService,
     bill_service: BillService,
@@ -853,3 +1104,81 @@ def test_get_last_settlement_returns_most_recent(
     assert last is not None
     assert last.id == settlement2.id
     assert last.note == "Second"
+
+
+# Pairwise netting kernels
+
+
+def test_net_pairwise_python_cancels_within_tolerance() -> None:
+    """Test that mutual debts net out and one-cent residues are dropped."""
+    from splitfool.services._netting import net_pairwise_python
+
+    gross = {(1, 2): 5000, (2, 1): 3000, (3, 1): 1001, (1, 3): 1000, (4, 2): 250}
+    
+    assert net_pairwise_python(gross) == {(1, 2): 2000, (4, 2): 250}
+
+
+def test_net_pairwise_numpy_matches_python() -> None:
+    """Test that the vectorized kernel agrees with the pure Python pass."""
+    pytest.importorskip("numpy")
+    from splitfool.services._netting import net_pairwise_numpy, net_pairwise_python
+
+    gross = {
+        (debtor, creditor): (debtor * 7919 + creditor * 104729) % 10000
+        for debtor in range(1, 13)
+        for creditor in range(1, 13)
+        if debtor != creditor
+    }
+    
+    assert net_pairwise_numpy(gross) == net_pairwise_python(gross)
+    assert net_pairwise_numpy({}) == {}
+
+
+def test_cancel_cycles_preserves_net_positions() -> None:
+    """Test that cycle cancellation leaves an acyclic graph with equal nets."""
+    from splitfool.services._netting import _find_cycle, cancel_cycles
+
+    debts = {(1, 2): 500, (2, 3): 300, (3, 1): 200, (3, 4): 100, (4, 2): 700}
+
+    def positions(edges: dict[tuple[int, int], int]) -> dict[int, int]:
+        totals: dict[int, int] = {}
+        for (debtor, creditor), amount in edges.items():
+            totals[debtor] = totals.get(debtor, 0) - amount
+            totals[creditor] = totals.get(creditor, 0) + amount
+        return {user: total for user, total in totals.items() if total}
+
+    simplified = cancel_cycles(debts)
+    graph: dict[int, dict[int, int]] = {}
+    for (debtor, creditor), amount in simplified.items():
+        graph.setdefault(debtor, {})[creditor] = amount
+    
+    assert len(simplified) < len(debts)
+    assert all(amount > 0 for amount in simplified.values())
+    assert positions(simplified) == positions(debts)
+    assert _find_cycle(graph) is None
+
+
+def test_dense_kernels_match_sparse_netting() -> None:
+    """Test that the loop kernels, compiled or not, match the sparse passes."""
+    pytest.importorskip("numpy")
+    from splitfool.services import _netting
+
+    gross = {
+        (debtor, creditor): (debtor * 7919 + creditor * 104729) % 10000
+        for debtor in range(1, 13)
+        for creditor in range(1, 13)
+        if debtor != creditor and (debtor + creditor) % 3
+    }
+    user_ids, debt = _netting._to_matrix(gross)
+    net = _netting.net_pairwise_python(gross)
+    
+    kernels = [(_netting.pairwise_dense, _netting.cancel_cycles_dense)]
+    if importlib.util.find_spec("numba") is not None:
+        kernels.append(_netting._load_jit_kernels())
+    
+    for pairwise, cancel in kernels:
+        assert _netting._from_matrix(user_ids, pairwise(debt, 1)) == net
+        net_ids, net_matrix = _netting._to_matrix(net)
+        assert _netting._from_matrix(net_ids, cancel(net_matrix)) == (
+            _netting.cancel_cycles(net)
+        )
@@ -14,6 +14,7 @@ from splitfool.services.bill_service import (
     BillInput,
     BillService,
     ItemInput,
+    share_cents,
 )
 from splitfool.utils.errors import BillNotFoundError, UserNotFoundError, ValidationError
 
@@ -23,7 +24,7 @@ def db_connection() -> sqlite3.Connection:
     """Create in-memory database for testing."""
     from splitfool.db.schema import SCHEMA_SQL
     
-    conn = sqlite3.connect(":memory:")
+    conn = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     conn.executescript(SCHEMA_SQL)
@@ -236,6 +237,31 @@ def test_create_bill_validates_item_cost_positive(
     assert exc_info.value.code == "ITEM_001"
 
 
+def test_create_bill_rejects_cost_that_rounds_to_zero_cents(
+    bill_service: BillService, sample_users: list[User]
+) -> None:
+    """Test that a positive cost below half a cent is rejected before storage."""
+    alice = sample_users[0]
+    assert alice.id is not None
+
+    bill_input = BillInput(
+        payer_id=alice.id,
+        description="Sub-cent item",
+        tax=Decimal("0.00"),
+        items=[
+            ItemInput(
+                description="Crumb",
+                cost=Decimal("0.004"),
+                assignments=[AssignmentInput(user_id=alice.id, fraction=Decimal("1.0"))],
+            )
+        ],
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        bill_service.create_bill(bill_input)
+    assert exc_info.value.code == "ITEM_001"
+
+
 def test_create_bill_validates_item_description_not_empty(
     bill_service: BillService, sample_users: list[User]
 ) -> None:
@@ -262,6 +288,32 @@ def test_create_bill_validates_item_description_not_empty(
     assert exc_info.value.code == "ITEM_002"
 
 
+def test_create_bill_validates_item_description_length(
+    bill_service: BillService, sample_users: list[User]
+) -> None:
+    """Test that item descriptions over 200 characters are rejected."""
+    alice = sample_users[0]
+    assert alice.id is not None
+
+    bill_input = BillInput(
+        payer_id=alice.id,
+        description="Long item",
+        tax=Decimal("0.00"),
+        items=[
+            ItemInput(
+                description="x" * 201,
+                cost=Decimal("10.00"),
+                assignments=[AssignmentInput(user_id=alice.id, fraction=Decimal("1.0"))],
+            )
+        ],
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        bill_service.create_bill(bill_input)
+    assert exc_info.value.code == "ITEM_003"
+    assert bill_service.get_all_bills() == []
+
+
 def test_create_bill_validates_item_has_assignments(
     bill_service: BillService, sample_users: list[User]
 ) -> None:
@@ -337,6 +389,40 @@ def test_create_bill_validates_assigned_users_exist(
     assert "9999" in str(exc_info.value)
 
 
+def test_create_bill_looks_up_assigned_users_once(
+    bill_service: BillService, db_connection: sqlite3.Connection, sample_users: list[User]
+) -> None:
+    """Test that payer and assignee validation reads users once, however many items."""
+    alice, bob = sample_users
+    assert alice.id is not None
+    assert bob.id is not None
+
+    bill_input = BillInput(
+        payer_id=alice.id,
+        description="Many items",
+        tax=Decimal("0.00"),
+        items=[
+            ItemInput(
+                description=f"Item {n}",
+                cost=Decimal("10.00"),
+                assignments=[
+                    AssignmentInput(user_id=alice.id, fraction=Decimal("0.5")),
+                    AssignmentInput(user_id=bob.id, fraction=Decimal("0.5")),
+                ],
+            )
+            for n in range(5)
+        ],
+    )
+    statements: list[str] = []
+    db_connection.set_trace_callback(statements.append)
+
+    bill_service.create_bill(bill_input)
+
+    db_connection.set_trace_callback(None)
+    # One lookup covers the payer and every assignee
+    assert sum("FROM users" in sql for sql in statements) == 1
+
+
 def test_create_bill_validates_fraction_range(
     bill_service: BillService, sample_users: list[User]
 ) -> None:
@@ -478,6 +564,45 @@ def test_calculate_user_share_multiple_items(
     assert bob_share == Decimal("22.00")
 
 
+def test_calculate_all_shares_matches_per_user_shares(
+    bill_service: BillService, sample_users: list[User]
+) -> None:
+    """Test that all shares computed at once match per-user calculations."""
+    alice, bob = sample_users
+    assert alice.id is not None
+    assert bob.id is not None
+
+    bill_input = BillInput(
+        payer_id=alice.id,
+        description="Shared",
+        tax=Decimal("4.00"),
+        items=[
+            ItemInput(
+                description="Item A",
+                cost=Decimal("30.00"),
+                assignments=[
+                    AssignmentInput(user_id=alice.id, fraction=Decimal("0.5")),
+                    AssignmentInput(user_id=bob.id, fraction=Decimal("0.5")),
+                ],
+            ),
+            ItemInput(
+                description="Item B",
+                cost=Decimal("10.00"),
+                assignments=[AssignmentInput(user_id=bob.id, fraction=Decimal("1.0"))],
+            ),
+        ],
+    )
+
+    bill = bill_service.create_bill(bill_input)
+    assert bill.id is not None
+
+    shares = bill_service.calculate_all_shares(bill.id)
+
+    # Alice: $15 + (15/40 * $4) = $16.50; Bob: $25 + (25/40 * $4) = $27.50
+    assert shares == {alice.id: Decimal("16.50"), bob.id: Decimal("27.50")}
+    assert shares[bob.id] == bill_service.calculate_user_share(bill.id, bob.id)
+
+
 def test_calculate_user_share_no_assignment(
     bill_service: BillService, sample_users: list[User]
 ) -> None:
@@ -520,6 +645,16 @@ def test_calculate_user_share_bill_not_found(
     assert exc_info.value.code == "BILL_001"
 
 
+def test_share_cents_prorates_tax_and_rounds_once() -> None:
+    """Test integer share calculation with proportional tax."""
+    # $30 item, user has 1/3 (333333 ppm), $6 tax -> $10 + $2 = $12 (rounded)
+    assert share_cents(3000 * 333_333, 3000, 600) == 1200
+    # $7.50 of $45 with $12 tax -> $7.50 + $2.00
+    assert share_cents(750 * 1_000_000, 4500, 1200) == 950
+    # No items means no share
+    assert share_cents(0, 0, 500) == 0
+
+
 # T073: Test BillService.calculate_total_cost()
 
 
@@ -617,6 +752,36 @@ def test_calculate_total_cost_bill_not_found(bill_service: BillService) -> None:
     assert exc_info.value.code == "BILL_001"
 
 
+def test_calculate_total_costs_for_several_bills(
+    bill_service: BillService, sample_users: list[User]
+) -> None:
+    """Test calculating several bills' totals at once, skipping unknown IDs."""
+    alice = sample_users[0]
+    assert alice.id is not None
+
+    bill_ids = []
+    for cost, tax in ((Decimal("30.00"), Decimal("8.00")), (Decimal("25.00"), Decimal("0.00"))):
+        bill = bill_service.create_bill(
+            BillInput(
+                payer_id=alice.id,
+                description="Bill",
+                tax=tax,
+                items=[
+                    ItemInput(
+                        description="Item",
+                        cost=cost,
+                        assignments=[AssignmentInput(user_id=alice.id, fraction=Decimal("1.0"))],
+                    )
+                ],
+            )
+        )
+        assert bill.id is not None
+        bill_ids.append(bill.id)
+
+    totals = bill_service.calculate_total_costs([*bill_ids, 9999])
+    assert totals == {bill_ids[0]: Decimal("38.00"), bill_ids[1]: Decimal("25.00")}
+
+
 # T073: Test BillService.preview_bill()
 
 
@@ -655,6 +820,31 @@ def test_preview_bill_without_saving(
     assert preview.user_shares["Bob"] == Decimal("15.00")
 
 
+def test_preview_bill_validates_payer_exists(
+    bill_service: BillService, sample_users: list[User]
+) -> None:
+    """Test that previewing a bill with an unknown payer raises UserNotFoundError."""
+    alice = sample_users[0]
+    assert alice.id is not None
+
+    bill_input = BillInput(
+        payer_id=9999,
+        description="Unknown payer",
+        tax=Decimal("0.00"),
+        items=[
+            ItemInput(
+                description="Pizza",
+                cost=Decimal("20.00"),
+                assignments=[AssignmentInput(user_id=alice.id, fraction=Decimal("1.0"))],
+            )
+        ],
+    )
+
+    with pytest.raises(UserNotFoundError) as exc_info:
+        bill_service.preview_bill(bill_input)
+    assert exc_info.value.code == "USER_004"
+
+
 def test_preview_bill_with_multiple_items(
     bill_service: BillService, sample_users: list[User]
 ) -> None:
@@ -725,6 +915,10 @@ def test_get_bill_detail(bill_service: BillService, sample_users: list[User]) ->
     assert len(detail.items) == 1
     assert detail.calculated_shares[alice.id] == Decimal("12.50")
     assert detail.calculated_shares[bob.id] == Decimal("12.50")
+    assert detail.share_rows == [("Alice", Decimal("12.50")), ("Bob", Decimal("12.50"))]
+    assert detail.item_rows == [
+        ("Pizza", Decimal("20.00"), [("Alice", Decimal("0.5")), ("Bob", Decimal("0.5"))])
+    ]
 
 
 def test_get_bill_not_found(bill_service: BillService) -> None:
@@ -1,10 +1,20 @@
 """Unit tests for currency utilities."""
 
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 import pytest
 
-from splitfool.utils.currency import format_currency, parse_currency, validate_positive_decimal
+from splitfool.utils.currency import (
+    FRACTION_TOLERANCE,
+    FRACTION_TOLERANCE_PPM,
+    format_currency,
+    from_cents,
+    parse_currency,
+    to_cents,
+    to_ppm,
+    validate_positive_decimal,
+)
 
 
 def test_format_currency_rounds_to_cents() -> None:
@@ -70,3 +80,32 @@ def test_validate_positive_decimal_custom_field_name() -> None:
     """Test that validate_positive_decimal uses custom field name in error."""
     with pytest.raises(ValueError, match="cost must be positive"):
         validate_positive_decimal(Decimal("0"), field_name="cost")
+
+
+def test_cents_roundtrip_keeps_cent_exponent() -> None:
+    """Test that stored cents convert back exactly with two decimal places."""
+    assert from_cents(1235) == Decimal("12.35")
+    assert str(from_cents(1200)) == "12.00"
+    assert from_cents(-5) == Decimal("-0.05")
+    assert to_cents(from_cents(123456789)) == 123456789
+
+
+def test_rounding_is_half_up_on_any_thread() -> None:
+    """Test that half-cent amounts round up regardless of the thread's decimal context."""
+
+    def convert() -> tuple[int, int, str]:
+        return (
+            to_cents(Decimal("2.125")),
+            to_ppm(Decimal("0.0000005")),
+            format_currency(Decimal("0.125")),
+        )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        on_worker = executor.submit(convert).result()
+
+    assert convert() == on_worker == (213, 1, "$0.13")
+
+
+def test_fraction_tolerance_forms_agree() -> None:
+    """Test that the Decimal and ppm fraction tolerances are the same amount."""
+    assert to_ppm(FRACTION_TOLERANCE) == FRACTION_TOLERANCE_PPM
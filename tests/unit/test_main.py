@@ -0,0 +1,75 @@
+"""Unit tests for the command-line entry point."""
+
+import subprocess
+import sys
+
+
+def test_check_db_does_not_import_textual(tmp_path):  # type: ignore
+    """Test that --check-db exits without loading the Textual UI stack."""
+    db_path = tmp_path / "test.db"
+    script = (
+        "import sys\n"
+        "from splitfool.__main__ import main\n"
+        f"sys.argv = ['splitfool', '--check-db', '--db-path', {str(db_path)!r}]\n"
+        "code = main()\n"
+        "assert 'textual' not in sys.modules, 'textual was imported'\n"
+        "sys.exit(code)\n"
+    )
+    
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=False
+    )
+    
+    assert "textual was imported" not in result.stderr
+    assert result.returncode in (0, 1)
+
+
+def test_check_db_reports_corrupted_file(tmp_path, monkeypatch, capsys):  # type: ignore
+    """Test that --check-db reports a file that is not a database."""
+    from splitfool.__main__ import main
+
+    db_path = tmp_path / "test.db"
+    db_path.write_bytes(b"not a database" * 100)
+    monkeypatch.setattr(sys, "argv", ["splitfool", "--check-db", "--db-path", str(db_path)])
+    
+    assert main() == 1
+    assert "Database has errors" in capsys.readouterr().out
+
+
+def test_recover_db_recreates_corrupted_file(tmp_path, monkeypatch, capsys):  # type: ignore
+    """Test that --recover-db replaces a corrupted file with a fresh database."""
+    from splitfool.__main__ import main
+
+    db_path = tmp_path / "test.db"
+    db_path.write_bytes(b"not a database" * 100)
+    monkeypatch.setattr(sys, "argv", ["splitfool", "--recover-db", "--db-path", str(db_path)])
+    
+    assert main() == 0
+    assert "recreated successfully" in capsys.readouterr().out
+    
+    monkeypatch.setattr(sys, "argv", ["splitfool", "--check-db", "--db-path", str(db_path)])
+    assert main() == 0
+
+
+def test_check_db_leaves_database_untouched(tmp_path, monkeypatch, capsys):  # type: ignore
+    """Test that --check-db neither rewrites journal settings nor creates files."""
+    import sqlite3
+
+    from splitfool.__main__ import main
+
+    db_path = tmp_path / "test.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.close()
+    monkeypatch.setattr(sys, "argv", ["splitfool", "--check-db", "--db-path", str(db_path)])
+    
+    assert main() == 0
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    conn.close()
+    
+    missing = tmp_path / "missing.db"
+    monkeypatch.setattr(sys, "argv", ["splitfool", "--check-db", "--db-path", str(missing)])
+    assert main() == 1
+    assert not missing.exists()
+    assert "Database has errors" in capsys.readouterr().out
@@ -159,3 +159,38 @@ def test_model_replace_method() -> None:
     assert user.name == "Alice"
     assert updated_user.id == 1  # New instance updated
     assert updated_user.name == "Alice Updated"
+
+
+def test_model_with_id_method() -> None:
+    """Test that with_id copies every field and the models have no __dict__."""
+    now = datetime.now()
+    bill = Bill(id=None, payer_id=1, description="Dinner", tax=Decimal("2.00"), created_at=now)
+    assignment = Assignment(id=None, item_id=3, user_id=4, fraction=Decimal("0.5"))
+    
+    assert bill.with_id(7) == Bill(
+        id=7, payer_id=1, description="Dinner", tax=Decimal("2.00"), created_at=now
+    )
+    assert assignment.with_id(9) == assignment.replace(id=9)
+    assert bill.id is None  # Original unchanged
+    assert not hasattr(assignment, "__dict__")
+
+
+def test_model_from_db_skips_validation() -> None:
+    """Test that _from_db builds equal, still-frozen models without validating."""
+    now = datetime.now()
+    user = User._from_db(1, "Alice", now)
+    
+    assert user == User(id=1, name="Alice", created_at=now)
+    assert Item._from_db(2, 1, "Refund", Decimal("0")).cost == Decimal("0")
+    with pytest.raises(AttributeError):
+        user.name = "Bob"  # type: ignore
+
+
+def test_balance_from_trusted_matches_constructor() -> None:
+    """Test that _from_trusted builds the same Balance as the validated path."""
+    balance = Balance._from_trusted(1, 2, Decimal("12.50"), "Alice", "Bob")
+    
+    assert balance == Balance(debtor_id=1, creditor_id=2, amount=Decimal("12.50"))
+    assert (balance.debtor_name, balance.creditor_name) == ("Alice", "Bob")
+    with pytest.raises(AttributeError):
+        balance.amount = Decimal("1")  # type: ignore
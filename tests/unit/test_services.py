@@ -4,7 +4,10 @@ from datetime import datetime
 
 import pytest
 
+from splitfool.db.repositories import Repositories
 from splitfool.models.user import User
+from splitfool.services.balance_service import BalanceService
+from splitfool.services.bill_service import BillService
 from splitfool.services.user_service import UserService
 from splitfool.utils.errors import (
     DuplicateUserError,
@@ -162,3 +165,17 @@ def test_user_service_delete_with_balances_check(in_memory_db):  # type: ignore
     
     with pytest.raises(UserNotFoundError):
         service.get_user(user.id)  # type: ignore
+
+
+def test_services_share_repositories(in_memory_db):  # type: ignore
+    """Test that services built from one Repositories reuse its instances."""
+    repositories = Repositories.for_connection(in_memory_db)
+    
+    user_service = UserService(in_memory_db, repositories)
+    bill_service = BillService(in_memory_db, repositories)
+    balance_service = BalanceService(in_memory_db, repositories)
+    
+    assert user_service.user_repo is repositories.users
+    assert bill_service.user_repo is repositories.users
+    assert bill_service.assignment_repo is balance_service.assignment_repo
+    assert balance_service.settlement_repo is repositories.settlements
@@ -115,3 +115,15 @@ def test_validate_positive_decimal_rejects_negative() -> None:
     """Test that validate_positive_decimal rejects negative values."""
     with pytest.raises(ValidationError, match="must be positive"):
         validate_positive_decimal(Decimal("-1.00"))
+
+
+def test_validate_bill_fractions_rejects_overassigned_item_early() -> None:
+    """Test that validate_bill_fractions stops once an item passes 1.0."""
+    assignments = [
+        Assignment(id=None, item_id=1, user_id=1, fraction=Decimal("0.6")),
+        Assignment(id=None, item_id=1, user_id=2, fraction=Decimal("0.6")),
+        # Item 2 would fail too, but item 1 is rejected first
+        Assignment(id=None, item_id=2, user_id=1, fraction=Decimal("0.5")),
+    ]
+    with pytest.raises(ValidationError, match="Item 1 fractions sum to at least 1.2"):
+        validate_bill_fractions(assignments)